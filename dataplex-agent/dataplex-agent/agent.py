@@ -12,28 +12,66 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
 import os
-from zoneinfo import ZoneInfo
-from google.cloud import dataproc_v1 as dataproc
-import google.auth
+
+# Pin protobuf's upb (C) backend before anything imports google.protobuf, so
+# the tools never run on the much slower pure-Python one. upb is the default
+# of protobuf>=4.21; an explicit PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION wins.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 from google.adk.agents import Agent
-from .utils.catalog_service_tools import *
-from .utils.dataplex_service_tools import *
-from .utils.llm_config import *
+from .utils.catalog_service_tools import (
+    search_dataplex_catalog,
+    search_dataplex_catalog_async,
+)
+from .utils.dataplex_service_tools import (
+    create_dataplex_lake,
+    get_dataplex_lake,
+    list_dataplex_lakes,
+    update_dataplex_lake,
+    delete_dataplex_lake,
+    create_dataplex_zone,
+    get_dataplex_zone,
+    list_dataplex_zones,
+    update_dataplex_zone,
+    delete_dataplex_zone,
+    create_dataplex_asset,
+    get_dataplex_asset,
+    list_dataplex_assets,
+    update_dataplex_asset,
+    delete_dataplex_asset,
+    create_dataplex_task,
+    get_dataplex_task,
+    get_many_dataplex_tasks_async,
+    list_dataplex_tasks,
+    update_dataplex_task,
+    delete_dataplex_task,
+    run_dataplex_task,
+    get_dataplex_job,
+    list_dataplex_jobs,
+    cancel_dataplex_job,
+)
+from .utils.credentials import default_credentials
+from .utils.llm_config import root_model, root_prompt
+
 
+def _project() -> str:
+    """Resolves the ADC project only when it is actually needed."""
+    _, project_id = default_credentials()
+    return project_id
 
-_, project_id = google.auth.default()
-os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
+
+# Skip the ADC lookup (metadata server / disk I/O) when the project is already
+# provided by the environment, as it usually is on Cloud Run and GKE.
+if not os.environ.get("GOOGLE_CLOUD_PROJECT"):
+    os.environ["GOOGLE_CLOUD_PROJECT"] = _project()
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "us-central1")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
 
-root_agent = Agent(
-    name="root_agent",
-    model=root_model,
-    instruction=root_prompt,
-    tools=[
+_TOOLS = (
+    search_dataplex_catalog,
+    search_dataplex_catalog_async,
     create_dataplex_lake,
     get_dataplex_lake,
     list_dataplex_lakes,
@@ -51,13 +89,20 @@ root_agent = Agent(
     delete_dataplex_asset,
     create_dataplex_task,
     get_dataplex_task,
+    get_many_dataplex_tasks_async,
     list_dataplex_tasks,
     update_dataplex_task,
     delete_dataplex_task,
     run_dataplex_task,
     get_dataplex_job,
     list_dataplex_jobs,
-    cancel_dataplex_job
-]
+    cancel_dataplex_job,
+)
+
 
+root_agent = Agent(
+    name="root_agent",
+    model=root_model,
+    instruction=root_prompt,
+    tools=_TOOLS,
 )
@@ -1,9 +1,143 @@
+import asyncio
+import functools
+import threading
+import weakref
+from collections.abc import Iterator
+from itertools import islice
+from typing import Optional
+from cachetools import TTLCache
 from google.cloud import dataplex_v1
 # We still might need types for processing the *response* enums
 from google.cloud.dataplex_v1 import types
+from google.api_core import retry, retry_async
 from google.api_core.exceptions import GoogleAPIError
+from .credentials import default_credentials
 
-def search_dataplex_catalog(project_id: str, location_id: str, query: str) -> list[dict]:
+# Transient search failures (429, 5xx, UNAVAILABLE) are retried with jittered
+# exponential backoff inside a 10s budget instead of surfacing as an empty result.
+_SEARCH_RETRY = retry.Retry(
+    predicate=retry.if_transient_error, initial=0.1, maximum=2.0, multiplier=2.0, timeout=10.0)
+_SEARCH_RETRY_ASYNC = retry_async.AsyncRetry(
+    predicate=retry.if_transient_error, initial=0.1, maximum=2.0, multiplier=2.0, timeout=10.0)
+
+# Agents often repeat the same search within seconds; successful results are
+# kept briefly, keyed on (project_id, location_id, query, max_results). The
+# cache holds its own copies of the entries, so callers may modify what they
+# get back; cachetools caches are not thread-safe, hence the lock.
+_SEARCH_CACHE = TTLCache(maxsize=1024, ttl=60)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+def _copy_entries(entries) -> list[dict]:
+    return [dict(e) for e in entries]
+
+# Caps concurrent async searches so a burst of agent calls cannot pile up
+# unbounded in-flight RPCs. asyncio primitives bind to the event loop that
+# first waits on them, so there is one semaphore per loop.
+_ASYNC_SEARCH_LIMITS = weakref.WeakKeyDictionary()
+
+def _async_search_limit() -> asyncio.Semaphore:
+    """Returns the search concurrency limit for the running event loop."""
+    loop = asyncio.get_running_loop()
+    limit = _ASYNC_SEARCH_LIMITS.get(loop)
+    if limit is None:
+        limit = _ASYNC_SEARCH_LIMITS[loop] = asyncio.Semaphore(8)
+    return limit
+
+@functools.cache
+def _metadata_client() -> dataplex_v1.MetadataServiceClient:
+    """Returns a process-wide Metadata Service client so searches share one channel."""
+    return dataplex_v1.MetadataServiceClient(credentials=default_credentials()[0])
+
+# grpc.aio channels are bound to the event loop that created them, so async
+# clients are kept per loop and dropped with it.
+_ASYNC_METADATA_CLIENTS = weakref.WeakKeyDictionary()
+
+def _async_metadata_client() -> dataplex_v1.MetadataServiceAsyncClient:
+    """Returns the Metadata Service async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_METADATA_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_METADATA_CLIENTS[loop] = dataplex_v1.MetadataServiceAsyncClient(
+            credentials=default_credentials()[0])
+    return client
+
+@functools.cache
+def _enum_names(enum_cls) -> dict:
+    """Maps enum values to their names once, so result rows avoid enum construction."""
+    return {e.value: e.name for e in enum_cls}
+
+@functools.cache
+def _row_builder():
+    """
+    Returns the function turning a search result into its entry dict, shared by
+    the sync and async searches. The enum lookups are bound once so each row
+    costs one C-level dict lookup per enum.
+    """
+    system_name = _enum_names(types.SearchResourcesResult.SearchResultSystem).__getitem__
+    type_name = _enum_names(types.EntryType).__getitem__
+
+    def to_row(result) -> dict:
+        return {
+            "dataplex_entry_name": result.name,
+            "display_name": result.display_name,
+            "description": result.description,
+            "linked_resource": result.linked_resource,
+            "system": system_name(result.system),
+            "type": type_name(result.type_),
+            "relative_resource_name": result.relative_resource_name
+        }
+    return to_row
+
+def _search_failed(e: Exception) -> list[dict]:
+    """Reports a failed search the same way for both paths and yields no entries."""
+    if isinstance(e, GoogleAPIError):
+        print(f"An API error occurred: {e}")
+    else:
+        print(f"An unexpected error occurred: {e}")
+    return []
+
+def iter_dataplex_catalog(project_id: str, location_id: str, query: str,
+                          page_size: int = 1000) -> Iterator[dict]:
+    """
+    Lazily yields Dataplex search result entries as the pager fetches them,
+    so callers that only need the first few matches stop paging early.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        location_id: The Dataplex location (e.g., 'us-central1').
+        query: The search query string (e.g., table name, bucket name,
+               fileset name, or keywords). Performs a keyword-like search.
+        page_size: Number of results requested per page RPC.
+
+    Yields:
+        A dictionary per found Dataplex search result entry.
+
+    Raises:
+        GoogleAPIError: If an error occurs during the API call.
+        ValueError: If input arguments are invalid.
+    """
+    if not all([project_id, location_id, query]):
+        raise ValueError("project_id, location_id, and query must be provided.")
+
+    scope = f"projects/{project_id}/locations/{location_id}"
+
+    client = _metadata_client()
+
+    # Perform the search by passing arguments directly to the method
+    pager = client.search_resources(
+        name=scope,
+        query=query,
+        page_size=page_size,
+        retry=_SEARCH_RETRY,
+    )
+
+    # Iterate through the results
+    yield from map(_row_builder(), pager)
+
+# Tool parameters are annotated Optional[...]: google-adk 0.1 cannot build a
+# function declaration from a PEP 604 "X | None" parameter.
+def search_dataplex_catalog(project_id: str, location_id: str, query: str,
+                            max_results: Optional[int] = None) -> list[dict]:  # noqa: UP045
     """
     Searches for Dataplex entries within a specific project and location
     by passing arguments directly to the client method.
@@ -13,6 +147,58 @@ def search_dataplex_catalog(project_id: str, location_id: str, query: str) -> li
         location_id: The Dataplex location (e.g., 'us-central1').
         query: The search query string (e.g., table name, bucket name,
                fileset name, or keywords). Performs a keyword-like search.
+        max_results: Optional cap on the number of entries returned. Paging
+               stops as soon as this many entries have been collected.
+
+    Returns:
+        A list of dictionaries, where each dictionary represents a found
+        Dataplex search result entry. Returns an empty list if no entries
+        are found or an error occurs.
+
+    Raises:
+        ValueError: If input arguments are invalid.
+    """
+    if not all([project_id, location_id, query]):
+        raise ValueError("project_id, location_id, and query must be provided.")
+
+    key = (project_id, location_id, query, max_results)
+    with _SEARCH_CACHE_LOCK:
+        hit = _SEARCH_CACHE.get(key)
+    if hit is not None:
+        return _copy_entries(hit)
+
+    print(f"Searching Dataplex in 'projects/{project_id}/locations/{location_id}' for query: '{query}'...")
+
+    try:
+        entries = iter_dataplex_catalog(project_id, location_id, query)
+        found_entries = list(islice(entries, max_results or None))
+
+        print(f"Found {len(found_entries)} entries.")
+        # Only successful searches are cached, so transient failures are not pinned
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[key] = tuple(_copy_entries(found_entries))
+        return found_entries
+
+    except Exception as e:
+        return _search_failed(e)
+
+
+async def search_dataplex_catalog_async(project_id: str, location_id: str, query: str,
+                                        max_results: Optional[int] = None) -> list[dict]:  # noqa: UP045
+    """
+    Asynchronously searches for Dataplex entries within a specific project
+    and location.
+
+    Several searches can run concurrently, overlapping their round trips, e.g.
+    `await asyncio.gather(*(search_dataplex_catalog_async(p, l, q) for q in queries))`.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        location_id: The Dataplex location (e.g., 'us-central1').
+        query: The search query string (e.g., table name, bucket name,
+               fileset name, or keywords). Performs a keyword-like search.
+        max_results: Optional cap on the number of entries returned. Paging
+               stops as soon as this many entries have been collected.
 
     Returns:
         A list of dictionaries, where each dictionary represents a found
@@ -20,7 +206,6 @@ def search_dataplex_catalog(project_id: str, location_id: str, query: str) -> li
         are found or an error occurs.
 
     Raises:
-        GoogleAPIError: If an error occurs during the API call.
         ValueError: If input arguments are invalid.
     """
     if not all([project_id, location_id, query]):
@@ -28,45 +213,31 @@ def search_dataplex_catalog(project_id: str, location_id: str, query: str) -> li
 
     scope = f"projects/{project_id}/locations/{location_id}"
 
-    # Create a Dataplex Metadata Service client
-    client = dataplex_v1.MetadataServiceClient()
+    client = _async_metadata_client()
 
     found_entries = []
 
-    print(f"Searching Dataplex in '{scope}' for query: '{query}'...")
+    print(f"Searching Dataplex async in '{scope}' for query: '{query}'...")
 
     try:
-        # Perform the search by passing arguments directly to the method
-        pager = client.search_resources(
-            name=scope,
-            query=query
-            # page_size=100 # Optional
-        )
-
-        # Iterate through the results
-        for result in pager:
-            # Process response enums using the types module
-            system_str = types.SearchResourcesResult.SearchResultSystem(result.system).name
-            type_str = types.EntryType(result.type_).name
-
-            entry_details = {
-                "dataplex_entry_name": result.name,
-                "display_name": result.display_name,
-                "description": result.description,
-                "linked_resource": result.linked_resource,
-                "system": system_str,
-                "type": type_str,
-                "relative_resource_name": result.relative_resource_name
-            }
-            found_entries.append(entry_details)
+        async with _async_search_limit():
+            pager = await client.search_resources(
+                name=scope,
+                query=query,
+                page_size=1000,  # Service maximum; keeps the number of page RPCs low
+                retry=_SEARCH_RETRY_ASYNC,
+            )
+
+            to_row = _row_builder()
+            _append = found_entries.append
+
+            async for result in pager:
+                _append(to_row(result))
+                if max_results and len(found_entries) >= max_results:
+                    break
 
         print(f"Found {len(found_entries)} entries.")
         return found_entries
 
-    except GoogleAPIError as e:
-        print(f"An API error occurred: {e}")
-        return []
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        return []
-
+        return _search_failed(e)
@@ -1,78 +1,263 @@
+import asyncio
+import functools
+import logging
+import operator
+import re
+import threading
 import uuid
+from datetime import datetime as _dt
+from zoneinfo import ZoneInfo
 from google.cloud import dataproc_v1 as dataproc
+from google.cloud.dataproc_v1.services.cluster_controller.transports import ClusterControllerGrpcTransport
+from google.cloud.dataproc_v1.services.job_controller.transports import JobControllerGrpcTransport
 from google.api_core.exceptions import NotFound, GoogleAPICallError
 from google.protobuf.duration_pb2 import Duration
-from typing import Optional, List, Dict
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.internal import api_implementation
+from typing import NamedTuple
+import grpc
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import LRUCache, TTLCache, cached
+from .credentials import default_credentials
+
+# Shared HTTPS session for the Lichess API so repeated lookups reuse the
+# keep-alive connection instead of paying a TCP+TLS handshake per call.
+# Only one host is ever contacted, so a single pool is enough; up to 50
+# connections are kept so concurrent lookups are not forced to reconnect.
+_LICHESS = requests.Session()
+_LICHESS.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=50))
+_LICHESS.headers["Accept-Encoding"] = "gzip"
+
+# Timezones known to get_current_time, keyed by the (lowercase) place name that
+# selects them. Adding a city only takes a new entry here.
+_TZ_NAMES = {
+    "sf": "America/Los_Angeles",
+    "san francisco": "America/Los_Angeles",
+    "nyc": "America/New_York",
+    "new york": "America/New_York",
+    "london": "Europe/London",
+}
+_QUERY_TZ = {place: ZoneInfo(name) for place, name in _TZ_NAMES.items()}
+_TZ_RE = re.compile(r"\b(" + "|".join(map(re.escape, _TZ_NAMES)) + r")\b", re.IGNORECASE)
+_now = _dt.now  # Bound once instead of resolving datetime.datetime.now per call
+
+logger = logging.getLogger(__name__)
+
+# The response parsers read proto fields directly. That is only cheap with the
+# upb backend (agent.py selects it); the pure-Python backend resolves every
+# field read through Python-level descriptors.
+if api_implementation.Type() == "python":
+    logger.warning("protobuf is using its pure-Python implementation; Dataproc "
+                   "responses will be parsed slowly. Install protobuf>=4.21 to get upb.")
+
+@functools.lru_cache(maxsize=32)
+def _dataproc_endpoint(region: str) -> dict:
+    """client_options for the regional Dataproc endpoint. Shared between callers, so read-only."""
+    return {"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
+
+# Keepalive pings on active calls detect a dead connection promptly instead
+# of leaving a call hanging on a half-open socket, and gzip shrinks large
+# list/submit payloads. The message size limits repeat the generated
+# transport's defaults, which passing our own channel would otherwise drop.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.default_compression_algorithm", int(grpc.Compression.Gzip)),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+# (cluster_client, job_client) per region. A plain dict rather than lru_cache
+# so close_clients can reach the cached clients.
+_CLIENTS: dict = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def _transport(transport_cls, host: str, credentials=None):
+    """A gRPC transport for host on a channel built with _CHANNEL_OPTIONS."""
+    channel = transport_cls.create_channel(host, credentials=credentials, options=_CHANNEL_OPTIONS)
+    return transport_cls(host=host, channel=channel)
+
+def _get_clients(region: str):
+    """Builds the Dataproc clients for a region once and reuses their channels."""
+    clients = _CLIENTS.get(region)
+    if clients is None:
+        with _CLIENTS_LOCK:
+            clients = _CLIENTS.get(region)
+            if clients is None:
+                credentials, _ = default_credentials()
+                host = _dataproc_endpoint(region)["api_endpoint"]
+                cluster_client = dataproc.ClusterControllerClient(
+                    transport=_transport(ClusterControllerGrpcTransport, host, credentials))
+                job_client = dataproc.JobControllerClient(
+                    transport=_transport(JobControllerGrpcTransport, host, credentials))
+                # You could add other clients like AutoscalingPolicyServiceClient if needed
+                # policy_client = dataproc.AutoscalingPolicyServiceClient()
+                clients = _CLIENTS[region] = (cluster_client, job_client)
+    return clients
+
+def close_clients() -> None:
+    """Closes the channels of all cached Dataproc clients, e.g. at agent shutdown."""
+    while _CLIENTS:
+        _, clients = _CLIENTS.popitem()
+        for client in clients:
+            client.transport.close()
 
 def initialize_clients(region: str):
     try:
-        cluster_client = dataproc.ClusterControllerClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"})
-        job_client = dataproc.JobControllerClient()
-        # You could add other clients like AutoscalingPolicyServiceClient if needed
-        # policy_client = dataproc.AutoscalingPolicyServiceClient()
+        cluster_client, job_client = _get_clients(region)
     except Exception as e:
-        print(f"Error initializing Google Cloud Dataproc clients: {e}")
+        logger.error("Error initializing Google Cloud Dataproc clients: %s", e)
         # Handle initialization failure appropriately, maybe raise or exit
+        # Failures are not cached, so the next call retries construction.
         cluster_client = None
         job_client = None
     return cluster_client, job_client
 
 
 
-def _parse_cluster_response(cluster) -> Dict:
+class ClusterSummary(NamedTuple):
+    """Key info of a Cluster. Use ._asdict() where a JSON-ready dict is needed."""
+    name: str
+    status: str
+    uuid: str
+    project_id: str
+    zone: str | None
+    image_version: str
+    master_nodes: int
+    master_machine_type: str | None
+    worker_nodes: int
+    worker_machine_type: str | None
+    creation_timestamp: str | None
+    endpoint_uri: str | None
+
+class JobSummary(NamedTuple):
+    """Key info of a Job. Use ._asdict() where a JSON-ready dict is needed."""
+    job_id: str
+    type: str | None
+    status: str
+    status_details: str
+    cluster_name: str
+    submitted_by: str
+    driver_output_uri: str
+    start_time: str | None
+    end_time: str | None
+    # Type-specific details, only set for the job types that carry them
+    main_file: str | None = None
+    main_class_or_jar: str | None = None
+    args: tuple[str, ...] | None = None
+    query_file_uri: str | None = None
+    query_list: tuple[str, ...] | None = None
+
+def _tail(uri: str) -> str | None:
+    """Returns the last path segment of a resource URI (e.g. the zone of a zone_uri)."""
+    return uri.rpartition('/')[2] if uri else None
+
+def _first_state_time(pb) -> str | None:
+    """Start time of the earliest recorded state, i.e. when the resource was created.
+
+    Neither ClusterStatus nor JobStatus has a creation/start timestamp field;
+    the oldest status_history entry (or the current status, if there is no
+    history yet) carries it. Returned as an RFC 3339 string.
+    """
+    first = pb.status_history[0] if pb.status_history else pb.status
+    return first.state_start_time.ToJsonString() if first.HasField('state_start_time') else None
+
+# Enum value -> name, so states are rendered without a proto-plus enum lookup
+_CLUSTER_STATE_NAMES = {e.value: e.name for e in dataproc.ClusterStatus.State}
+_JOB_STATE_NAMES = {e.value: e.name for e in dataproc.JobStatus.State}
+
+# The summary fields, read in one C-level call per message instead of a chain
+# of Python attribute lookups per field.
+_CLUSTER_FIELDS = operator.attrgetter(
+    'cluster_name', 'cluster_uuid', 'project_id',
+    'config.gce_cluster_config.zone_uri',
+    'config.software_config.image_version',
+    'config.master_config.num_instances', 'config.master_config.machine_type_uri',
+    'config.worker_config.num_instances', 'config.worker_config.machine_type_uri',
+    'config.endpoint_config.http_ports',
+    'status.state',
+)
+_JOB_FIELDS = operator.attrgetter(
+    'reference.job_id', 'placement.cluster_name', 'driver_output_resource_uri',
+    'status', 'done',
+)
+
+def _parse_cluster_response(cluster) -> ClusterSummary | None:
     """Helper to extract key info from a Cluster object."""
     if not cluster:
-        return {}
-    return {
-        'name': cluster.cluster_name,
-        'status': cluster.status.state.name, # Get enum name string
-        'uuid': cluster.cluster_uuid,
-        'project_id': cluster.project_id,
+        return None
+    pb = getattr(cluster, '_pb', cluster)
+    (name, uuid_, project_id, zone_uri, image_version, master_nodes, master_type,
+     worker_nodes, worker_type, http_ports, state) = _CLUSTER_FIELDS(pb)
+    return ClusterSummary(
+        name=name,
+        status=_CLUSTER_STATE_NAMES.get(state, 'UNKNOWN'),
+        uuid=uuid_,
+        project_id=project_id,
         # Region is usually inferred from the client request, not always in response
-        'zone': cluster.config.gce_cluster_config.zone_uri.split('/')[-1] if cluster.config.gce_cluster_config.zone_uri else None,
-        'image_version': cluster.config.software_config.image_version,
-        'master_nodes': cluster.config.master_config.num_instances,
-        'master_machine_type': cluster.config.master_config.machine_type_uri.split('/')[-1] if cluster.config.master_config.machine_type_uri else None,
-        'worker_nodes': cluster.config.worker_config.num_instances,
-        'worker_machine_type': cluster.config.worker_config.machine_type_uri.split('/')[-1] if cluster.config.worker_config.machine_type_uri else None,
-        'creation_timestamp': cluster.status.creation_time.rfc3339() if hasattr(cluster.status, 'creation_time') else None,
-        'endpoint_uri': cluster.config.endpoint_config.http_ports['Web UI'] if cluster.config.endpoint_config and 'Web UI' in cluster.config.endpoint_config.http_ports else None,
-    }
-
-def _parse_job_response(job) -> Dict:
+        zone=_tail(zone_uri),
+        image_version=image_version,
+        master_nodes=master_nodes,
+        master_machine_type=_tail(master_type),
+        worker_nodes=worker_nodes,
+        worker_machine_type=_tail(worker_type),
+        creation_timestamp=_first_state_time(pb),
+        endpoint_uri=http_ports.get('Web UI'),
+    )
+
+# Type-specific details. Each extractor receives the raw sub-message set in the
+# Job 'type_job' oneof and pulls out only the fields it reports. Repeated fields
+# are returned as tuples: callers only read them.
+def _extract_pyspark(t) -> dict:
+    return {'main_file': t.main_python_file_uri, 'args': tuple(t.args)}
+
+def _extract_spark(t) -> dict:
+    return {'main_class_or_jar': t.main_class or t.main_jar_file_uri, 'args': tuple(t.args)}
+
+def _extract_queries(t) -> dict:
+    """Hive, Pig and Spark SQL jobs run either a query file or an inline query list."""
+    return {'query_file_uri': t.query_file_uri, 'query_list': tuple(t.query_list.queries)}
+
+# Keyed by the 'type_job' oneof field name
+_JOB_TYPE_EXTRACTORS = {
+    'pyspark_job': _extract_pyspark,
+    'spark_job': _extract_spark,
+    'hive_job': _extract_queries,
+    'pig_job': _extract_queries,
+    'spark_sql_job': _extract_queries,
+    # Add other job types as needed (Presto, Trino, etc.)
+}
+
+def _parse_job_response(job) -> JobSummary | None:
     """Helper to extract key info from a Job object."""
     if not job:
-        return {}
-
-    job_info = {
-        'job_id': job.reference.job_id,
-        'type': job.type_case.name, # e.g., 'pyspark_job', 'hive_job'
-        'status': job.status.state.name,
-        'status_details': job.status.details,
-        'cluster_name': job.placement.cluster_name,
-        'submitted_by': job.submitted_by,
-        'driver_output_uri': job.driver_output_resource_uri,
-        'start_time': job.status.start_time.rfc3339() if hasattr(job.status, 'start_time') else None,
-        'end_time': job.status.end_time.rfc3339() if hasattr(job.status, 'end_time') else None,
-    }
+        return None
+
+    pb = getattr(job, '_pb', job)
+    job_id, cluster_name, driver_output_uri, status, done = _JOB_FIELDS(pb)
+    job_type = pb.WhichOneof('type_job') # e.g., 'pyspark_job', 'hive_job'
     # Add type-specific details
-    if job.type_case.name == 'pyspark_job':
-        job_info['main_file'] = job.pyspark_job.main_python_file_uri
-        job_info['args'] = list(job.pyspark_job.args)
-    elif job.type_case.name == 'spark_job':
-        job_info['main_class_or_jar'] = job.spark_job.main_class or job.spark_job.main_jar_file_uri
-        job_info['args'] = list(job.spark_job.args)
-    elif job.type_case.name == 'hive_job':
-        job_info['query_file_uri'] = job.hive_job.query_file_uri
-        job_info['query_list'] = list(job.hive_job.query_list.queries)
-    elif job.type_case.name == 'pig_job':
-        job_info['query_file_uri'] = job.pig_job.query_file_uri
-        job_info['query_list'] = list(job.pig_job.query_list.queries)
-    # Add other job types as needed (Spark SQL, Presto, etc.)
+    extractor = _JOB_TYPE_EXTRACTORS.get(job_type)
+    type_details = extractor(getattr(pb, job_type)) if extractor else {}
+    # A finished job's current state started when the job ended
+    end_time = None
+    if done and status.HasField('state_start_time'):
+        end_time = status.state_start_time.ToJsonString()
 
-    return job_info
+    return JobSummary(
+        job_id=job_id,
+        type=job_type,
+        status=_JOB_STATE_NAMES.get(status.state, 'STATE_UNSPECIFIED'),
+        status_details=status.details,
+        cluster_name=cluster_name,
+        submitted_by='', # Job carries no submitter field
+        driver_output_uri=driver_output_uri,
+        start_time=_first_state_time(pb),
+        end_time=end_time,
+        **type_details,
+    )
 
 
 
@@ -80,28 +265,51 @@ def get_current_time(query: str) -> str:
     """Simulates getting the current time for a city.
 
     Args:
-        city: The name of the city to get the current time for.
+        query: Free-text query naming the city to get the current time for.
 
     Returns:
         A string with the current time information.
     """
-    if "sf" in query.lower() or "san francisco" in query.lower():
-        tz_identifier = "America/Los_Angeles"
-    else:
+    m = _TZ_RE.search(query)
+    if not m:
         return f"Sorry, I don't have timezone information for query: {query}."
+    tz = _QUERY_TZ[m.group(1).lower()]
+
+    now = _now(tz)
+    return f"The current time for query {query} is {now.isoformat(timespec='seconds')}"
+
+# Last (ETag, perfs) seen per user. Entries outlive the 60 second cache below
+# so an expired lookup can be revalidated with If-None-Match; a 304 reply has
+# no body to download or parse.
+_LICHESS_ETAGS = LRUCache(maxsize=1024)
+_LICHESS_ETAGS_LOCK = threading.Lock()
 
-    tz = ZoneInfo(tz_identifier)
-    now = datetime.datetime.now(tz)
-    return f"The current time for query {query} is {now.strftime('%Y-%m-%d %H:%M:%S %Z%z')}"
+@cached(TTLCache(maxsize=1024, ttl=60), lock=threading.Lock())
+def _fetch_lichess_perfs(username: str) -> dict:
+    """Fetches the 'perfs' block for a Lichess user, cached for 60 seconds."""
+    with _LICHESS_ETAGS_LOCK:
+        known = _LICHESS_ETAGS.get(username)
+    headers = {"If-None-Match": known[0]} if known else None
+    r = _LICHESS.get(f"https://lichess.org/api/user/{username}", headers=headers, timeout=5)
+    if r.status_code == 304 and known:
+        return known[1]
+    r.raise_for_status()
+    # orjson parses the raw bytes directly, skipping the str decode in r.json()
+    perfs = orjson.loads(r.content)['perfs']
+    etag = r.headers.get("ETag")
+    if etag:
+        with _LICHESS_ETAGS_LOCK:
+            _LICHESS_ETAGS[username] = (etag, perfs)
+    return perfs
 
 def get_lichess_rating(username: str):
-    """Fetches and prints Lichess user ratings using the public API.
+    """Fetches Lichess user ratings using the public API.
 
     This function accepts the Lichess username as an argument,
-    constructs the Lichess API URL for that user (http://en.lichess.org/api/user/),
-    fetches the user data, parses the JSON response, and prints the ratings
-    for various game performance categories (like blitz, rapid, classical, etc.)
-    to standard output.
+    constructs the Lichess API URL for that user (https://lichess.org/api/user/),
+    fetches the user data and returns the ratings for various game performance
+    categories (like blitz, rapid, classical, etc.). Use format_ratings to
+    render them as text.
 
     
     Args:
@@ -116,16 +324,27 @@ def get_lichess_rating(username: str):
               Can raise exceptions if the API request fails or parsing errors occur.
 
     """
-    import json
-    from urllib.request import urlopen
-
-    user_json = urlopen("http://en.lichess.org/api/user/" + username).read()
-    user_perfs = json.loads(user_json)['perfs']
-
-    print(f'username: {username}')
-    for k in user_perfs:
-        rating = user_perfs[k].get('rating')
-        if rating:
-            print(f'{k}: {rating}')
-    return user_perfs
+    return _fetch_lichess_perfs(username)
+
+def format_ratings(perfs: dict) -> str:
+    """Renders a 'perfs' dict as one '<category>: <rating>' line per rated category."""
+    return "\n".join(f"{k}: {v['rating']}" for k, v in perfs.items() if v.get('rating'))
+
+async def get_lichess_ratings(usernames: list[str]) -> dict:
+    """Fetches Lichess ratings for several users concurrently.
+
+    The lookups run on worker threads over the shared session, so N users cost
+    about one round trip instead of N, and share get_lichess_rating's cache.
+
+    Args:
+        usernames (list[str]): The Lichess usernames to fetch ratings for.
+
+    Returns:
+        dict: The 'perfs' dictionary of each username, keyed by username, or
+              {'error': ...} for a user whose lookup failed.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_fetch_lichess_perfs, u) for u in usernames), return_exceptions=True)
+    return {u: {"error": str(r)} if isinstance(r, Exception) else r
+            for u, r in zip(usernames, results, strict=True)}
 
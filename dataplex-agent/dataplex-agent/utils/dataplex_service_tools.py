@@ -1,28 +1,410 @@
 # Import necessary libraries
 from google.cloud import dataplex_v1
-from google.api_core.exceptions import GoogleAPICallError, NotFound, InvalidArgument
-from google.protobuf.json_format import MessageToDict
+from google.cloud.dataplex_v1.services.dataplex_service.transports import (
+    DataplexServiceGrpcAsyncIOTransport,
+    DataplexServiceGrpcTransport,
+)
+from google.api_core import retry, retry_async
+from google.api_core.exceptions import GoogleAPICallError, NotFound, InvalidArgument, ResourceExhausted, from_grpc_status
+from google.longrunning import operations_pb2
 from google.protobuf import field_mask_pb2
+from .credentials import default_credentials
+from .proto_dict import lake_to_dict, zone_to_dict, asset_to_dict, task_to_dict, job_to_dict
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import threading
+import weakref
+import orjson
+from cachetools import TTLCache
+from collections.abc import Iterator
+from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
 import time # For potential LRO polling delays in examples
 
 # Note: Authentication is handled implicitly by the Google Cloud client libraries.
 # Ensure your environment is authenticated (e.g., using `gcloud auth application-default login`).
 
+logger = logging.getLogger(__name__)
+
+# --- Message Classes ---
+# Bound once at import so calls skip the dataplex_v1 package attribute lookups.
+_Lake = dataplex_v1.Lake
+_CreateLakeRequest = dataplex_v1.CreateLakeRequest
+_ListLakesRequest = dataplex_v1.ListLakesRequest
+_UpdateLakeRequest = dataplex_v1.UpdateLakeRequest
+_Zone = dataplex_v1.Zone
+_CreateZoneRequest = dataplex_v1.CreateZoneRequest
+_ListZonesRequest = dataplex_v1.ListZonesRequest
+_UpdateZoneRequest = dataplex_v1.UpdateZoneRequest
+_Asset = dataplex_v1.Asset
+_CreateAssetRequest = dataplex_v1.CreateAssetRequest
+_ListAssetsRequest = dataplex_v1.ListAssetsRequest
+_UpdateAssetRequest = dataplex_v1.UpdateAssetRequest
+_Task = dataplex_v1.Task
+_CreateTaskRequest = dataplex_v1.CreateTaskRequest
+_ListTasksRequest = dataplex_v1.ListTasksRequest
+_UpdateTaskRequest = dataplex_v1.UpdateTaskRequest
+_ListJobsRequest = dataplex_v1.ListJobsRequest
+# List requests are built as raw protobuf messages and wrapped, which skips the
+# proto-plus per-field marshalling of the keyword constructor (about 5x faster).
+_ListLakesPb = _ListLakesRequest.pb()
+_ListZonesPb = _ListZonesRequest.pb()
+_ListAssetsPb = _ListAssetsRequest.pb()
+
+# --- Shared Client ---
+# Building a DataplexServiceClient loads credentials and opens a gRPC channel,
+# so a single lazily-created client is shared by every operation below.
+# Concurrent calls multiplex as HTTP/2 streams on its one connection, and
+# keepalive pings on active calls detect a dead connection promptly instead
+# of leaving calls hanging on a half-open socket. The message size limits
+# repeat the generated transport's defaults, which passing our own channel
+# would otherwise drop.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+def _get_client() -> dataplex_v1.DataplexServiceClient:
+    """Returns the process-wide DataplexServiceClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                credentials, _ = default_credentials()
+                channel = DataplexServiceGrpcTransport.create_channel(
+                    credentials=credentials, options=_CHANNEL_OPTIONS)
+                _CLIENT = dataplex_v1.DataplexServiceClient(
+                    transport=DataplexServiceGrpcTransport(channel=channel))
+    return _CLIENT
+
+# --- Retries ---
+# Reads are retried on any transient error (429, 500, 502, 503) with jittered
+# exponential backoff inside a 60s budget; the generated defaults only retry
+# UNAVAILABLE. Mutations are only retried when rate limited (429), which means
+# the request was rejected before it was applied, so a retry cannot apply it
+# twice. run_task is never retried, since every accepted call starts a job.
+_READ_RETRY = retry.Retry(
+    predicate=retry.if_transient_error, initial=0.5, maximum=10.0, multiplier=2.0, timeout=60.0)
+_READ_RETRY_ASYNC = retry_async.AsyncRetry(
+    predicate=retry.if_transient_error, initial=0.5, maximum=10.0, multiplier=2.0, timeout=60.0)
+_WRITE_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(ResourceExhausted), initial=0.5, maximum=10.0, multiplier=2.0, timeout=60.0)
+_WRITE_RETRY_ASYNC = retry_async.AsyncRetry(
+    predicate=retry.if_exception_type(ResourceExhausted), initial=0.5, maximum=10.0, multiplier=2.0, timeout=60.0)
+
+# --- Resource Names ---
+# The path builders are static string formatters on the client class. Agents
+# revisit the same lakes/zones/assets repeatedly, so the formatted names are
+# memoized instead of re-expanding the templates on every call.
+_common_location_path = functools.lru_cache(maxsize=4096)(dataplex_v1.DataplexServiceClient.common_location_path)
+_lake_path = functools.lru_cache(maxsize=4096)(dataplex_v1.DataplexServiceClient.lake_path)
+_zone_path = functools.lru_cache(maxsize=4096)(dataplex_v1.DataplexServiceClient.zone_path)
+_asset_path = functools.lru_cache(maxsize=4096)(dataplex_v1.DataplexServiceClient.asset_path)
+_task_path = functools.lru_cache(maxsize=4096)(dataplex_v1.DataplexServiceClient.task_path)
+_job_path = functools.lru_cache(maxsize=4096)(dataplex_v1.DataplexServiceClient.job_path)
+
+def _rename_type(details: dict, spec: str | None = None) -> dict:
+    """Returns details with its 'type' key renamed to the proto-plus field 'type_'.
+
+    The key is looked up at the top level, or inside details[spec] when spec is
+    given. The caller's dict is never modified; dicts along the renamed path
+    are copied only when a rename is needed, otherwise details is returned as is.
+    """
+    if spec is not None:
+        inner = details.get(spec)
+        if not isinstance(inner, dict) or "type" not in inner:
+            return details
+        return {**details, spec: _rename_type(inner)}
+    if "type" not in details:
+        return details
+    renamed = dict(details)
+    renamed["type_"] = renamed.pop("type")
+    return renamed
+
+def _apply_paths(msg, update_mask: list[str], details: dict) -> None:
+    """Copies only the fields named in update_mask from details onto msg.
+
+    Each dotted mask path is walked through the nested details dict and the
+    matching sub-message, and only its leaf is assigned, so fields outside the
+    mask are never converted. A path with no value in details is left unset,
+    which the update treats as clearing it, as the full-dict constructor did.
+    """
+    for path in update_mask:
+        *parents, leaf = path.split(".")
+        target, value = msg, details
+        for seg in parents:
+            attr = seg if seg in type(target).meta.fields else f"{seg}_"
+            value = value.get(seg, value.get(attr)) if isinstance(value, dict) else None
+            if value is None:
+                break
+            target = getattr(target, attr)
+        else:
+            attr = leaf if leaf in type(target).meta.fields else f"{leaf}_"
+            if isinstance(value, dict) and (leaf in value or attr in value):
+                setattr(target, attr, value[leaf] if leaf in value else value[attr])
+
+def _only(fields: list[str] | None, convert):
+    """Wraps a *_to_dict converter so only the given field paths are converted.
+
+    Get/List requests for these resources take no read mask, so the full
+    message still crosses the wire; the message is trimmed with a FieldMask
+    first so conversion cost scales with the fields asked for. Paths use proto
+    field names (dotted for nested fields); 'type' is accepted for 'type_'.
+    """
+    if not fields:
+        return convert
+    mask = field_mask_pb2.FieldMask(paths=[
+        ".".join("type_" if seg == "type" else seg for seg in path.split(".")) for path in fields])
+
+    def convert_only(msg):
+        pb = getattr(msg, "_pb", msg)
+        if not mask.IsValidForDescriptor(pb.DESCRIPTOR):
+            raise ValueError(f"Unknown field path in {fields} for {pb.DESCRIPTOR.name}")
+        trimmed = type(pb)()
+        mask.MergeMessage(pb, trimmed)
+        return convert(trimmed)
+    return convert_only
+
+def _convert_pages(pages, items, convert, max_parallelism: int) -> list[dict]:
+    """Converts a pager's results page by page on a thread pool.
+
+    Page RPCs are chained by page tokens, so pages are still fetched in order,
+    but each fetched page is handed to a worker and converted while the next
+    page's RPC is in flight. Results keep the order the service returned them in.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_parallelism)) as pool:
+        futures = [pool.submit(lambda msgs: [convert(m) for m in msgs], items(page))
+                   for page in pages]
+        return [d for f in futures for d in f.result()]
+
+def _result_encoder(return_format: str):
+    """Returns the function producing a lister's result in the requested format.
+
+    'json' serializes the converted dicts in one orjson pass, for callers that
+    forward the result as text anyway.
+    """
+    if return_format == "dict":
+        return lambda results: results
+    if return_format == "json":
+        return lambda results: orjson.dumps(results).decode()
+    raise ValueError(f"return_format must be 'dict' or 'json', got {return_format!r}")
+
 # --- Helper Function for LROs (Optional) ---
-def _handle_lro(operation, operation_description: str):
-    """Helper to return LRO details or potential immediate errors."""
-    
-    if operation.exception():
-        print(f"Error during {operation_description}: {operation.exception()}")
-        return {"error": f"Error during {operation_description}: {operation.exception()}"}
-    print(f"Initiated {operation_description}. Operation: {operation.operation.name}")
+def _resolve_operation(future: Future, op: operations_pb2.Operation) -> None:
+    if op.HasField("error"):
+        future.set_exception(from_grpc_status(op.error.code, op.error.message))
+    else:
+        future.set_result(op)
+
+class LROTracker:
+    """Waits on many long-running operations from a single background poller.
+
+    Registered operations are polled together by one daemon thread over the
+    shared client, instead of each caller polling its own operation. The poll
+    interval starts at initial_poll_delay and grows by multiplier, up to
+    max_poll_delay, while nothing completes; registering an operation or
+    seeing one finish resets it.
+    """
+
+    def __init__(self, initial_poll_delay: float = 1.0, multiplier: float = 1.5,
+                 max_poll_delay: float = 30.0):
+        self._initial_poll_delay = initial_poll_delay
+        self._multiplier = multiplier
+        self._max_poll_delay = max_poll_delay
+        self._pending = {}  # operation name -> Future
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def register(self, operation) -> Future:
+        """Tracks an operation and returns a Future for its final Operation proto.
+
+        Accepts an api_core Operation (as returned by create_lake etc.) or a raw
+        operations_pb2.Operation. The Future raises GoogleAPICallError if the
+        operation failed, or if polling it failed with a non-transient error
+        (e.g. NotFound).
+        """
+        op = getattr(operation, "operation", operation)
+        future = Future()
+        if op.done:
+            _resolve_operation(future, op)
+            return future
+        with self._cond:
+            if op.name in self._pending:
+                return self._pending[op.name]
+            self._pending[op.name] = future
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dataplex-lro-tracker", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def _run(self) -> None:
+        delay = self._initial_poll_delay
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                if self._cond.wait(timeout=delay):
+                    delay = self._initial_poll_delay  # New work arrived; restart the backoff
+                names = list(self._pending)
+
+            # Any error here is retried on the next round: if the poller died,
+            # every pending and future Future would wait forever.
+            try:
+                client = _get_client()
+            except Exception as e:
+                logger.warning("Error creating the client to poll operations, will retry: %s", e)
+                delay = min(delay * self._multiplier, self._max_poll_delay)
+                continue
+            completed = False
+            for name in names:
+                try:
+                    op = client.get_operation(operations_pb2.GetOperationRequest(name=name))
+                except GoogleAPICallError as e:
+                    if retry.if_transient_error(e):
+                        logger.warning("Error polling operation %s, will retry: %s", name, e)
+                        continue
+                    # NotFound, PermissionDenied, ...: polling again cannot succeed
+                    logger.error("Error polling operation %s, giving up: %s", name, e)
+                    with self._cond:
+                        future = self._pending.pop(name)
+                    future.set_exception(e)
+                    completed = True
+                    continue
+                except Exception as e:  # RetryError, auth errors, ...
+                    logger.warning("Error polling operation %s, will retry: %s", name, e)
+                    continue
+                if op.done:
+                    with self._cond:
+                        future = self._pending.pop(name)
+                    _resolve_operation(future, op)
+                    completed = True
+            delay = self._initial_poll_delay if completed else min(delay * self._multiplier, self._max_poll_delay)
+
+def _pending_result(operation, debug: bool) -> dict:
+    # Rendering OperationMetadata to text is a full text-format pass, so it is
+    # only done when a caller asks for it.
+    result = {"status": "pending", "operation_name": operation.operation.name}
+    if debug:
+        result["metadata"] = str(operation.metadata)
+    return result
+
+def _handle_lro(operation, operation_description: str, debug: bool = False):
+    """Helper to return LRO details or potential immediate errors.
+
+    With debug=True the result also carries the operation metadata as text.
+    """
+    exc = operation.exception()
+    if exc:
+        logger.error("Error during %s: %s", operation_description, exc)
+        return {"error": f"Error during {operation_description}: {exc}"}
+    logger.info("Initiated %s. Operation: %s", operation_description, operation.operation.name)
     
-    return {"status": "pending", "operation_name": operation.operation.name, "metadata": str(operation.metadata)}
+    return _pending_result(operation, debug)
+
+# --- Get Cache ---
+# Agents often re-read the same lake/zone/asset within seconds. Setting
+# DATAPLEX_GET_CACHE_TTL (seconds) keeps fetched messages that long, keyed by
+# resource name; updates and deletes drop the affected entries, both when the
+# operation starts and once it has finished, since a get made while it ran
+# may have cached the old state again. Entries are kept serialized, so every
+# caller gets its own message and mutating it cannot leak into the cache.
+# Off by default, since the hit rate depends on the workload; hit rates are
+# logged every 100 lookups so it can be judged before enabling it widely.
+_GET_CACHE_TTL = float(os.environ.get("DATAPLEX_GET_CACHE_TTL", "0"))
+_GET_CACHE = TTLCache(maxsize=512, ttl=_GET_CACHE_TTL) if _GET_CACHE_TTL > 0 else None
+_GET_CACHE_LOCK = threading.Lock()
+_GET_CACHE_STATS = {"hits": 0, "misses": 0}
+
+def _cached_get(name: str, fetch):
+    """
+    Returns the message for name from the get cache, calling fetch() on a miss.
+    Each call returns a new message owned by the caller.
+    """
+    if _GET_CACHE is None:
+        return fetch()
+    with _GET_CACHE_LOCK:
+        entry = _GET_CACHE.get(name)
+        _GET_CACHE_STATS["hits" if entry is not None else "misses"] += 1
+        hits, misses = _GET_CACHE_STATS["hits"], _GET_CACHE_STATS["misses"]
+    if (hits + misses) % 100 == 0:
+        logger.info("Get cache: %d hits / %d lookups (%.0f%%)", hits, hits + misses, 100 * hits / (hits + misses))
+    if entry is not None:
+        cls, data = entry
+        return cls.deserialize(data)
+    msg = fetch()
+    with _GET_CACHE_LOCK:
+        _GET_CACHE[name] = (type(msg), type(msg).serialize(msg))
+    return msg
+
+def _invalidate(name: str) -> None:
+    """Drops a resource and everything under it (e.g. a lake's zones) from the get cache."""
+    if _GET_CACHE is None:
+        return
+    prefix = name + "/"
+    with _GET_CACHE_LOCK:
+        for key in [k for k in _GET_CACHE if k == name or k.startswith(prefix)]:
+            _GET_CACHE.pop(key, None)
+
+# --- Error Handling ---
+def _dataplex_errors(action: str, noun: str, not_found: str | None = None, many: bool = False):
+    """Turns an exception raised by a Dataplex tool into the tool's error result.
+
+    action and noun name the operation in messages (e.g. "creating", "lake").
+    not_found is a str.format template over the call's arguments, used when the
+    resource or its parent does not exist; without it NotFound is reported as
+    an API error. List tools (many=True) return the error dict inside a list.
+    Works on both plain functions and coroutines.
+    """
+    def decorate(fn):
+        sig = inspect.signature(fn)
+
+        def error_result(args, kwargs, e: Exception):
+            if not_found and isinstance(e, NotFound):
+                bound = sig.bind(*args, **kwargs)
+                message = not_found.format(**bound.arguments)
+                logger.warning("%s: %s", fn.__name__, message)
+            elif isinstance(e, InvalidArgument):
+                message = f"Invalid argument: {e.message}"
+                logger.error("%s: %s", fn.__name__, message)
+            elif isinstance(e, GoogleAPICallError):
+                message = f"API Error {action} {noun}: {e.message}"
+                logger.error("%s: %s", fn.__name__, message)
+            else:
+                message = f"Unexpected error {action} {noun}: {str(e)}"
+                logger.exception("%s: %s", fn.__name__, message)
+            return [{"error": message}] if many else {"error": message}
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    return error_result(args, kwargs, e)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    return error_result(args, kwargs, e)
+        return wrapper
+    return decorate
 
 # --- Dataplex Service Client Functions ---
 
 # --- Lake Operations ---
 
+@_dataplex_errors("creating", "lake")
 def create_dataplex_lake(project_id: str, location: str, lake_id: str, lake_details: dict):
     """
     Creates a Dataplex lake.
@@ -37,35 +419,27 @@ def create_dataplex_lake(project_id: str, location: str, lake_id: str, lake_deta
     Returns:
         dict: A dictionary containing the LRO details for the creation operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.common_location_path(project_id, location)
-
-        # Construct the Lake object from the dictionary
-        lake_obj = dataplex_v1.Lake(lake_details)
-
-        request = dataplex_v1.CreateLakeRequest(
-            parent=parent,
-            lake_id=lake_id,
-            lake=lake_obj,
-            # validate_only=False # Optional: Set to True to validate without creating
-        )
-
-        operation = client.create_lake(request=request)
-        
-        return _handle_lro(operation, f"lake creation for '{lake_id}'")
-
-    except InvalidArgument as e:
-        print(f"Invalid argument creating lake {lake_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error creating lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"API Error creating lake: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error creating lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"Unexpected error creating lake: {str(e)}"}
+    client = _get_client()
+    parent = _common_location_path(project_id, location)
+
+    # Construct the Lake object from the dictionary
+    lake_obj = _Lake(lake_details)
 
-def get_dataplex_lake(project_id: str, location: str, lake_id: str):
+    request = _CreateLakeRequest(
+        parent=parent,
+        lake_id=lake_id,
+        lake=lake_obj,
+        # validate_only=False # Optional: Set to True to validate without creating
+    )
+
+    operation = client.create_lake(request=request, retry=_WRITE_RETRY)
+    
+    return _handle_lro(operation, f"lake creation for '{lake_id}'")
+
+# Tool parameters are annotated Optional[...]: google-adk 0.1 cannot build a
+# function declaration from a PEP 604 "X | None" parameter.
+@_dataplex_errors("getting", "lake", not_found="Lake not found: {lake_id}")
+def get_dataplex_lake(project_id: str, location: str, lake_id: str, fields: Optional[list[str]] = None):  # noqa: UP045
     """
     Retrieves details of a specific Dataplex lake.
 
@@ -73,29 +447,59 @@ def get_dataplex_lake(project_id: str, location: str, lake_id: str):
         project_id (str): The Google Cloud project ID.
         location (str): The Google Cloud location (e.g., 'us-central1').
         lake_id (str): The ID of the lake.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
 
     Returns:
         dict: A dictionary containing lake details or an error message.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.lake_path(project_id, location, lake_id)
-        request = dataplex_v1.GetLakeRequest(name=name)
-        lake = client.get_lake(request=request)
-        
-        lake_dict = MessageToDict(lake._pb, preserving_proto_field_name=True)
-        return lake_dict
-    except NotFound:
-        print(f"Lake '{lake_id}' not found in {project_id}/{location}.")
-        return {"error": f"Lake not found: {lake_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error getting lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"API Error getting lake: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error getting lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"Unexpected error getting lake: {str(e)}"}
+    lake = get_dataplex_lake_raw(project_id, location, lake_id)
+    return _only(fields, lake_to_dict)(lake)
 
-def list_dataplex_lakes(project_id: str, location: str, filter_str: str):
+def get_dataplex_lake_raw(project_id: str, location: str, lake_id: str) -> dataplex_v1.Lake:
+    """
+    Retrieves a Dataplex lake as its message, skipping dict conversion for
+    callers that only read a few attributes (e.g. `lake.state`).
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        lake_id (str): The ID of the lake.
+
+    Returns:
+        dataplex_v1.Lake: The lake message, owned by the caller even when
+        served from the get cache.
+
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call (e.g. NotFound).
+    """
+    name = _lake_path(project_id, location, lake_id)
+    return _cached_get(name, lambda: _get_client().get_lake(name=name, retry=_READ_RETRY))
+
+def iter_dataplex_lakes(project_id: str, location: str, filter_str: str = "",
+                        fields: list[str] | None = None) -> Iterator[dict]:
+    """
+    Lazily yields Dataplex lakes as the pager fetches them, so callers can
+    act on the first lakes without waiting for (or holding) the whole listing.
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        filter_str (str, optional): A filter string (e.g., 'state = ACTIVE'). Defaults to no filter.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
+
+    Yields:
+        dict: Info about one lake.
+
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call.
+    """
+    parent = _common_location_path(project_id, location)
+    request = _ListLakesRequest.wrap(_ListLakesPb(parent=parent, filter=filter_str))
+    yield from map(_only(fields, lake_to_dict), _get_client().list_lakes(request=request, retry=_READ_RETRY))
+
+@_dataplex_errors("listing", "lakes", many=True)
+def list_dataplex_lakes(project_id: str, location: str, filter_str: str, max_parallelism: int = 4,
+                        fields: Optional[list[str]] = None, return_format: str = "dict"):  # noqa: UP045
     """
     Lists Dataplex lakes in a specific project and location.
 
@@ -103,33 +507,29 @@ def list_dataplex_lakes(project_id: str, location: str, filter_str: str):
         project_id (str): The Google Cloud project ID.
         location (str): The Google Cloud location (e.g., 'us-central1').
         filter_str (str, optional): A filter string (e.g., 'state = ACTIVE'). Defaults to None.
+        max_parallelism (int, optional): Number of worker threads converting pages. Defaults to 4.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing info about a lake,
-              or a list containing a single error dictionary.
+              or a list containing a single error dictionary. With return_format='json'
+              the list is returned as a JSON string.
     """
-    lakes_list = []
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.common_location_path(project_id, location)
-        request = dataplex_v1.ListLakesRequest(parent=parent, filter=filter_str)
+    encode = _result_encoder(return_format)
+    client = _get_client()
+    parent = _common_location_path(project_id, location)
+    request = _ListLakesRequest.wrap(_ListLakesPb(parent=parent, filter=filter_str))
 
-        for lake in client.list_lakes(request=request):
-            
-            lake_dict = MessageToDict(lake._pb, preserving_proto_field_name=True)
-            lakes_list.append(lake_dict)
+    pages = client.list_lakes(request=request, retry=_READ_RETRY).pages
+    lakes_list = _convert_pages(pages, lambda page: page.lakes, _only(fields, lake_to_dict), max_parallelism)
 
-        if not lakes_list:
-             print(f"No lakes found in {project_id}/{location} matching filter '{filter_str}'.")
-        return lakes_list
-
-    except GoogleAPICallError as e:
-        print(f"API Error listing lakes in {project_id}/{location}: {e}")
-        return [{"error": f"API Error listing lakes: {e.message}"}]
-    except Exception as e:
-        print(f"Unexpected error listing lakes in {project_id}/{location}: {e}")
-        return {"error": f"Unexpected error listing lakes: {str(e)}"}
+    if not lakes_list:
+        logger.info("No lakes found in %s/%s matching filter '%s'.", project_id, location, filter_str)
+    return encode(lakes_list)
 
+@_dataplex_errors("updating", "lake", not_found="Lake not found for update: {lake_id}")
 def update_dataplex_lake(project_id: str, location: str, lake_id: str, update_mask: list[str], updated_lake_details: dict):
     """
     Updates a Dataplex lake.
@@ -144,37 +544,29 @@ def update_dataplex_lake(project_id: str, location: str, lake_id: str, update_ma
     Returns:
         dict: A dictionary containing the LRO details for the update operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        lake_name = client.lake_path(project_id, location, lake_id)
+    client = _get_client()
+    lake_name = _lake_path(project_id, location, lake_id)
 
-        # Construct the Lake object with only the updated fields and the name
-        lake_obj = dataplex_v1.Lake(name=lake_name, **updated_lake_details)
-        field_mask = field_mask_pb2.FieldMask(paths=update_mask)
+    # Construct the Lake object with only the masked fields and the name
+    lake_obj = _Lake(name=lake_name)
+    _apply_paths(lake_obj, update_mask, updated_lake_details)
+    field_mask = field_mask_pb2.FieldMask(paths=update_mask)
 
-        request = dataplex_v1.UpdateLakeRequest(
-            lake=lake_obj,
-            update_mask=field_mask,
-            # validate_only=False # Optional
-        )
+    request = _UpdateLakeRequest(
+        lake=lake_obj,
+        update_mask=field_mask,
+        # validate_only=False # Optional
+    )
 
-        operation = client.update_lake(request=request)
-        
-        return _handle_lro(operation, f"lake update for '{lake_id}'")
+    operation = client.update_lake(request=request, retry=_WRITE_RETRY)
+    _invalidate(lake_name)
 
-    except NotFound:
-        print(f"Lake '{lake_id}' not found for update in {project_id}/{location}.")
-        return {"error": f"Lake not found for update: {lake_id}"}
-    except InvalidArgument as e:
-        print(f"Invalid argument updating lake {lake_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error updating lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"API Error updating lake: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error updating lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"Unexpected error updating lake: {str(e)}"}
+    try:
+        return _handle_lro(operation, f"lake update for '{lake_id}'")
+    finally:
+        _invalidate(lake_name)
 
+@_dataplex_errors("deleting", "lake", not_found="Lake not found for deletion: {lake_id}")
 def delete_dataplex_lake(project_id: str, location: str, lake_id: str):
     """
     Deletes a Dataplex lake.
@@ -187,28 +579,21 @@ def delete_dataplex_lake(project_id: str, location: str, lake_id: str):
     Returns:
         dict: A dictionary containing the LRO details for the deletion operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.lake_path(project_id, location, lake_id)
-        request = dataplex_v1.DeleteLakeRequest(name=name)
+    client = _get_client()
+    name = _lake_path(project_id, location, lake_id)
 
-        operation = client.delete_lake(request=request)
-        
-        return _handle_lro(operation, f"lake deletion for '{lake_id}'")
+    operation = client.delete_lake(name=name, retry=_WRITE_RETRY)
+    _invalidate(name)
 
-    except NotFound:
-        print(f"Lake '{lake_id}' not found for deletion in {project_id}/{location}.")
-        return {"error": f"Lake not found for deletion: {lake_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error deleting lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"API Error deleting lake: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error deleting lake {lake_id} in {project_id}/{location}: {e}")
-        return {"error": f"Unexpected error deleting lake: {str(e)}"}
+    try:
+        return _handle_lro(operation, f"lake deletion for '{lake_id}'")
+    finally:
+        _invalidate(name)
 
 
 # --- Zone Operations ---
 
+@_dataplex_errors("creating", "zone")
 def create_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id: str, zone_details: dict):
     """
     Creates a Dataplex zone within a lake.
@@ -226,36 +611,22 @@ def create_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id:
     Returns:
         dict: A dictionary containing the LRO details for the creation operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.lake_path(project_id, location, lake_id)
-
-        # Handle 'type' keyword conflict
-        if 'type' in zone_details:
-            zone_details['type_'] = zone_details.pop('type')
-
-        zone_obj = dataplex_v1.Zone(**zone_details)
-
-        request = dataplex_v1.CreateZoneRequest(
-            parent=parent,
-            zone_id=zone_id,
-            zone=zone_obj,
-        )
-        operation = client.create_zone(request=request)
-        
-        return _handle_lro(operation, f"zone creation for '{zone_id}' in lake '{lake_id}'")
-
-    except InvalidArgument as e:
-        print(f"Invalid argument creating zone {zone_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error creating zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error creating zone: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error creating zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error creating zone: {str(e)}"}
+    client = _get_client()
+    parent = _lake_path(project_id, location, lake_id)
+
+    zone_obj = _Zone(**_rename_type(zone_details))
 
-def get_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id: str):
+    request = _CreateZoneRequest(
+        parent=parent,
+        zone_id=zone_id,
+        zone=zone_obj,
+    )
+    operation = client.create_zone(request=request, retry=_WRITE_RETRY)
+    
+    return _handle_lro(operation, f"zone creation for '{zone_id}' in lake '{lake_id}'")
+
+@_dataplex_errors("getting", "zone", not_found="Zone not found: {zone_id}")
+def get_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id: str, fields: Optional[list[str]] = None):  # noqa: UP045
     """
     Retrieves details of a specific Dataplex zone.
 
@@ -264,29 +635,61 @@ def get_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id: str
         location (str): The Google Cloud location (e.g., 'us-central1').
         lake_id (str): The ID of the parent lake.
         zone_id (str): The ID of the zone.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
 
     Returns:
         dict: A dictionary containing zone details or an error message.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.zone_path(project_id, location, lake_id, zone_id)
-        request = dataplex_v1.GetZoneRequest(name=name)
-        zone = client.get_zone(request=request)
-        
-        zone_dict = MessageToDict(zone._pb, preserving_proto_field_name=True)
-        return zone_dict
-    except NotFound:
-        print(f"Zone '{zone_id}' not found in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Zone not found: {zone_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error getting zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error getting zone: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error getting zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error getting zone: {str(e)}"}
+    zone = get_dataplex_zone_raw(project_id, location, lake_id, zone_id)
+    return _only(fields, zone_to_dict)(zone)
+
+def get_dataplex_zone_raw(project_id: str, location: str, lake_id: str, zone_id: str) -> dataplex_v1.Zone:
+    """
+    Retrieves a Dataplex zone as its message, skipping dict conversion for
+    callers that only read a few attributes (e.g. `zone.state`).
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        lake_id (str): The ID of the parent lake.
+        zone_id (str): The ID of the zone.
+
+    Returns:
+        dataplex_v1.Zone: The zone message, owned by the caller even when
+        served from the get cache.
 
-def list_dataplex_zones(project_id: str, location: str, lake_id: str, filter_str: str):
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call (e.g. NotFound).
+    """
+    name = _zone_path(project_id, location, lake_id, zone_id)
+    return _cached_get(name, lambda: _get_client().get_zone(name=name, retry=_READ_RETRY))
+
+def iter_dataplex_zones(project_id: str, location: str, lake_id: str, filter_str: str = "",
+                        fields: list[str] | None = None) -> Iterator[dict]:
+    """
+    Lazily yields Dataplex zones as the pager fetches them, so callers can
+    act on the first zones without waiting for (or holding) the whole listing.
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        lake_id (str): The ID of the parent lake.
+        filter_str (str, optional): A filter string (e.g., 'type = RAW'). Defaults to no filter.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
+
+    Yields:
+        dict: Info about one zone.
+
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call.
+    """
+    parent = _lake_path(project_id, location, lake_id)
+    request = _ListZonesRequest.wrap(_ListZonesPb(parent=parent, filter=filter_str))
+    yield from map(_only(fields, zone_to_dict), _get_client().list_zones(request=request, retry=_READ_RETRY))
+
+@_dataplex_errors("listing", "zones", not_found="Parent lake not found: {lake_id}", many=True)
+def list_dataplex_zones(project_id: str, location: str, lake_id: str, filter_str: str, max_parallelism: int = 4,
+                        fields: Optional[list[str]] = None, return_format: str = "dict"):  # noqa: UP045
     """
     Lists Dataplex zones within a specific lake.
 
@@ -295,36 +698,29 @@ def list_dataplex_zones(project_id: str, location: str, lake_id: str, filter_str
         location (str): The Google Cloud location (e.g., 'us-central1').
         lake_id (str): The ID of the parent lake.
         filter_str (str, optional): A filter string (e.g., 'type = RAW'). Defaults to None.
+        max_parallelism (int, optional): Number of worker threads converting pages. Defaults to 4.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing info about a zone,
-              or a list containing a single error dictionary.
+              or a list containing a single error dictionary. With return_format='json'
+              the list is returned as a JSON string.
     """
-    zones_list = []
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.lake_path(project_id, location, lake_id)
-        request = dataplex_v1.ListZonesRequest(parent=parent, filter=filter_str)
-
-        for zone in client.list_zones(request=request):
-            
-            zone_dict = MessageToDict(zone._pb, preserving_proto_field_name=True)
-            zones_list.append(zone_dict)
-
-        if not zones_list:
-             print(f"No zones found in {project_id}/{location}/{lake_id} matching filter '{filter_str}'.")
-        return zones_list
-
-    except NotFound: # If the parent lake doesn't exist
-        print(f"Lake '{lake_id}' not found in {project_id}/{location} when listing zones.")
-        return [{"error": f"Parent lake not found: {lake_id}"}]
-    except GoogleAPICallError as e:
-        print(f"API Error listing zones in {project_id}/{location}/{lake_id}: {e}")
-        return [{"error": f"API Error listing zones: {e.message}"}]
-    except Exception as e:
-        print(f"Unexpected error listing zones in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error listing zones: {str(e)}"}
+    encode = _result_encoder(return_format)
+    client = _get_client()
+    parent = _lake_path(project_id, location, lake_id)
+    request = _ListZonesRequest.wrap(_ListZonesPb(parent=parent, filter=filter_str))
+
+    pages = client.list_zones(request=request, retry=_READ_RETRY).pages
+    zones_list = _convert_pages(pages, lambda page: page.zones, _only(fields, zone_to_dict), max_parallelism)
 
+    if not zones_list:
+        logger.info("No zones found in %s/%s/%s matching filter '%s'.", project_id, location, lake_id, filter_str)
+    return encode(zones_list)
+
+@_dataplex_errors("updating", "zone", not_found="Zone not found for update: {zone_id}")
 def update_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id: str, update_mask: list[str], updated_zone_details: dict):
     """
     Updates a Dataplex zone.
@@ -340,38 +736,26 @@ def update_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id:
     Returns:
         dict: A dictionary containing the LRO details for the update operation or an error.
     """
+    client = _get_client()
+    zone_name = _zone_path(project_id, location, lake_id, zone_id)
+
+    zone_obj = _Zone(name=zone_name)
+    _apply_paths(zone_obj, update_mask, updated_zone_details)
+    field_mask = field_mask_pb2.FieldMask(paths=update_mask)
+
+    request = _UpdateZoneRequest(
+        zone=zone_obj,
+        update_mask=field_mask,
+    )
+    operation = client.update_zone(request=request, retry=_WRITE_RETRY)
+    _invalidate(zone_name)
+
     try:
-        client = dataplex_v1.DataplexServiceClient()
-        zone_name = client.zone_path(project_id, location, lake_id, zone_id)
-
-        # Handle 'type' keyword conflict if present in details (though type is immutable)
-        if 'type' in updated_zone_details:
-             updated_zone_details['type_'] = updated_zone_details.pop('type')
-
-        zone_obj = dataplex_v1.Zone(name=zone_name, **updated_zone_details)
-        field_mask = field_mask_pb2.FieldMask(paths=update_mask)
-
-        request = dataplex_v1.UpdateZoneRequest(
-            zone=zone_obj,
-            update_mask=field_mask,
-        )
-        operation = client.update_zone(request=request)
-        
         return _handle_lro(operation, f"zone update for '{zone_id}'")
+    finally:
+        _invalidate(zone_name)
 
-    except NotFound:
-        print(f"Zone '{zone_id}' not found for update in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Zone not found for update: {zone_id}"}
-    except InvalidArgument as e:
-        print(f"Invalid argument updating zone {zone_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error updating zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error updating zone: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error updating zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error updating zone: {str(e)}"}
-
+@_dataplex_errors("deleting", "zone", not_found="Zone not found for deletion: {zone_id}")
 def delete_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id: str):
     """
     Deletes a Dataplex zone.
@@ -385,26 +769,19 @@ def delete_dataplex_zone(project_id: str, location: str, lake_id: str, zone_id:
     Returns:
         dict: A dictionary containing the LRO details for the deletion operation or an error.
     """
+    client = _get_client()
+    name = _zone_path(project_id, location, lake_id, zone_id)
+    operation = client.delete_zone(name=name, retry=_WRITE_RETRY)
+    _invalidate(name)
+
     try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.zone_path(project_id, location, lake_id, zone_id)
-        request = dataplex_v1.DeleteZoneRequest(name=name)
-        operation = client.delete_zone(request=request)
-        
         return _handle_lro(operation, f"zone deletion for '{zone_id}'")
-
-    except NotFound:
-        print(f"Zone '{zone_id}' not found for deletion in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Zone not found for deletion: {zone_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error deleting zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error deleting zone: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error deleting zone {zone_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error deleting zone: {str(e)}"}
+    finally:
+        _invalidate(name)
 
 # --- Asset Operations ---
 
+@_dataplex_errors("creating", "asset")
 def create_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str, asset_details: dict):
     """
     Creates a Dataplex asset within a zone.
@@ -423,36 +800,22 @@ def create_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id:
     Returns:
         dict: A dictionary containing the LRO details for the creation operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.zone_path(project_id, location, lake_id, zone_id)
-
-        # Handle 'type' keyword conflict in resource_spec
-        if 'resource_spec' in asset_details and 'type' in asset_details['resource_spec']:
-            asset_details['resource_spec']['type_'] = asset_details['resource_spec'].pop('type')
-
-        asset_obj = dataplex_v1.Asset(**asset_details)
-
-        request = dataplex_v1.CreateAssetRequest(
-            parent=parent,
-            asset_id=asset_id,
-            asset=asset_obj,
-        )
-        operation = client.create_asset(request=request)
-        
-        return _handle_lro(operation, f"asset creation for '{asset_id}' in zone '{zone_id}'")
-
-    except InvalidArgument as e:
-        print(f"Invalid argument creating asset {asset_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error creating asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"API Error creating asset: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error creating asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"Unexpected error creating asset: {str(e)}"}
+    client = _get_client()
+    parent = _zone_path(project_id, location, lake_id, zone_id)
 
-def get_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str):
+    asset_obj = _Asset(**_rename_type(asset_details, 'resource_spec'))
+
+    request = _CreateAssetRequest(
+        parent=parent,
+        asset_id=asset_id,
+        asset=asset_obj,
+    )
+    operation = client.create_asset(request=request, retry=_WRITE_RETRY)
+    
+    return _handle_lro(operation, f"asset creation for '{asset_id}' in zone '{zone_id}'")
+
+@_dataplex_errors("getting", "asset", not_found="Asset not found: {asset_id}")
+def get_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str, fields: Optional[list[str]] = None):  # noqa: UP045
     """
     Retrieves details of a specific Dataplex asset.
 
@@ -462,29 +825,63 @@ def get_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id: st
         lake_id (str): The ID of the parent lake.
         zone_id (str): The ID of the parent zone.
         asset_id (str): The ID of the asset.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
 
     Returns:
         dict: A dictionary containing asset details or an error message.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.asset_path(project_id, location, lake_id, zone_id, asset_id)
-        request = dataplex_v1.GetAssetRequest(name=name)
-        asset = client.get_asset(request=request)
-        
-        asset_dict = MessageToDict(asset._pb, preserving_proto_field_name=True)
-        return asset_dict
-    except NotFound:
-        print(f"Asset '{asset_id}' not found in {project_id}/{location}/{lake_id}/{zone_id}.")
-        return {"error": f"Asset not found: {asset_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error getting asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"API Error getting asset: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error getting asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"Unexpected error getting asset: {str(e)}"}
+    asset = get_dataplex_asset_raw(project_id, location, lake_id, zone_id, asset_id)
+    return _only(fields, asset_to_dict)(asset)
+
+def get_dataplex_asset_raw(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str) -> dataplex_v1.Asset:
+    """
+    Retrieves a Dataplex asset as its message, skipping dict conversion for
+    callers that only read a few attributes (e.g. `asset.state`).
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        lake_id (str): The ID of the parent lake.
+        zone_id (str): The ID of the parent zone.
+        asset_id (str): The ID of the asset.
+
+    Returns:
+        dataplex_v1.Asset: The asset message, owned by the caller even when
+        served from the get cache.
+
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call (e.g. NotFound).
+    """
+    name = _asset_path(project_id, location, lake_id, zone_id, asset_id)
+    return _cached_get(name, lambda: _get_client().get_asset(name=name, retry=_READ_RETRY))
 
-def list_dataplex_assets(project_id: str, location: str, lake_id: str, zone_id: str, filter_str: str):
+def iter_dataplex_assets(project_id: str, location: str, lake_id: str, zone_id: str, filter_str: str = "",
+                         fields: list[str] | None = None) -> Iterator[dict]:
+    """
+    Lazily yields Dataplex assets as the pager fetches them, so callers can
+    act on the first assets without waiting for (or holding) the whole listing.
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        lake_id (str): The ID of the parent lake.
+        zone_id (str): The ID of the parent zone.
+        filter_str (str, optional): A filter string (e.g., 'resource_spec.type = STORAGE_BUCKET'). Defaults to no filter.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
+
+    Yields:
+        dict: Info about one asset.
+
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call.
+    """
+    parent = _zone_path(project_id, location, lake_id, zone_id)
+    request = _ListAssetsRequest.wrap(_ListAssetsPb(parent=parent, filter=filter_str))
+    yield from map(_only(fields, asset_to_dict), _get_client().list_assets(request=request, retry=_READ_RETRY))
+
+@_dataplex_errors("listing", "assets", not_found="Parent zone not found: {zone_id}", many=True)
+def list_dataplex_assets(project_id: str, location: str, lake_id: str, zone_id: str, filter_str: str, max_parallelism: int = 4,
+                         fields: Optional[list[str]] = None, return_format: str = "dict"):  # noqa: UP045
     """
     Lists Dataplex assets within a specific zone.
 
@@ -494,36 +891,29 @@ def list_dataplex_assets(project_id: str, location: str, lake_id: str, zone_id:
         lake_id (str): The ID of the parent lake.
         zone_id (str): The ID of the parent zone.
         filter_str (str, optional): A filter string (e.g., 'resource_spec.type = STORAGE_BUCKET'). Defaults to None.
+        max_parallelism (int, optional): Number of worker threads converting pages. Defaults to 4.
+        fields (list[str], optional): Field paths to return (e.g., ['name', 'state']). Defaults to all fields.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing info about an asset,
-              or a list containing a single error dictionary.
+              or a list containing a single error dictionary. With return_format='json'
+              the list is returned as a JSON string.
     """
-    assets_list = []
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.zone_path(project_id, location, lake_id, zone_id)
-        request = dataplex_v1.ListAssetsRequest(parent=parent, filter=filter_str)
-
-        for asset in client.list_assets(request=request):
-            
-            asset_dict = MessageToDict(asset._pb, preserving_proto_field_name=True)
-            assets_list.append(asset_dict)
-
-        if not assets_list:
-             print(f"No assets found in {project_id}/{location}/{lake_id}/{zone_id} matching filter '{filter_str}'.")
-        return assets_list
-
-    except NotFound: # If the parent zone doesn't exist
-        print(f"Zone '{zone_id}' not found in {project_id}/{location}/{lake_id} when listing assets.")
-        return [{"error": f"Parent zone not found: {zone_id}"}]
-    except GoogleAPICallError as e:
-        print(f"API Error listing assets in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return [{"error": f"API Error listing assets: {e.message}"}]
-    except Exception as e:
-        print(f"Unexpected error listing assets in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return [{"error": f"Unexpected error listing assets: {str(e)}"}]
+    encode = _result_encoder(return_format)
+    client = _get_client()
+    parent = _zone_path(project_id, location, lake_id, zone_id)
+    request = _ListAssetsRequest.wrap(_ListAssetsPb(parent=parent, filter=filter_str))
+
+    pages = client.list_assets(request=request, retry=_READ_RETRY).pages
+    assets_list = _convert_pages(pages, lambda page: page.assets, _only(fields, asset_to_dict), max_parallelism)
+
+    if not assets_list:
+        logger.info("No assets found in %s/%s/%s/%s matching filter '%s'.", project_id, location, lake_id, zone_id, filter_str)
+    return encode(assets_list)
 
+@_dataplex_errors("updating", "asset", not_found="Asset not found for update: {asset_id}")
 def update_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str, update_mask: list[str], updated_asset_details: dict):
     """
     Updates a Dataplex asset.
@@ -540,38 +930,26 @@ def update_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id:
     Returns:
         dict: A dictionary containing the LRO details for the update operation or an error.
     """
+    client = _get_client()
+    asset_name = _asset_path(project_id, location, lake_id, zone_id, asset_id)
+
+    asset_obj = _Asset(name=asset_name)
+    _apply_paths(asset_obj, update_mask, updated_asset_details)
+    field_mask = field_mask_pb2.FieldMask(paths=update_mask)
+
+    request = _UpdateAssetRequest(
+        asset=asset_obj,
+        update_mask=field_mask,
+    )
+    operation = client.update_asset(request=request, retry=_WRITE_RETRY)
+    _invalidate(asset_name)
+
     try:
-        client = dataplex_v1.DataplexServiceClient()
-        asset_name = client.asset_path(project_id, location, lake_id, zone_id, asset_id)
-
-        # Handle 'type' keyword conflict if present (though resource_spec is immutable)
-        if 'resource_spec' in updated_asset_details and 'type' in updated_asset_details['resource_spec']:
-             updated_asset_details['resource_spec']['type_'] = updated_asset_details['resource_spec'].pop('type')
-
-        asset_obj = dataplex_v1.Asset(name=asset_name, **updated_asset_details)
-        field_mask = field_mask_pb2.FieldMask(paths=update_mask)
-
-        request = dataplex_v1.UpdateAssetRequest(
-            asset=asset_obj,
-            update_mask=field_mask,
-        )
-        operation = client.update_asset(request=request)
-        
         return _handle_lro(operation, f"asset update for '{asset_id}'")
+    finally:
+        _invalidate(asset_name)
 
-    except NotFound:
-        print(f"Asset '{asset_id}' not found for update in {project_id}/{location}/{lake_id}/{zone_id}.")
-        return {"error": f"Asset not found for update: {asset_id}"}
-    except InvalidArgument as e:
-        print(f"Invalid argument updating asset {asset_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error updating asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"API Error updating asset: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error updating asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"Unexpected error updating asset: {str(e)}"}
-
+@_dataplex_errors("deleting", "asset", not_found="Asset not found for deletion: {asset_id}")
 def delete_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str):
     """
     Deletes a Dataplex asset.
@@ -586,26 +964,19 @@ def delete_dataplex_asset(project_id: str, location: str, lake_id: str, zone_id:
     Returns:
         dict: A dictionary containing the LRO details for the deletion operation or an error.
     """
+    client = _get_client()
+    name = _asset_path(project_id, location, lake_id, zone_id, asset_id)
+    operation = client.delete_asset(name=name, retry=_WRITE_RETRY)
+    _invalidate(name)
+
     try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.asset_path(project_id, location, lake_id, zone_id, asset_id)
-        request = dataplex_v1.DeleteAssetRequest(name=name)
-        operation = client.delete_asset(request=request)
-        
         return _handle_lro(operation, f"asset deletion for '{asset_id}'")
-
-    except NotFound:
-        print(f"Asset '{asset_id}' not found for deletion in {project_id}/{location}/{lake_id}/{zone_id}.")
-        return {"error": f"Asset not found for deletion: {asset_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error deleting asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"API Error deleting asset: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error deleting asset {asset_id} in {project_id}/{location}/{lake_id}/{zone_id}: {e}")
-        return {"error": f"Unexpected error deleting asset: {str(e)}"}
+    finally:
+        _invalidate(name)
 
 # --- Task Operations ---
 
+@_dataplex_errors("creating", "task")
 def create_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str, task_details: dict):
     """
     Creates a Dataplex task within a lake.
@@ -624,35 +995,21 @@ def create_dataplex_task(project_id: str, location: str, lake_id: str, task_id:
     Returns:
         dict: A dictionary containing the LRO details for the creation operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.lake_path(project_id, location, lake_id)
-
-        # Handle 'type' keyword conflict in trigger_spec
-        if 'trigger_spec' in task_details and 'type' in task_details['trigger_spec']:
-            task_details['trigger_spec']['type_'] = task_details['trigger_spec'].pop('type')
-
-        task_obj = dataplex_v1.Task(**task_details)
-
-        request = dataplex_v1.CreateTaskRequest(
-            parent=parent,
-            task_id=task_id,
-            task=task_obj,
-        )
-        operation = client.create_task(request=request)
-        
-        return _handle_lro(operation, f"task creation for '{task_id}' in lake '{lake_id}'")
-
-    except InvalidArgument as e:
-        print(f"Invalid argument creating task {task_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error creating task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error creating task: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error creating task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error creating task: {str(e)}"}
+    client = _get_client()
+    parent = _lake_path(project_id, location, lake_id)
+
+    task_obj = _Task(**_rename_type(task_details, 'trigger_spec'))
 
+    request = _CreateTaskRequest(
+        parent=parent,
+        task_id=task_id,
+        task=task_obj,
+    )
+    operation = client.create_task(request=request, retry=_WRITE_RETRY)
+    
+    return _handle_lro(operation, f"task creation for '{task_id}' in lake '{lake_id}'")
+
+@_dataplex_errors("getting", "task", not_found="Task not found: {task_id}")
 def get_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str):
     """
     Retrieves details of a specific Dataplex task.
@@ -666,25 +1023,15 @@ def get_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str
     Returns:
         dict: A dictionary containing task details or an error message.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.task_path(project_id, location, lake_id, task_id)
-        request = dataplex_v1.GetTaskRequest(name=name)
-        task = client.get_task(request=request)
-        
-        task_dict = MessageToDict(task._pb, preserving_proto_field_name=True)
-        return task_dict
-    except NotFound:
-        print(f"Task '{task_id}' not found in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Task not found: {task_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error getting task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error getting task: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error getting task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error getting task: {str(e)}"}
+    client = _get_client()
+    name = _task_path(project_id, location, lake_id, task_id)
+    task = client.get_task(name=name, retry=_READ_RETRY)
+    
+    task_dict = task_to_dict(task)
+    return task_dict
 
-def list_dataplex_tasks(project_id: str, location: str, lake_id: str, filter_str: str):
+@_dataplex_errors("listing", "tasks", not_found="Parent lake not found: {lake_id}", many=True)
+def list_dataplex_tasks(project_id: str, location: str, lake_id: str, filter_str: str, max_parallelism: int = 4, return_format: str = "dict"):
     """
     Lists Dataplex tasks within a specific lake.
 
@@ -693,36 +1040,28 @@ def list_dataplex_tasks(project_id: str, location: str, lake_id: str, filter_str
         location (str): The Google Cloud location (e.g., 'us-central1').
         lake_id (str): The ID of the parent lake.
         filter_str (str, optional): A filter string (e.g., 'state = ACTIVE'). Defaults to None.
+        max_parallelism (int, optional): Number of worker threads converting pages. Defaults to 4.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing info about a task,
-              or a list containing a single error dictionary.
+              or a list containing a single error dictionary. With return_format='json'
+              the list is returned as a JSON string.
     """
-    tasks_list = []
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.lake_path(project_id, location, lake_id)
-        request = dataplex_v1.ListTasksRequest(parent=parent, filter=filter_str)
-
-        for task in client.list_tasks(request=request):
-            
-            task_dict = MessageToDict(task._pb, preserving_proto_field_name=True)
-            tasks_list.append(task_dict)
-
-        if not tasks_list:
-             print(f"No tasks found in {project_id}/{location}/{lake_id} matching filter '{filter_str}'.")
-        return tasks_list
-
-    except NotFound: # If the parent lake doesn't exist
-        print(f"Lake '{lake_id}' not found in {project_id}/{location} when listing tasks.")
-        return [{"error": f"Parent lake not found: {lake_id}"}]
-    except GoogleAPICallError as e:
-        print(f"API Error listing tasks in {project_id}/{location}/{lake_id}: {e}")
-        return [{"error": f"API Error listing tasks: {e.message}"}]
-    except Exception as e:
-        print(f"Unexpected error listing tasks in {project_id}/{location}/{lake_id}: {e}")
-        return [{"error": f"Unexpected error listing tasks: {str(e)}"}]
+    encode = _result_encoder(return_format)
+    client = _get_client()
+    parent = _lake_path(project_id, location, lake_id)
+    request = _ListTasksRequest(parent=parent, filter=filter_str)
+
+    pages = client.list_tasks(request=request, retry=_READ_RETRY).pages
+    tasks_list = _convert_pages(pages, lambda page: page.tasks, task_to_dict, max_parallelism)
+
+    if not tasks_list:
+        logger.info("No tasks found in %s/%s/%s matching filter '%s'.", project_id, location, lake_id, filter_str)
+    return encode(tasks_list)
 
+@_dataplex_errors("updating", "task", not_found="Task not found for update: {task_id}")
 def update_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str, update_mask: list[str], updated_task_details: dict):
     """
     Updates a Dataplex task.
@@ -738,38 +1077,24 @@ def update_dataplex_task(project_id: str, location: str, lake_id: str, task_id:
     Returns:
         dict: A dictionary containing the LRO details for the update operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        task_name = client.task_path(project_id, location, lake_id, task_id)
-
-        # Handle 'type' keyword conflict if present
-        if 'trigger_spec' in updated_task_details and 'type' in updated_task_details['trigger_spec']:
-             updated_task_details['trigger_spec']['type_'] = updated_task_details['trigger_spec'].pop('type')
-
-        task_obj = dataplex_v1.Task(name=task_name, **updated_task_details)
-        field_mask = field_mask_pb2.FieldMask(paths=update_mask)
-
-        request = dataplex_v1.UpdateTaskRequest(
-            task=task_obj,
-            update_mask=field_mask,
-        )
-        operation = client.update_task(request=request)
-        
-        return _handle_lro(operation, f"task update for '{task_id}'")
-
-    except NotFound:
-        print(f"Task '{task_id}' not found for update in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Task not found for update: {task_id}"}
-    except InvalidArgument as e:
-        print(f"Invalid argument updating task {task_id}: {e}")
-        return {"error": f"Invalid argument: {e.message}"}
-    except GoogleAPICallError as e:
-        print(f"API Error updating task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error updating task: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error updating task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error updating task: {str(e)}"}
+    client = _get_client()
+    task_name = _task_path(project_id, location, lake_id, task_id)
+
+    task_obj = _Task(name=task_name)
+    # The rename only matters when the whole trigger_spec is replaced; nested
+    # 'type' leaves are mapped to 'type_' by _apply_paths itself
+    _apply_paths(task_obj, update_mask, _rename_type(updated_task_details, 'trigger_spec'))
+    field_mask = field_mask_pb2.FieldMask(paths=update_mask)
+
+    request = _UpdateTaskRequest(
+        task=task_obj,
+        update_mask=field_mask,
+    )
+    operation = client.update_task(request=request, retry=_WRITE_RETRY)
+    
+    return _handle_lro(operation, f"task update for '{task_id}'")
 
+@_dataplex_errors("deleting", "task", not_found="Task not found for deletion: {task_id}")
 def delete_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str):
     """
     Deletes a Dataplex task.
@@ -783,24 +1108,13 @@ def delete_dataplex_task(project_id: str, location: str, lake_id: str, task_id:
     Returns:
         dict: A dictionary containing the LRO details for the deletion operation or an error.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.task_path(project_id, location, lake_id, task_id)
-        request = dataplex_v1.DeleteTaskRequest(name=name)
-        operation = client.delete_task(request=request)
-        
-        return _handle_lro(operation, f"task deletion for '{task_id}'")
-
-    except NotFound:
-        print(f"Task '{task_id}' not found for deletion in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Task not found for deletion: {task_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error deleting task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error deleting task: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error deleting task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error deleting task: {str(e)}"}
+    client = _get_client()
+    name = _task_path(project_id, location, lake_id, task_id)
+    operation = client.delete_task(name=name, retry=_WRITE_RETRY)
+    
+    return _handle_lro(operation, f"task deletion for '{task_id}'")
 
+@_dataplex_errors("running", "task", not_found="Task not found for run: {task_id}")
 def run_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str):
     """
     Runs an on-demand execution of a Dataplex task.
@@ -814,25 +1128,15 @@ def run_dataplex_task(project_id: str, location: str, lake_id: str, task_id: str
     Returns:
         dict: A dictionary containing the job details of the initiated run or an error message.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.task_path(project_id, location, lake_id, task_id)
-        request = dataplex_v1.RunTaskRequest(name=name)
-        response = client.run_task(request=request)
-        print(f"Successfully initiated run for task '{task_id}'. Job ID: {response.job.name.split('/')[-1]}")
-        job_dict = MessageToDict(response.job._pb, preserving_proto_field_name=True)
-        
-        return {"status": "started", "job": job_dict}
-    except NotFound:
-        print(f"Task '{task_id}' not found for run in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Task not found for run: {task_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error running task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"API Error running task: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error running task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return {"error": f"Unexpected error running task: {str(e)}"}
+    client = _get_client()
+    name = _task_path(project_id, location, lake_id, task_id)
+    response = client.run_task(name=name)
+    logger.info("Successfully initiated run for task '%s'. Job ID: %s", task_id, response.job.name.rpartition('/')[2])
+    job_dict = job_to_dict(response.job)
+    
+    return {"status": "started", "job": job_dict}
 
+@_dataplex_errors("getting", "job", not_found="Job not found: {job_id}")
 def get_dataplex_job(project_id: str, location: str, lake_id: str, task_id: str, job_id: str):
     """
     Retrieves details of a specific Dataplex job (task run).
@@ -847,25 +1151,15 @@ def get_dataplex_job(project_id: str, location: str, lake_id: str, task_id: str,
     Returns:
         dict: A dictionary containing job details or an error message.
     """
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.job_path(project_id, location, lake_id, task_id, job_id)
-        request = dataplex_v1.GetJobRequest(name=name)
-        job = client.get_job(request=request)
-        
-        job_dict = MessageToDict(job._pb, preserving_proto_field_name=True)
-        return job_dict
-    except NotFound:
-        print(f"Job '{job_id}' not found for task '{task_id}' in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Job not found: {job_id}"}
-    except GoogleAPICallError as e:
-        print(f"API Error getting job {job_id} in {project_id}/{location}/{lake_id}/{task_id}: {e}")
-        return {"error": f"API Error getting job: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error getting job {job_id} in {project_id}/{location}/{lake_id}/{task_id}: {e}")
-        return {"error": f"Unexpected error getting job: {str(e)}"}
+    client = _get_client()
+    name = _job_path(project_id, location, lake_id, task_id, job_id)
+    job = client.get_job(name=name, retry=_READ_RETRY)
+    
+    job_dict = job_to_dict(job)
+    return job_dict
 
-def list_dataplex_jobs(project_id: str, location: str, lake_id: str, task_id: str):
+@_dataplex_errors("listing", "jobs", not_found="Parent task not found: {task_id}", many=True)
+def list_dataplex_jobs(project_id: str, location: str, lake_id: str, task_id: str, max_parallelism: int = 4, return_format: str = "dict"):
     """
     Lists Dataplex jobs (task runs) for a specific task.
 
@@ -874,36 +1168,28 @@ def list_dataplex_jobs(project_id: str, location: str, lake_id: str, task_id: st
         location (str): The Google Cloud location (e.g., 'us-central1').
         lake_id (str): The ID of the parent lake.
         task_id (str): The ID of the parent task.
+        max_parallelism (int, optional): Number of worker threads converting pages. Defaults to 4.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing info about a job,
-              or a list containing a single error dictionary.
+              or a list containing a single error dictionary. With return_format='json'
+              the list is returned as a JSON string.
     """
-    jobs_list = []
-    try:
-        client = dataplex_v1.DataplexServiceClient()
-        parent = client.task_path(project_id, location, lake_id, task_id)
-        request = dataplex_v1.ListJobsRequest(parent=parent)
-
-        for job in client.list_jobs(request=request):
-            
-            job_dict = MessageToDict(job._pb, preserving_proto_field_name=True)
-            jobs_list.append(job_dict)
-
-        if not jobs_list:
-             print(f"No jobs found for task '{task_id}' in {project_id}/{location}/{lake_id}.")
-        return jobs_list
-
-    except NotFound: # If the parent task doesn't exist
-        print(f"Task '{task_id}' not found in {project_id}/{location}/{lake_id} when listing jobs.")
-        return [{"error": f"Parent task not found: {task_id}"}]
-    except GoogleAPICallError as e:
-        print(f"API Error listing jobs for task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return [{"error": f"API Error listing jobs: {e.message}"}]
-    except Exception as e:
-        print(f"Unexpected error listing jobs for task {task_id} in {project_id}/{location}/{lake_id}: {e}")
-        return [{"error": f"Unexpected error listing jobs: {str(e)}"}]
+    encode = _result_encoder(return_format)
+    client = _get_client()
+    parent = _task_path(project_id, location, lake_id, task_id)
+    request = _ListJobsRequest(parent=parent)
 
+    pages = client.list_jobs(request=request, retry=_READ_RETRY).pages
+    jobs_list = _convert_pages(pages, lambda page: page.jobs, job_to_dict, max_parallelism)
+
+    if not jobs_list:
+        logger.info("No jobs found for task '%s' in %s/%s/%s.", task_id, project_id, location, lake_id)
+    return encode(jobs_list)
+
+@_dataplex_errors("cancelling", "job", not_found="Job not found for cancellation: {job_id}")
 def cancel_dataplex_job(project_id: str, location: str, lake_id: str, task_id: str, job_id: str):
     """
     Cancels a running Dataplex job (task run).
@@ -918,24 +1204,286 @@ def cancel_dataplex_job(project_id: str, location: str, lake_id: str, task_id: s
     Returns:
         dict: An empty dictionary on success, or a dictionary with an error message.
     """
+    client = _get_client()
+    name = _job_path(project_id, location, lake_id, task_id, job_id)
     try:
-        client = dataplex_v1.DataplexServiceClient()
-        name = client.job_path(project_id, location, lake_id, task_id, job_id)
-        request = dataplex_v1.CancelJobRequest(name=name)
-        client.cancel_job(request=request) # Returns None on success
-        
-        print(f"Successfully requested cancellation for job '{job_id}'.")
-        return {"status": "cancellation_requested"}
-    except NotFound:
-        print(f"Job '{job_id}' not found for cancellation for task '{task_id}' in {project_id}/{location}/{lake_id}.")
-        return {"error": f"Job not found for cancellation: {job_id}"}
+        client.cancel_job(name=name, retry=_WRITE_RETRY) # Returns None on success
     except GoogleAPICallError as e:
-         # Check if the error is because the job is already done (common case)
+        # Check if the error is because the job is already done (common case)
         if e.code == 400 and ("invalid state" in str(e).lower() or "terminal state" in str(e).lower()):
-             print(f"Job {job_id} is likely already in a terminal state and cannot be cancelled.")
-             return {"error": f"Job {job_id} is already in a terminal state."}
-        print(f"API Error cancelling job {job_id} in {project_id}/{location}/{lake_id}/{task_id}: {e}")
-        return {"error": f"API Error cancelling job: {e.message}"}
-    except Exception as e:
-        print(f"Unexpected error cancelling job {job_id} in {project_id}/{location}/{lake_id}/{task_id}: {e}")
-        return {"error": f"Unexpected error cancelling job: {str(e)}"}
\ No newline at end of file
+            logger.info("Job %s is likely already in a terminal state and cannot be cancelled.", job_id)
+            return {"error": f"Job {job_id} is already in a terminal state."}
+        raise
+
+    logger.info("Successfully requested cancellation for job '%s'.", job_id)
+    return {"status": "cancellation_requested"}
+
+# --- Async Variants ---
+# grpc.aio channels belong to the event loop they were created on, so one
+# async client is kept per running loop and shared by every coroutine on it.
+# Independent calls can then overlap their round trips, e.g.
+# `await asyncio.gather(get_dataplex_lake_async(...), get_dataplex_zone_async(...))`.
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+
+def _get_async_client() -> dataplex_v1.DataplexServiceAsyncClient:
+    """Returns the DataplexServiceAsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        credentials, _ = default_credentials()
+        channel = DataplexServiceGrpcAsyncIOTransport.create_channel(
+            credentials=credentials, options=_CHANNEL_OPTIONS)
+        client = _ASYNC_CLIENTS[loop] = dataplex_v1.DataplexServiceAsyncClient(
+            transport=DataplexServiceGrpcAsyncIOTransport(channel=channel))
+    return client
+
+async def _handle_lro_async(operation, operation_description: str, debug: bool = False):
+    """Async counterpart of _handle_lro for AsyncOperation results."""
+    exc = await operation.exception()
+    if exc:
+        logger.error("Error during %s: %s", operation_description, exc)
+        return {"error": f"Error during {operation_description}: {exc}"}
+    logger.info("Initiated %s. Operation: %s", operation_description, operation.operation.name)
+
+    return _pending_result(operation, debug)
+
+@_dataplex_errors("creating", "lake")
+async def create_dataplex_lake_async(project_id: str, location: str, lake_id: str, lake_details: dict):
+    """Async variant of create_dataplex_lake; arguments and result are the same."""
+    client = _get_async_client()
+    parent = _common_location_path(project_id, location)
+    request = _CreateLakeRequest(
+        parent=parent,
+        lake_id=lake_id,
+        lake=_Lake(lake_details),
+    )
+    operation = await client.create_lake(request=request, retry=_WRITE_RETRY_ASYNC)
+
+    return await _handle_lro_async(operation, f"lake creation for '{lake_id}'")
+
+@_dataplex_errors("getting", "lake", not_found="Lake not found: {lake_id}")
+async def get_dataplex_lake_async(project_id: str, location: str, lake_id: str):
+    """Async variant of get_dataplex_lake; arguments and result are the same."""
+    client = _get_async_client()
+    name = _lake_path(project_id, location, lake_id)
+    lake = await client.get_lake(name=name, retry=_READ_RETRY_ASYNC)
+
+    return lake_to_dict(lake)
+
+@_dataplex_errors("deleting", "lake", not_found="Lake not found for deletion: {lake_id}")
+async def delete_dataplex_lake_async(project_id: str, location: str, lake_id: str):
+    """Async variant of delete_dataplex_lake; arguments and result are the same."""
+    client = _get_async_client()
+    name = _lake_path(project_id, location, lake_id)
+    operation = await client.delete_lake(name=name, retry=_WRITE_RETRY_ASYNC)
+    _invalidate(name)
+
+    try:
+        return await _handle_lro_async(operation, f"lake deletion for '{lake_id}'")
+    finally:
+        _invalidate(name)
+
+@_dataplex_errors("creating", "zone")
+async def create_dataplex_zone_async(project_id: str, location: str, lake_id: str, zone_id: str, zone_details: dict):
+    """Async variant of create_dataplex_zone; arguments and result are the same."""
+    client = _get_async_client()
+    parent = _lake_path(project_id, location, lake_id)
+
+    request = _CreateZoneRequest(
+        parent=parent,
+        zone_id=zone_id,
+        zone=_Zone(**_rename_type(zone_details)),
+    )
+    operation = await client.create_zone(request=request, retry=_WRITE_RETRY_ASYNC)
+
+    return await _handle_lro_async(operation, f"zone creation for '{zone_id}' in lake '{lake_id}'")
+
+@_dataplex_errors("getting", "zone", not_found="Zone not found: {zone_id}")
+async def get_dataplex_zone_async(project_id: str, location: str, lake_id: str, zone_id: str):
+    """Async variant of get_dataplex_zone; arguments and result are the same."""
+    client = _get_async_client()
+    name = _zone_path(project_id, location, lake_id, zone_id)
+    zone = await client.get_zone(name=name, retry=_READ_RETRY_ASYNC)
+
+    return zone_to_dict(zone)
+
+@_dataplex_errors("deleting", "zone", not_found="Zone not found for deletion: {zone_id}")
+async def delete_dataplex_zone_async(project_id: str, location: str, lake_id: str, zone_id: str):
+    """Async variant of delete_dataplex_zone; arguments and result are the same."""
+    client = _get_async_client()
+    name = _zone_path(project_id, location, lake_id, zone_id)
+    operation = await client.delete_zone(name=name, retry=_WRITE_RETRY_ASYNC)
+    _invalidate(name)
+
+    try:
+        return await _handle_lro_async(operation, f"zone deletion for '{zone_id}'")
+    finally:
+        _invalidate(name)
+
+@_dataplex_errors("creating", "asset")
+async def create_dataplex_asset_async(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str, asset_details: dict):
+    """Async variant of create_dataplex_asset; arguments and result are the same."""
+    client = _get_async_client()
+    parent = _zone_path(project_id, location, lake_id, zone_id)
+
+    request = _CreateAssetRequest(
+        parent=parent,
+        asset_id=asset_id,
+        asset=_Asset(**_rename_type(asset_details, 'resource_spec')),
+    )
+    operation = await client.create_asset(request=request, retry=_WRITE_RETRY_ASYNC)
+
+    return await _handle_lro_async(operation, f"asset creation for '{asset_id}' in zone '{zone_id}'")
+
+@_dataplex_errors("getting", "asset", not_found="Asset not found: {asset_id}")
+async def get_dataplex_asset_async(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str):
+    """Async variant of get_dataplex_asset; arguments and result are the same."""
+    client = _get_async_client()
+    name = _asset_path(project_id, location, lake_id, zone_id, asset_id)
+    asset = await client.get_asset(name=name, retry=_READ_RETRY_ASYNC)
+
+    return asset_to_dict(asset)
+
+@_dataplex_errors("deleting", "asset", not_found="Asset not found for deletion: {asset_id}")
+async def delete_dataplex_asset_async(project_id: str, location: str, lake_id: str, zone_id: str, asset_id: str):
+    """Async variant of delete_dataplex_asset; arguments and result are the same."""
+    client = _get_async_client()
+    name = _asset_path(project_id, location, lake_id, zone_id, asset_id)
+    operation = await client.delete_asset(name=name, retry=_WRITE_RETRY_ASYNC)
+    _invalidate(name)
+
+    try:
+        return await _handle_lro_async(operation, f"asset deletion for '{asset_id}'")
+    finally:
+        _invalidate(name)
+
+@_dataplex_errors("creating", "task")
+async def create_dataplex_task_async(project_id: str, location: str, lake_id: str, task_id: str, task_details: dict):
+    """Async variant of create_dataplex_task; arguments and result are the same."""
+    client = _get_async_client()
+    parent = _lake_path(project_id, location, lake_id)
+
+    request = _CreateTaskRequest(
+        parent=parent,
+        task_id=task_id,
+        task=_Task(**_rename_type(task_details, 'trigger_spec')),
+    )
+    operation = await client.create_task(request=request, retry=_WRITE_RETRY_ASYNC)
+
+    return await _handle_lro_async(operation, f"task creation for '{task_id}' in lake '{lake_id}'")
+
+@_dataplex_errors("getting", "task", not_found="Task not found: {task_id}")
+async def get_dataplex_task_async(project_id: str, location: str, lake_id: str, task_id: str):
+    """Async variant of get_dataplex_task; arguments and result are the same."""
+    client = _get_async_client()
+    name = _task_path(project_id, location, lake_id, task_id)
+    task = await client.get_task(name=name, retry=_READ_RETRY_ASYNC)
+
+    return task_to_dict(task)
+
+async def get_many_dataplex_tasks_async(project_id: str, location: str, lake_id: str, task_ids: list[str]):
+    """
+    Retrieves several Dataplex tasks of one lake concurrently.
+
+    The gets are issued together over the shared async client instead of one
+    after another, so the whole batch costs roughly one round trip.
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        location (str): The Google Cloud location (e.g., 'us-central1').
+        lake_id (str): The ID of the parent lake.
+        task_ids (list[str]): The IDs of the tasks to retrieve.
+
+    Returns:
+        list: One dictionary per task ID, in the same order, containing the task
+              details or an error message for that task.
+    """
+    return list(await asyncio.gather(
+        *(get_dataplex_task_async(project_id, location, lake_id, task_id) for task_id in task_ids)))
+
+@_dataplex_errors("deleting", "task", not_found="Task not found for deletion: {task_id}")
+async def delete_dataplex_task_async(project_id: str, location: str, lake_id: str, task_id: str):
+    """Async variant of delete_dataplex_task; arguments and result are the same."""
+    client = _get_async_client()
+    name = _task_path(project_id, location, lake_id, task_id)
+    operation = await client.delete_task(name=name, retry=_WRITE_RETRY_ASYNC)
+
+    return await _handle_lro_async(operation, f"task deletion for '{task_id}'")
+
+class BatchingDataplexClient:
+    """Coalesces concurrent get_* lookups into batched fan-outs.
+
+    Dataplex has no batch Get RPC, so gets issued within linger_ms of each
+    other are collected and sent together with asyncio.gather over the shared
+    async client, at most max_concurrency at a time. Concurrent gets for the
+    same resource name share a single RPC. Results are the raw messages (e.g.
+    dataplex_v1.Lake); errors are raised to every caller waiting on that name.
+
+    An instance belongs to the event loop it is first used on, e.g.
+        batcher = BatchingDataplexClient()
+        lakes = await asyncio.gather(*(batcher.get_lake(name) for name in names))
+    """
+
+    def __init__(self, linger_ms: float = 5.0, max_concurrency: int = 32):
+        self._linger = linger_ms / 1000
+        self._limit = asyncio.Semaphore(max_concurrency)
+        self._in_flight = {}  # (rpc, name) -> Future shared by every caller
+        self._queue = []      # (rpc, name) keys waiting for the next flush
+        self._flush_handle = None
+        self._batches = set()  # Keeps running batch tasks referenced
+
+    async def get_lake(self, name: str) -> dataplex_v1.Lake:
+        return await self._get("get_lake", name)
+
+    async def get_zone(self, name: str) -> dataplex_v1.Zone:
+        return await self._get("get_zone", name)
+
+    async def get_asset(self, name: str) -> dataplex_v1.Asset:
+        return await self._get("get_asset", name)
+
+    async def get_task(self, name: str) -> dataplex_v1.Task:
+        return await self._get("get_task", name)
+
+    async def get_job(self, name: str) -> dataplex_v1.Job:
+        return await self._get("get_job", name)
+
+    async def _get(self, rpc: str, name: str):
+        key = (rpc, name)
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._in_flight[key] = loop.create_future()
+            self._queue.append(key)
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self._linger, self._flush)
+        # Shielded so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        batch, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._send(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _send(self, batch: list) -> None:
+        try:
+            client = _get_async_client()
+        except Exception as e:
+            # No RPC will run for this batch, so fail its waiters here
+            for key in batch:
+                self._in_flight.pop(key).set_exception(e)
+            return
+        await asyncio.gather(*(self._call(client, rpc, name) for rpc, name in batch))
+
+    async def _call(self, client, rpc: str, name: str) -> None:
+        future = self._in_flight[(rpc, name)]
+        try:
+            async with self._limit:
+                result = await getattr(client, rpc)(name=name, retry=_READ_RETRY_ASYNC)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            del self._in_flight[(rpc, name)]
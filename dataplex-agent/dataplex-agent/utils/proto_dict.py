@@ -0,0 +1,273 @@
+# Direct proto -> dict builders for Dataplex resources.
+#
+# MessageToDict discovers fields through descriptor reflection on every call.
+# The builders below read the known fields of Lake/Zone/Asset/Task/Job directly and
+# produce the same output as
+# MessageToDict(msg._pb, preserving_proto_field_name=True): zero values and
+# unset sub-messages are omitted, enums become names, Timestamps/Durations
+# become their JSON strings and int64 values become strings.
+from google.cloud import dataplex_v1
+
+
+def _enum_names(enum_cls) -> dict:
+    return {e.value: e.name for e in enum_cls}
+
+_STATE = _enum_names(dataplex_v1.State)
+_METASTORE_STATE = _enum_names(dataplex_v1.Lake.MetastoreStatus.State)
+_ZONE_TYPE = _enum_names(dataplex_v1.Zone.Type)
+_LOCATION_TYPE = _enum_names(dataplex_v1.Zone.ResourceSpec.LocationType)
+_RESOURCE_TYPE = _enum_names(dataplex_v1.Asset.ResourceSpec.Type)
+_ACCESS_MODE = _enum_names(dataplex_v1.Asset.ResourceSpec.AccessMode)
+_RESOURCE_STATE = _enum_names(dataplex_v1.Asset.ResourceStatus.State)
+_SECURITY_STATE = _enum_names(dataplex_v1.Asset.SecurityStatus.State)
+_DISCOVERY_STATE = _enum_names(dataplex_v1.Asset.DiscoveryStatus.State)
+_TRIGGER_TYPE = _enum_names(dataplex_v1.Task.TriggerSpec.Type)
+_JOB_STATE = _enum_names(dataplex_v1.Job.State)
+_JOB_SERVICE = _enum_names(dataplex_v1.Job.Service)
+_JOB_TRIGGER = _enum_names(dataplex_v1.Job.Trigger)
+
+
+def _raw(msg):
+    """Accepts a proto-plus wrapper or a raw protobuf message."""
+    return getattr(msg, "_pb", msg)
+
+def _scalars(pb, d: dict, *names: str) -> None:
+    """Copies string/bool/int32 fields that are set to a non-zero value."""
+    for n in names:
+        v = getattr(pb, n)
+        if v:
+            d[n] = v
+
+def _enum(pb, d: dict, name: str, names: dict) -> None:
+    v = getattr(pb, name)
+    if v:
+        d[name] = names.get(v, v)
+
+def _oneof(pb, d: dict, *names: str) -> None:
+    """Copies oneof scalar members that are set, even to an empty value."""
+    for n in names:
+        if pb.HasField(n):
+            d[n] = getattr(pb, n)
+
+def _lists(pb, d: dict, *names: str) -> None:
+    for n in names:
+        v = getattr(pb, n)
+        if v:
+            d[n] = list(v)
+
+def _times(pb, d: dict, *names: str) -> None:
+    """Copies Timestamp/Duration fields that are present as JSON strings."""
+    for n in names:
+        if pb.HasField(n):
+            d[n] = getattr(pb, n).ToJsonString()
+
+def _resource_header(pb) -> dict:
+    """Fields shared by Lake, Zone and Asset."""
+    d = {}
+    _scalars(pb, d, "name", "display_name", "uid")
+    _times(pb, d, "create_time", "update_time")
+    if pb.labels:
+        d["labels"] = dict(pb.labels)
+    _scalars(pb, d, "description")
+    _enum(pb, d, "state", _STATE)
+    return d
+
+def _asset_status_to_dict(pb) -> dict:
+    d = {}
+    _times(pb, d, "update_time")
+    _scalars(pb, d, "active_assets", "security_policy_applying_assets")
+    return d
+
+def _discovery_spec_to_dict(pb) -> dict:
+    # Zone.DiscoverySpec and Asset.DiscoverySpec share the same layout.
+    d = {}
+    _scalars(pb, d, "enabled")
+    if pb.include_patterns:
+        d["include_patterns"] = list(pb.include_patterns)
+    if pb.exclude_patterns:
+        d["exclude_patterns"] = list(pb.exclude_patterns)
+    if pb.HasField("csv_options"):
+        csv = {}
+        _scalars(pb.csv_options, csv, "header_rows", "delimiter", "encoding", "disable_type_inference")
+        d["csv_options"] = csv
+    if pb.HasField("json_options"):
+        js = {}
+        _scalars(pb.json_options, js, "encoding", "disable_type_inference")
+        d["json_options"] = js
+    if pb.HasField("schedule"):
+        d["schedule"] = pb.schedule
+    return d
+
+def _execution_spec_to_dict(pb) -> dict:
+    # Shared by Task and Job
+    d = {}
+    if pb.args:
+        d["args"] = dict(pb.args)
+    _scalars(pb, d, "service_account", "project")
+    _times(pb, d, "max_job_execution_lifetime")
+    _scalars(pb, d, "kms_key")
+    return d
+
+def _infrastructure_spec_to_dict(pb) -> dict:
+    d = {}
+    if pb.HasField("batch"):
+        batch = {}
+        _scalars(pb.batch, batch, "executors_count", "max_executors_count")
+        d["batch"] = batch
+    if pb.HasField("container_image"):
+        ci = pb.container_image
+        image = {}
+        _scalars(ci, image, "image")
+        _lists(ci, image, "java_jars", "python_packages")
+        if ci.properties:
+            image["properties"] = dict(ci.properties)
+        d["container_image"] = image
+    if pb.HasField("vpc_network"):
+        vpc = {}
+        _oneof(pb.vpc_network, vpc, "network", "sub_network")
+        _lists(pb.vpc_network, vpc, "network_tags")
+        d["vpc_network"] = vpc
+    return d
+
+
+def lake_to_dict(lake) -> dict:
+    """Converts a Lake message to a plain dict."""
+    pb = _raw(lake)
+    d = _resource_header(pb)
+    _scalars(pb, d, "service_account")
+    if pb.HasField("metastore"):
+        metastore = {}
+        _scalars(pb.metastore, metastore, "service")
+        d["metastore"] = metastore
+    if pb.HasField("asset_status"):
+        d["asset_status"] = _asset_status_to_dict(pb.asset_status)
+    if pb.HasField("metastore_status"):
+        ms = pb.metastore_status
+        status = {}
+        _enum(ms, status, "state", _METASTORE_STATE)
+        _scalars(ms, status, "message")
+        _times(ms, status, "update_time")
+        _scalars(ms, status, "endpoint")
+        d["metastore_status"] = status
+    return d
+
+def zone_to_dict(zone) -> dict:
+    """Converts a Zone message to a plain dict."""
+    pb = _raw(zone)
+    d = _resource_header(pb)
+    _enum(pb, d, "type_", _ZONE_TYPE)
+    if pb.HasField("discovery_spec"):
+        d["discovery_spec"] = _discovery_spec_to_dict(pb.discovery_spec)
+    if pb.HasField("resource_spec"):
+        spec = {}
+        _enum(pb.resource_spec, spec, "location_type", _LOCATION_TYPE)
+        d["resource_spec"] = spec
+    if pb.HasField("asset_status"):
+        d["asset_status"] = _asset_status_to_dict(pb.asset_status)
+    return d
+
+def asset_to_dict(asset) -> dict:
+    """Converts an Asset message to a plain dict."""
+    pb = _raw(asset)
+    d = _resource_header(pb)
+    if pb.HasField("resource_spec"):
+        rs = pb.resource_spec
+        spec = {}
+        _scalars(rs, spec, "name")
+        _enum(rs, spec, "type_", _RESOURCE_TYPE)
+        _enum(rs, spec, "read_access_mode", _ACCESS_MODE)
+        d["resource_spec"] = spec
+    if pb.HasField("resource_status"):
+        rs = pb.resource_status
+        status = {}
+        _enum(rs, status, "state", _RESOURCE_STATE)
+        _scalars(rs, status, "message")
+        _times(rs, status, "update_time")
+        _scalars(rs, status, "managed_access_identity")
+        d["resource_status"] = status
+    if pb.HasField("security_status"):
+        ss = pb.security_status
+        status = {}
+        _enum(ss, status, "state", _SECURITY_STATE)
+        _scalars(ss, status, "message")
+        _times(ss, status, "update_time")
+        d["security_status"] = status
+    if pb.HasField("discovery_spec"):
+        d["discovery_spec"] = _discovery_spec_to_dict(pb.discovery_spec)
+    if pb.HasField("discovery_status"):
+        ds = pb.discovery_status
+        status = {}
+        _enum(ds, status, "state", _DISCOVERY_STATE)
+        _scalars(ds, status, "message")
+        _times(ds, status, "update_time", "last_run_time")
+        if ds.HasField("stats"):
+            # int64 fields are rendered as strings, as MessageToDict does
+            status["stats"] = {n: str(v) for n in ("data_items", "data_size", "tables", "filesets")
+                               if (v := getattr(ds.stats, n))}
+        _times(ds, status, "last_run_duration")
+        d["discovery_status"] = status
+    return d
+
+def task_to_dict(task) -> dict:
+    """Converts a Task message to a plain dict."""
+    pb = _raw(task)
+    d = {}
+    _scalars(pb, d, "name", "uid")
+    _times(pb, d, "create_time", "update_time")
+    _scalars(pb, d, "description", "display_name")
+    _enum(pb, d, "state", _STATE)
+    if pb.labels:
+        d["labels"] = dict(pb.labels)
+    if pb.HasField("trigger_spec"):
+        ts = pb.trigger_spec
+        trigger = {}
+        _enum(ts, trigger, "type_", _TRIGGER_TYPE)
+        _times(ts, trigger, "start_time")
+        _scalars(ts, trigger, "disabled", "max_retries")
+        _oneof(ts, trigger, "schedule")
+        d["trigger_spec"] = trigger
+    if pb.HasField("execution_spec"):
+        d["execution_spec"] = _execution_spec_to_dict(pb.execution_spec)
+    if pb.HasField("execution_status"):
+        es = pb.execution_status
+        status = {}
+        _times(es, status, "update_time")
+        if es.HasField("latest_job"):
+            status["latest_job"] = job_to_dict(es.latest_job)
+        d["execution_status"] = status
+    if pb.HasField("spark"):
+        sp = pb.spark
+        spark = {}
+        _oneof(sp, spark, "main_jar_file_uri", "main_class", "python_script_file",
+               "sql_script_file", "sql_script")
+        _lists(sp, spark, "file_uris", "archive_uris")
+        if sp.HasField("infrastructure_spec"):
+            spark["infrastructure_spec"] = _infrastructure_spec_to_dict(sp.infrastructure_spec)
+        d["spark"] = spark
+    if pb.HasField("notebook"):
+        nb = pb.notebook
+        notebook = {}
+        _scalars(nb, notebook, "notebook")
+        if nb.HasField("infrastructure_spec"):
+            notebook["infrastructure_spec"] = _infrastructure_spec_to_dict(nb.infrastructure_spec)
+        _lists(nb, notebook, "file_uris", "archive_uris")
+        d["notebook"] = notebook
+    return d
+
+def job_to_dict(job) -> dict:
+    """Converts a Job message to a plain dict."""
+    pb = _raw(job)
+    d = {}
+    _scalars(pb, d, "name", "uid")
+    _times(pb, d, "start_time", "end_time")
+    _enum(pb, d, "state", _JOB_STATE)
+    # uint32, so it stays an int
+    _scalars(pb, d, "retry_count")
+    _enum(pb, d, "service", _JOB_SERVICE)
+    _scalars(pb, d, "service_job", "message")
+    if pb.labels:
+        d["labels"] = dict(pb.labels)
+    _enum(pb, d, "trigger", _JOB_TRIGGER)
+    if pb.HasField("execution_spec"):
+        d["execution_spec"] = _execution_spec_to_dict(pb.execution_spec)
+    return d
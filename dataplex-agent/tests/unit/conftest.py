@@ -0,0 +1,38 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Makes the agent's utils modules importable as `agent_utils.<module>`, and the
+agent package itself as `agent_app.<module>`.
+
+The agent package directory is not a valid identifier, and its modules use
+relative imports, so they are registered under synthetic packages.
+"""
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+_APP = Path(__file__).resolve().parents[2] / "dataplex-agent"
+
+
+def _register(name: str, path: Path) -> None:
+    if name not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+        spec.submodule_search_locations = [str(path)]
+        sys.modules[name] = importlib.util.module_from_spec(spec)
+
+
+_register("agent_utils", _APP / "utils")
+_register("agent_app", _APP)
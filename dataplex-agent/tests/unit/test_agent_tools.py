@@ -0,0 +1,44 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks that google-adk can build a function declaration for every agent tool.
+"""
+
+import importlib
+import os
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from google.adk.tools._automatic_function_calling_util import (
+    build_function_declaration,
+)
+
+
+@pytest.fixture(scope="module")
+def agent():
+    os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "test-project")
+    return importlib.import_module("agent_app.agent")
+
+
+def test_every_tool_builds_a_declaration(agent):
+    failures = {}
+    for tool in agent._TOOLS:
+        try:
+            build_function_declaration(
+                func=tool, ignore_params=["tool_context", "input_stream"])
+        except Exception as e:
+            failures[tool.__name__] = repr(e)
+    assert not failures
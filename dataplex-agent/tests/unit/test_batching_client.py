@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks BatchingDataplexClient's deduplication and error fan-out.
+"""
+
+import asyncio
+
+import pytest
+from agent_utils import dataplex_service_tools as tools
+from google.api_core.exceptions import NotFound
+from google.cloud import dataplex_v1
+
+
+class _FakeAsyncClient:
+    """Returns a Lake for every name except those in missing, counting calls per name."""
+
+    def __init__(self, missing: frozenset = frozenset()) -> None:
+        self.calls = {}
+        self._missing = missing
+
+    async def get_lake(self, name: str, retry=None) -> dataplex_v1.Lake:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        await asyncio.sleep(0)
+        if name in self._missing:
+            raise NotFound(name)
+        return dataplex_v1.Lake(name=name)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_for_one_name_share_an_rpc(monkeypatch) -> None:
+    client = _FakeAsyncClient()
+    monkeypatch.setattr(tools, "_get_async_client", lambda: client)
+    batcher = tools.BatchingDataplexClient(linger_ms=1)
+
+    lakes = await asyncio.gather(
+        batcher.get_lake("lakes/a"), batcher.get_lake("lakes/a"), batcher.get_lake("lakes/b"))
+
+    assert [lake.name for lake in lakes] == ["lakes/a", "lakes/a", "lakes/b"]
+    assert client.calls == {"lakes/a": 1, "lakes/b": 1}
+    assert batcher._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_for_that_name(monkeypatch) -> None:
+    client = _FakeAsyncClient(missing=frozenset({"lakes/gone"}))
+    monkeypatch.setattr(tools, "_get_async_client", lambda: client)
+    batcher = tools.BatchingDataplexClient(linger_ms=1)
+
+    results = await asyncio.gather(
+        batcher.get_lake("lakes/gone"), batcher.get_lake("lakes/gone"), batcher.get_lake("lakes/ok"),
+        return_exceptions=True)
+
+    assert isinstance(results[0], NotFound) and isinstance(results[1], NotFound)
+    assert results[2].name == "lakes/ok"
+    assert batcher._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_client_creation_failure_fails_the_batch(monkeypatch) -> None:
+    def no_client():
+        raise RuntimeError("no credentials")
+
+    monkeypatch.setattr(tools, "_get_async_client", no_client)
+    batcher = tools.BatchingDataplexClient(linger_ms=1)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.get_lake("lakes/a"), batcher.get_zone("zones/z"), return_exceptions=True),
+        timeout=2)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert batcher._in_flight == {}
@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks the catalog search helpers' per-event-loop state.
+"""
+
+import asyncio
+
+from agent_utils import catalog_service_tools as tools
+
+
+async def _contend() -> asyncio.Semaphore:
+    limit = tools._async_search_limit()
+
+    async def hold() -> None:
+        async with limit:
+            await asyncio.sleep(0.001)
+
+    # More holders than permits, so some of them have to wait on the semaphore
+    await asyncio.gather(*(hold() for _ in range(20)))
+    return limit
+
+
+def test_search_limit_is_per_event_loop() -> None:
+    first = asyncio.run(_contend())
+    second = asyncio.run(_contend())
+    assert first is not second
+
+
+
+class _FakeAsyncMetadataClient:
+    def __init__(self, credentials=None) -> None:
+        pass
+
+
+def test_async_client_is_reused_within_a_loop(monkeypatch) -> None:
+    monkeypatch.setattr(tools.dataplex_v1, "MetadataServiceAsyncClient", _FakeAsyncMetadataClient)
+    monkeypatch.setattr(tools, "default_credentials", lambda: (None, "p"))
+
+    async def two_lookups() -> tuple:
+        return tools._async_metadata_client(), tools._async_metadata_client()
+
+    first, again = asyncio.run(two_lookups())
+    other_loop, _ = asyncio.run(two_lookups())
+
+    assert first is again
+    assert other_loop is not first
+
+
+def test_cached_search_results_are_copies(monkeypatch) -> None:
+    calls = []
+
+    def fake_iter(project_id, location_id, query):
+        calls.append(query)
+        yield {"dataplex_entry_name": "e1"}
+
+    monkeypatch.setattr(tools, "iter_dataplex_catalog", fake_iter)
+    monkeypatch.setattr(tools, "_SEARCH_CACHE", tools.TTLCache(maxsize=4, ttl=60))
+
+    first = tools.search_dataplex_catalog("p", "l", "orders")
+    first[0]["dataplex_entry_name"] = "changed"
+    first.append({"dataplex_entry_name": "extra"})
+    second = tools.search_dataplex_catalog("p", "l", "orders")
+    second.clear()
+    third = tools.search_dataplex_catalog("p", "l", "orders")
+
+    assert third == [{"dataplex_entry_name": "e1"}]
+    assert calls == ["orders"]
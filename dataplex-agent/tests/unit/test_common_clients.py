@@ -0,0 +1,68 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks how the cached Dataproc clients are built.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from agent_utils import common_tools as tools
+
+
+@pytest.fixture
+def transports(monkeypatch):
+    """Records the _transport calls, with credentials resolved to a sentinel."""
+    monkeypatch.setattr(tools, "_CLIENTS", {})
+    monkeypatch.setattr(tools, "default_credentials", lambda: (mock.sentinel.credentials, "p"))
+    transport = mock.Mock(side_effect=lambda cls, host, credentials=None: mock.Mock(spec=cls))
+    monkeypatch.setattr(tools, "_transport", transport)
+    monkeypatch.setattr(tools.dataproc, "ClusterControllerClient", mock.Mock())
+    monkeypatch.setattr(tools.dataproc, "JobControllerClient", mock.Mock())
+    return transport
+
+
+def test_clients_use_default_credentials(transports) -> None:
+    tools._get_clients("us-central1")
+
+    assert transports.call_count == 2
+    for call in transports.call_args_list:
+        assert call.args[2] is mock.sentinel.credentials
+
+
+def test_clients_are_built_once_per_region(transports) -> None:
+    first = tools._get_clients("us-central1")
+
+    assert tools._get_clients("us-central1") is first
+    assert transports.call_count == 2
+
+
+def test_concurrent_first_calls_build_one_set_of_clients(transports) -> None:
+    build = transports.side_effect
+    # Slow construction widens the window between the cache check and insert
+    transports.side_effect = lambda *args: time.sleep(0.01) or build(*args)
+    start = threading.Barrier(8)
+
+    def get_clients(_):
+        start.wait()
+        return tools._get_clients("us-central1")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(get_clients, range(8)))
+
+    assert transports.call_count == 2
+    assert all(r is results[0] for r in results)
@@ -0,0 +1,60 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks that the fields= option of the get/list tools trims converted results.
+"""
+
+import pytest
+from agent_utils import dataplex_service_tools as tools
+from agent_utils.proto_dict import lake_to_dict, zone_to_dict
+from google.cloud import dataplex_v1
+
+_LAKE = dataplex_v1.Lake(
+    name="projects/p/locations/l/lakes/lk",
+    display_name="Lake",
+    description="d",
+    labels={"env": "dev"},
+    metastore={"service": "s"},
+    state="ACTIVE",
+)
+
+
+def test_without_fields_the_converter_is_used_as_is() -> None:
+    assert tools._only(None, lake_to_dict) is lake_to_dict
+    assert tools._only([], lake_to_dict) is lake_to_dict
+
+
+def test_only_requested_fields_are_returned() -> None:
+    convert = tools._only(["name", "state", "metastore.service"], lake_to_dict)
+
+    assert convert(_LAKE) == {
+        "name": "projects/p/locations/l/lakes/lk",
+        "state": "ACTIVE",
+        "metastore": {"service": "s"},
+    }
+
+
+def test_type_is_accepted_for_type_() -> None:
+    zone = dataplex_v1.Zone(name="z", type_="RAW", description="d")
+
+    # The converters keep the message's own field name, 'type_'
+    assert tools._only(["type"], zone_to_dict)(zone) == {"type_": "RAW"}
+    assert tools._only(["type_"], zone_to_dict)(zone) == {"type_": "RAW"}
+
+
+def test_unknown_field_path_raises_value_error() -> None:
+    convert = tools._only(["name", "no_such_field"], lake_to_dict)
+
+    with pytest.raises(ValueError, match="no_such_field"):
+        convert(_LAKE)
@@ -0,0 +1,91 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks that the get cache hands out copies and that writes drop its entries.
+"""
+
+from unittest import mock
+
+import pytest
+from agent_utils import dataplex_service_tools as tools
+from cachetools import TTLCache
+from google.cloud import dataplex_v1
+
+_LAKE = "projects/p/locations/l/lakes/lk"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A sync client whose get_lake is counted, with the get cache enabled."""
+    monkeypatch.setattr(tools, "_GET_CACHE", TTLCache(maxsize=16, ttl=60))
+    sync_client = mock.Mock()
+    sync_client.get_lake.side_effect = lambda name, retry: dataplex_v1.Lake(name=name)
+    monkeypatch.setattr(tools, "_get_client", lambda: sync_client)
+    return sync_client
+
+
+@pytest.mark.asyncio
+async def test_async_delete_invalidates_cached_get(monkeypatch, client) -> None:
+    operation = mock.Mock()
+    operation.exception = mock.AsyncMock(return_value=None)
+    operation.operation.name = "operations/op"
+    async_client = mock.Mock()
+    async_client.delete_lake = mock.AsyncMock(return_value=operation)
+    monkeypatch.setattr(tools, "_get_async_client", lambda: async_client)
+
+    tools.get_dataplex_lake_raw("p", "l", "lk")
+    tools.get_dataplex_lake_raw("p", "l", "lk")
+    assert client.get_lake.call_count == 1
+
+    result = await tools.delete_dataplex_lake_async("p", "l", "lk")
+    assert result["status"] == "pending"
+
+    tools.get_dataplex_lake_raw("p", "l", "lk")
+    assert client.get_lake.call_count == 2
+
+
+def test_sync_delete_invalidates_cached_get(client) -> None:
+    client.delete_lake.return_value.exception.return_value = None
+    tools.get_dataplex_lake_raw("p", "l", "lk")
+
+    tools.delete_dataplex_lake("p", "l", "lk")
+
+    tools.get_dataplex_lake_raw("p", "l", "lk")
+    assert client.get_lake.call_count == 2
+    client.delete_lake.assert_called_once_with(name=_LAKE, retry=tools._WRITE_RETRY)
+
+
+def test_cached_get_returns_independent_messages(client) -> None:
+    first = tools.get_dataplex_lake_raw("p", "l", "lk")
+    first.display_name = "changed"
+
+    second = tools.get_dataplex_lake_raw("p", "l", "lk")
+    second.labels["env"] = "dev"
+    third = tools.get_dataplex_lake_raw("p", "l", "lk")
+
+    assert client.get_lake.call_count == 1
+    assert second.display_name == ""
+    assert third == dataplex_v1.Lake(name=_LAKE)
+
+
+def test_sync_update_invalidates_after_operation_finishes(client) -> None:
+    operation = client.update_lake.return_value
+    # A get made while the operation runs re-caches the old state
+    operation.exception.side_effect = lambda: tools.get_dataplex_lake_raw("p", "l", "lk") and None
+
+    result = tools.update_dataplex_lake("p", "l", "lk", ["display_name"], {"display_name": "new"})
+    assert result["status"] == "pending"
+
+    tools.get_dataplex_lake_raw("p", "l", "lk")
+    assert client.get_lake.call_count == 2
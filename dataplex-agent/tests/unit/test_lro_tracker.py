@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks that LROTracker resolves operations, retries transient polling errors
+and gives up on the rest.
+"""
+
+import pytest
+from agent_utils import dataplex_service_tools as tools
+from google.api_core.exceptions import (
+    GoogleAPICallError,
+    NotFound,
+    RetryError,
+    ServiceUnavailable,
+)
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+
+
+class _FakeClient:
+    """Serves get_operation from a per-name list of results (exceptions are raised)."""
+
+    def __init__(self, results: dict) -> None:
+        self._results = results
+
+    def get_operation(self, request):
+        result = self._results[request.name].pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _tracker() -> tools.LROTracker:
+    return tools.LROTracker(initial_poll_delay=0.01, max_poll_delay=0.02)
+
+
+def _running(name: str) -> operations_pb2.Operation:
+    return operations_pb2.Operation(name=name)
+
+
+def test_resolves_finished_operations(monkeypatch) -> None:
+    done = operations_pb2.Operation(name="op-ok", done=True)
+    failed = operations_pb2.Operation(
+        name="op-err", done=True, error=status_pb2.Status(code=9, message="precondition"))
+    client = _FakeClient({"op-ok": [_running("op-ok"), done], "op-err": [failed]})
+    monkeypatch.setattr(tools, "_get_client", lambda: client)
+
+    tracker = _tracker()
+    ok = tracker.register(_running("op-ok"))
+    err = tracker.register(_running("op-err"))
+
+    assert ok.result(timeout=2) == done
+    with pytest.raises(GoogleAPICallError, match="precondition"):
+        err.result(timeout=2)
+
+
+def test_keeps_polling_after_errors(monkeypatch) -> None:
+    done = operations_pb2.Operation(name="op", done=True)
+    client = _FakeClient({"op": [
+        RetryError("deadline", None), ServiceUnavailable("down"), RuntimeError("boom"), done]})
+    calls = iter([ValueError("no credentials")])
+
+    def get_client():
+        # The first client lookup fails, later ones succeed
+        err = next(calls, None)
+        if err:
+            raise err
+        return client
+
+    monkeypatch.setattr(tools, "_get_client", get_client)
+
+    tracker = _tracker()
+    future = tracker.register(_running("op"))
+
+    assert future.result(timeout=2) == done
+    assert tracker._thread.is_alive()
+
+
+def test_fails_on_non_transient_polling_errors(monkeypatch) -> None:
+    done = operations_pb2.Operation(name="op-ok", done=True)
+    client = _FakeClient({"op-gone": [NotFound("gone")], "op-ok": [_running("op-ok"), done]})
+    monkeypatch.setattr(tools, "_get_client", lambda: client)
+
+    tracker = _tracker()
+    gone = tracker.register(_running("op-gone"))
+    ok = tracker.register(_running("op-ok"))
+
+    with pytest.raises(NotFound, match="gone"):
+        gone.result(timeout=2)
+    assert ok.result(timeout=2) == done
+    assert not tracker._pending
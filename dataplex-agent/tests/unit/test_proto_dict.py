@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks that the hand-written proto dict builders match MessageToDict.
+"""
+
+import importlib.util
+from pathlib import Path
+
+from google.cloud import dataplex_v1
+from google.protobuf.json_format import MessageToDict
+
+# The agent package directory is not a valid identifier, so load the module by path.
+_PATH = Path(__file__).resolve().parents[2] / "dataplex-agent" / "utils" / "proto_dict.py"
+_spec = importlib.util.spec_from_file_location("proto_dict", _PATH)
+proto_dict = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(proto_dict)
+
+_TS = {"seconds": 1700000000, "nanos": 5000}
+
+
+def _expected(msg: object) -> dict:
+    return MessageToDict(msg._pb, preserving_proto_field_name=True)
+
+
+def test_lake_to_dict_matches_message_to_dict() -> None:
+    lake = dataplex_v1.Lake(
+        name="projects/p/locations/l/lakes/lk",
+        display_name="Lake",
+        uid="u",
+        create_time=_TS,
+        labels={"env": "dev"},
+        state=dataplex_v1.State.ACTIVE,
+        service_account="sa@p.iam.gserviceaccount.com",
+        metastore={"service": "projects/p/locations/l/services/s"},
+        asset_status={"update_time": _TS, "active_assets": 3},
+        metastore_status={"state": "READY", "endpoint": "e", "update_time": _TS},
+    )
+    assert proto_dict.lake_to_dict(lake) == _expected(lake)
+
+
+def test_zone_to_dict_matches_message_to_dict() -> None:
+    zone = dataplex_v1.Zone(
+        name="projects/p/locations/l/lakes/lk/zones/z",
+        type_=dataplex_v1.Zone.Type.RAW,
+        state=dataplex_v1.State.CREATING,
+        discovery_spec={
+            "enabled": True,
+            "include_patterns": ["a/*"],
+            "csv_options": {"header_rows": 1, "delimiter": ","},
+            "json_options": {},
+            "schedule": "0 * * * *",
+        },
+        resource_spec={"location_type": "SINGLE_REGION"},
+    )
+    assert proto_dict.zone_to_dict(zone) == _expected(zone)
+
+
+def test_asset_to_dict_matches_message_to_dict() -> None:
+    asset = dataplex_v1.Asset(
+        name="projects/p/locations/l/lakes/lk/zones/z/assets/a",
+        description="d",
+        resource_spec={
+            "name": "projects/p/buckets/b",
+            "type_": "STORAGE_BUCKET",
+            "read_access_mode": "MANAGED",
+        },
+        resource_status={"state": "READY", "managed_access_identity": "id"},
+        security_status={"state": "APPLYING", "message": "m"},
+        discovery_spec={"enabled": True, "exclude_patterns": ["tmp/*"]},
+        discovery_status={
+            "state": "SCHEDULED",
+            "last_run_time": _TS,
+            "stats": {"data_items": 10, "tables": 2},
+            "last_run_duration": {"seconds": 90},
+        },
+    )
+    assert proto_dict.asset_to_dict(asset) == _expected(asset)
+
+
+def test_task_to_dict_matches_message_to_dict() -> None:
+    task = dataplex_v1.Task(
+        name="projects/p/locations/l/lakes/lk/tasks/t",
+        create_time=_TS,
+        state=dataplex_v1.State.ACTIVE,
+        labels={"team": "data"},
+        trigger_spec={"type_": "RECURRING", "schedule": "", "max_retries": 2},
+        execution_spec={
+            "args": {"k": "v"},
+            "service_account": "sa@p.iam.gserviceaccount.com",
+            "max_job_execution_lifetime": {"seconds": 3600},
+        },
+        execution_status={
+            "update_time": _TS,
+            "latest_job": {"name": "j", "state": "RUNNING", "retry_count": 1},
+        },
+        spark={
+            "python_script_file": "gs://b/main.py",
+            "file_uris": ["gs://b/dep.py"],
+            "infrastructure_spec": {
+                "batch": {"executors_count": 2},
+                "container_image": {"image": "img", "properties": {"a": "b"}},
+                "vpc_network": {"sub_network": "", "network_tags": ["t"]},
+            },
+        },
+    )
+    assert proto_dict.task_to_dict(task) == _expected(task)
+
+
+def test_notebook_task_to_dict_matches_message_to_dict() -> None:
+    task = dataplex_v1.Task(
+        name="projects/p/locations/l/lakes/lk/tasks/nb",
+        trigger_spec={"type_": "ON_DEMAND", "disabled": True, "start_time": _TS},
+        notebook={"notebook": "gs://b/nb.ipynb", "archive_uris": ["gs://b/a.zip"]},
+    )
+    assert proto_dict.task_to_dict(task) == _expected(task)
+
+
+def test_job_to_dict_matches_message_to_dict() -> None:
+    job = dataplex_v1.Job(
+        name="projects/p/locations/l/lakes/lk/tasks/t/jobs/j",
+        uid="u",
+        start_time=_TS,
+        end_time=_TS,
+        state=dataplex_v1.Job.State.SUCCEEDED,
+        retry_count=3,
+        service=dataplex_v1.Job.Service.DATAPROC,
+        service_job="projects/p/locations/l/batches/b",
+        labels={"run": "1"},
+        trigger=dataplex_v1.Job.Trigger.TASK_CONFIG,
+        execution_spec={"project": "p", "kms_key": "k"},
+    )
+    assert proto_dict.job_to_dict(job) == _expected(job)
+
+
+def test_empty_messages_convert_to_empty_dicts() -> None:
+    assert proto_dict.lake_to_dict(dataplex_v1.Lake()) == {}
+    assert proto_dict.zone_to_dict(dataplex_v1.Zone()) == {}
+    assert proto_dict.asset_to_dict(dataplex_v1.Asset()) == {}
+    assert proto_dict.task_to_dict(dataplex_v1.Task()) == {}
+    assert proto_dict.job_to_dict(dataplex_v1.Job()) == {}
@@ -0,0 +1,67 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks how update details are mapped onto messages for masked updates.
+"""
+
+from agent_utils import dataplex_service_tools as tools
+from google.cloud import dataplex_v1
+
+
+def test_apply_paths_sets_only_masked_leaves() -> None:
+    lake = dataplex_v1.Lake()
+    details = {
+        "description": "new",
+        "display_name": "not in the mask",
+        "metastore": {"service": "projects/p/locations/l/services/s"},
+    }
+
+    tools._apply_paths(lake, ["description", "metastore.service"], details)
+
+    assert lake.description == "new"
+    assert lake.metastore.service == "projects/p/locations/l/services/s"
+    assert lake.display_name == ""
+
+
+def test_apply_paths_leaves_missing_values_unset() -> None:
+    lake = dataplex_v1.Lake()
+
+    tools._apply_paths(lake, ["labels", "metastore.service"], {"description": "ignored"})
+
+    assert lake == dataplex_v1.Lake()
+
+
+def test_apply_paths_maps_type_to_type_() -> None:
+    zone = dataplex_v1.Zone()
+    task = dataplex_v1.Task()
+
+    tools._apply_paths(zone, ["type"], {"type": "RAW"})
+    tools._apply_paths(task, ["trigger_spec.type", "trigger_spec.schedule"],
+                       {"trigger_spec": {"type_": "RECURRING", "schedule": "0 * * * *"}})
+
+    assert zone.type_ == dataplex_v1.Zone.Type.RAW
+    assert task.trigger_spec.type_ == dataplex_v1.Task.TriggerSpec.Type.RECURRING
+    assert task.trigger_spec.schedule == "0 * * * *"
+
+
+def test_rename_type_copies_only_the_renamed_path() -> None:
+    details = {"trigger_spec": {"type": "ON_DEMAND"}, "spark": {"main_class": "M"}}
+
+    renamed = tools._rename_type(details, "trigger_spec")
+
+    assert renamed == {"trigger_spec": {"type_": "ON_DEMAND"}, "spark": {"main_class": "M"}}
+    assert details == {"trigger_spec": {"type": "ON_DEMAND"}, "spark": {"main_class": "M"}}
+    assert renamed["spark"] is details["spark"]
+    assert tools._rename_type({"description": "d"}) == {"description": "d"}
+    assert tools._rename_type({"type": "RAW"}) == {"type_": "RAW"}
@@ -12,29 +12,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
 import os
-from zoneinfo import ZoneInfo
-from google.cloud import dataproc_v1 as dataproc
-import google.auth
+
+# Pin protobuf's upb (C) backend before anything imports google.protobuf, so
+# the tools never run on the much slower pure-Python one. upb is the default
+# of protobuf>=4.21; an explicit PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION wins.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 from google.adk.agents import Agent
-from .utils.cluster_controller_tools import *
-from .utils.llm_config import *
+from .utils.cluster_controller_tools import (
+    list_dataproc_clusters,
+    create_dataproc_cluster_async,
+    get_dataproc_cluster_async,
+    get_many_dataproc_clusters_async,
+    list_dataproc_clusters_async,
+    update_dataproc_cluster_async,
+    delete_dataproc_cluster_async,
+    describe_dataproc_operation,
+)
+from .utils.credentials import default_credentials
+from .utils.llm_config import root_model, root_prompt
 
 
-_, project_id = google.auth.default()
-os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
+def _project() -> str:
+    """Resolves the ADC project only when it is actually needed."""
+    _, project_id = default_credentials()
+    return project_id
+
+
+# Skip the ADC lookup (metadata server / disk I/O) when the project is already
+# provided by the environment, as it usually is on Cloud Run and GKE.
+if not os.environ.get("GOOGLE_CLOUD_PROJECT"):
+    os.environ["GOOGLE_CLOUD_PROJECT"] = _project()
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "us-central1")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
 
+_TOOLS = (
+    list_dataproc_clusters,
+    create_dataproc_cluster_async,
+    get_dataproc_cluster_async,
+    get_many_dataproc_clusters_async,
+    list_dataproc_clusters_async,
+    update_dataproc_cluster_async,
+    delete_dataproc_cluster_async,
+    describe_dataproc_operation,
+)
+
+
 root_agent = Agent(
     name="root_agent",
     model=root_model,
     instruction=root_prompt,
-    tools=[list_dataproc_clusters, create_dataproc_cluster_async,
-           get_dataproc_cluster_async, list_dataproc_clusters_async, update_dataproc_cluster_async, delete_dataproc_cluster_async],
+    tools=_TOOLS,
 )
-
-
-
@@ -1,11 +1,45 @@
 from .common_tools import *
+from .common_tools import _CHANNEL_OPTIONS, _dataproc_endpoint, initialize_clients
 import uuid
 from google.cloud import dataproc_v1 as dataproc
+from google.cloud.dataproc_v1.services.cluster_controller.transports import ClusterControllerGrpcAsyncIOTransport
 from google.api_core.exceptions import NotFound, GoogleAPICallError
 from google.protobuf.duration_pb2 import Duration
 from typing import Optional, List, Dict
-from google.protobuf.json_format import MessageToDict
+from .credentials import default_credentials
+from .proto_dict import cluster_to_dict
 from google.protobuf import field_mask_pb2
+from google.protobuf.json_format import MessageToDict
+from google.longrunning import operations_pb2
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+import orjson
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# grpc.aio channels are bound to the event loop that created them, so async
+# clients are kept per loop (and per regional endpoint) and dropped with it.
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+
+def _get_dataproc_async_client(region: str) -> dataproc.ClusterControllerAsyncClient:
+    """Returns the ClusterControllerAsyncClient for the region on the running event loop."""
+    clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(region)
+    if client is None:
+        host = _dataproc_endpoint(region)["api_endpoint"]
+        credentials, _ = default_credentials()
+        channel = ClusterControllerGrpcAsyncIOTransport.create_channel(
+            host, credentials=credentials, options=_CHANNEL_OPTIONS)
+        client = clients[region] = dataproc.ClusterControllerAsyncClient(
+            transport=ClusterControllerGrpcAsyncIOTransport(host=host, channel=channel))
+    return client
+
+def _operation_summary(metadata) -> dict:
+    """The ClusterOperationMetadata fields callers act on, without text-formatting all of it."""
+    return {"operation_type": metadata.operation_type, "status": metadata.status.state.name}
 
 async def create_dataproc_cluster_async(project_id: str, region: str, cluster_name: str, cluster_config: dict):
     """
@@ -25,10 +59,8 @@ async def create_dataproc_cluster_async(project_id: str, region: str, cluster_na
         dict: A dictionary containing the result of the operation (LRO details or error).
     """
     try:
-        # Create an async client
-        cluster_client = dataproc.ClusterControllerAsyncClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
-        )
+        # Reuse the async client for this region and event loop
+        cluster_client = _get_dataproc_async_client(region)
 
         # Prepare the cluster object
         cluster = {
@@ -42,15 +74,15 @@ async def create_dataproc_cluster_async(project_id: str, region: str, cluster_na
             request={"project_id": project_id, "region": region, "cluster": cluster}
         )
 
-        print(f"Initiated async cluster creation for {cluster_name}. Operation: {operation.metadata.operation_type}")
+        logger.info("Initiated async cluster creation for %s. Operation: %s", cluster_name, operation.metadata.operation_type)
         # Returning the operation details allows tracking the async creation process.
-        return {"status": "creating", "operation_name": operation.operation.name, "metadata": str(operation.metadata)}
+        return {"status": "creating", "operation_name": operation.operation.name, "metadata": _operation_summary(operation.metadata)}
 
     except GoogleAPICallError as e:
-        print(f"API Error creating cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.error("API Error creating cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"API Error creating cluster async: {e.message}"}
     except Exception as e:
-        print(f"Unexpected error creating cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.exception("Unexpected error creating cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"Unexpected error creating cluster async: {str(e)}"}
     
 async def get_dataproc_cluster_async(project_id: str, region: str, cluster_name: str):
@@ -66,32 +98,86 @@ async def get_dataproc_cluster_async(project_id: str, region: str, cluster_name:
         dict: A dictionary containing cluster details or an error message.
     """
     try:
-        # Create an async client
-        cluster_client = dataproc.ClusterControllerAsyncClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
-        )
+        # Reuse the async client for this region and event loop
+        cluster_client = _get_dataproc_async_client(region)
 
         # Make the async request
-        request = dataproc.GetClusterRequest(
-            project_id=project_id, region=region, cluster_name=cluster_name
-        )
-        cluster = await cluster_client.get_cluster(request=request)
+        cluster = await cluster_client.get_cluster(
+            project_id=project_id, region=region, cluster_name=cluster_name)
 
         # Convert the proto message to a dictionary
-        cluster_dict = MessageToDict(cluster._pb, preserving_proto_field_name=True)
+        cluster_dict = cluster_to_dict(cluster)
         return cluster_dict
 
     except NotFound:
-        print(f"Cluster {cluster_name} not found async in {project_id}/{region}.")
+        logger.warning("Cluster %s not found async in %s/%s.", cluster_name, project_id, region)
         return {"error": f"Cluster not found async: {cluster_name}"}
     except GoogleAPICallError as e:
-        print(f"API Error getting cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.error("API Error getting cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"API Error getting cluster async: {e.message}"}
     except Exception as e:
-        print(f"Unexpected error getting cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.exception("Unexpected error getting cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"Unexpected error getting cluster async: {str(e)}"}
 
-async def list_dataproc_clusters_async(project_id: str, region: str, filter_str: str):
+async def get_many_dataproc_clusters_async(project_id: str, region: str, cluster_names: list[str]):
+    """
+    Asynchronously retrieves several Dataproc clusters concurrently.
+
+    The gets are issued together over the shared async client instead of one
+    after another, so the whole batch costs roughly one round trip.
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        region (str): The Dataproc region (e.g., 'us-central1').
+        cluster_names (list[str]): The names of the clusters to retrieve.
+
+    Returns:
+        list: One dictionary per cluster name, in the same order, containing the
+              cluster details or an error message for that cluster.
+    """
+    return list(await asyncio.gather(
+        *(get_dataproc_cluster_async(project_id, region, name) for name in cluster_names)))
+
+def _clusters_to_dicts(clusters) -> list:
+    return [cluster_to_dict(cluster) for cluster in clusters]
+
+def _result_encoder(return_format: str):
+    """Returns the function producing a lister's result in the requested format.
+
+    'json' serializes the converted dicts in one orjson pass, for callers that
+    forward the result as text anyway.
+    """
+    if return_format == "dict":
+        return lambda results: results
+    if return_format == "json":
+        return lambda results: orjson.dumps(results).decode()
+    raise ValueError(f"return_format must be 'dict' or 'json', got {return_format!r}")
+
+async def list_dataproc_clusters_stream(project_id: str, region: str,
+                                        filter_str: str = "") -> AsyncIterator[dict]:
+    """
+    Asynchronously yields Dataproc clusters as the pager fetches them, so callers
+    can act on the first clusters without waiting for the whole listing.
+    list_dataproc_clusters_async collects the same listing into a list.
+
+    Args:
+        project_id (str): The Google Cloud project ID.
+        region (str): The Dataproc region (e.g., 'us-central1').
+        filter_str (str, optional): A filter string to apply (e.g., 'status.state = RUNNING').
+                                    Defaults to no filter.
+
+    Yields:
+        dict: Info about one cluster.
+
+    Raises:
+        GoogleAPICallError: If an error occurs during the API call.
+    """
+    cluster_client = _get_dataproc_async_client(region)
+    request = dataproc.ListClustersRequest(project_id=project_id, region=region, filter=filter_str)
+    async for cluster in await cluster_client.list_clusters(request=request):
+        yield cluster_to_dict(cluster)
+
+async def list_dataproc_clusters_async(project_id: str, region: str, filter_str: str, return_format: str = "dict"):
     """
     Asynchronously lists all Dataproc clusters in a specific project and region.
 
@@ -100,40 +186,43 @@ async def list_dataproc_clusters_async(project_id: str, region: str, filter_str:
         region (str): The Dataproc region (e.g., 'us-central1').
         filter_str (str, optional): A filter string to apply (e.g., 'status.state = RUNNING').
                                     Defaults to None.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing info about a cluster,
-              or a list containing a single error dictionary.
+              or a list containing a single error dictionary. With return_format='json'
+              the list is returned as a JSON string.
     """
     clusters_list = []
     try:
-        # Create an async client
-        cluster_client = dataproc.ClusterControllerAsyncClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
-        )
+        encode = _result_encoder(return_format)
+        # Reuse the async client for this region and event loop
+        cluster_client = _get_dataproc_async_client(region)
 
         # Prepare request
         request = dataproc.ListClustersRequest(project_id=project_id, region=region)
         if filter_str:
             request.filter = filter_str
 
-        # The list_clusters method returns an async iterator.
-        async for cluster in cluster_client.list_clusters(request=request):
-            cluster_iterator = await cluster_client.list_clusters(request=request)
-            async for cluster in cluster_iterator:
-                cluster_dict = MessageToDict(cluster._pb, preserving_proto_field_name=True)
-                clusters_list.append(cluster_dict)
+        # One list RPC; each page is converted on a worker thread while the
+        # next page is fetched, so conversion never blocks the event loop.
+        pager = await cluster_client.list_clusters(request=request)
+        conversions = [asyncio.create_task(asyncio.to_thread(_clusters_to_dicts, page.clusters))
+                       async for page in pager.pages]
+        for page_dicts in await asyncio.gather(*conversions):
+            clusters_list.extend(page_dicts)
 
         if not clusters_list:
-             print(f"No clusters found async in {project_id}/{region} matching filter '{filter_str}'.")
+             logger.info("No clusters found async in %s/%s matching filter '%s'.", project_id, region, filter_str)
              # Return empty list is valid, signifies no clusters found
-        return clusters_list
+        return encode(clusters_list)
 
     except GoogleAPICallError as e:
-        print(f"API Error listing clusters async in {project_id}/{region}: {e}")
+        logger.error("API Error listing clusters async in %s/%s: %s", project_id, region, e)
         return [{"error": f"API Error listing clusters async: {e.message}"}]
     except Exception as e:
-        print(f"Unexpected error listing clusters async in {project_id}/{region}: {e}")
+        logger.exception("Unexpected error listing clusters async in %s/%s: %s", project_id, region, e)
         return [{"error": f"Unexpected error listing clusters async: {str(e)}"}]
 
 async def update_dataproc_cluster_async(project_id: str, region: str, cluster_name: str, update_mask: list[str], updated_cluster_config: dict):
@@ -154,10 +243,8 @@ async def update_dataproc_cluster_async(project_id: str, region: str, cluster_na
         dict: A dictionary containing the LRO details or an error message.
     """
     try:
-        # Create an async client
-        cluster_client = dataproc.ClusterControllerAsyncClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
-        )
+        # Reuse the async client for this region and event loop
+        cluster_client = _get_dataproc_async_client(region)
 
         # Create the FieldMask
         field_mask = field_mask_pb2.FieldMask(paths=update_mask)
@@ -178,17 +265,17 @@ async def update_dataproc_cluster_async(project_id: str, region: str, cluster_na
             }
         )
 
-        print(f"Initiated async cluster update for {cluster_name}. Operation: {operation.metadata.operation_type}")
-        return {"status": "updating", "operation_name": operation.operation.name, "metadata": str(operation.metadata)}
+        logger.info("Initiated async cluster update for %s. Operation: %s", cluster_name, operation.metadata.operation_type)
+        return {"status": "updating", "operation_name": operation.operation.name, "metadata": _operation_summary(operation.metadata)}
 
     except NotFound:
-        print(f"Cluster {cluster_name} not found for async update in {project_id}/{region}.")
+        logger.warning("Cluster %s not found for async update in %s/%s.", cluster_name, project_id, region)
         return {"error": f"Cluster not found for async update: {cluster_name}"}
     except GoogleAPICallError as e:
-        print(f"API Error updating cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.error("API Error updating cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"API Error updating cluster async: {e.message}"}
     except Exception as e:
-        print(f"Unexpected error updating cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.exception("Unexpected error updating cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"Unexpected error updating cluster async: {str(e)}"}
 
 async def delete_dataproc_cluster_async(project_id: str, region: str, cluster_name: str):
@@ -204,65 +291,101 @@ async def delete_dataproc_cluster_async(project_id: str, region: str, cluster_na
         dict: A dictionary containing the LRO details or an error message.
     """
     try:
-        # Create an async client
-        cluster_client = dataproc.ClusterControllerAsyncClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
-        )
+        # Reuse the async client for this region and event loop
+        cluster_client = _get_dataproc_async_client(region)
 
         # Make the async request
-        request = dataproc.DeleteClusterRequest(
-            project_id=project_id, region=region, cluster_name=cluster_name
-        )
-        operation = await cluster_client.delete_cluster(request=request)
+        operation = await cluster_client.delete_cluster(
+            project_id=project_id, region=region, cluster_name=cluster_name)
 
-        print(f"Initiated async cluster deletion for {cluster_name}. Operation: {operation.metadata.operation_type}")
-        return {"status": "deleting", "operation_name": operation.operation.name, "metadata": str(operation.metadata)}
+        logger.info("Initiated async cluster deletion for %s. Operation: %s", cluster_name, operation.metadata.operation_type)
+        return {"status": "deleting", "operation_name": operation.operation.name, "metadata": _operation_summary(operation.metadata)}
 
     except NotFound:
-        print(f"Cluster {cluster_name} not found for async deletion in {project_id}/{region}.")
+        logger.warning("Cluster %s not found for async deletion in %s/%s.", cluster_name, project_id, region)
         return {"error": f"Cluster not found for async deletion: {cluster_name}"}
     except GoogleAPICallError as e:
-        print(f"API Error deleting cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.error("API Error deleting cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"API Error deleting cluster async: {e.message}"}
     except Exception as e:
-        print(f"Unexpected error deleting cluster {cluster_name} async in {project_id}/{region}: {e}")
+        logger.exception("Unexpected error deleting cluster %s async in %s/%s: %s", cluster_name, project_id, region, e)
         return {"error": f"Unexpected error deleting cluster async: {str(e)}"}
 
 
 
-def list_dataproc_clusters(project_id: str, region: str):
+def list_dataproc_clusters(project_id: str, region: str, max_parallelism: int = 4, return_format: str = "dict"):
     """
     Lists all Dataproc clusters in a specific project and region.
 
     Args:
         project_id (str): The Google Cloud project ID.
         region (str): The Dataproc region (e.g., 'us-central1').
+        max_parallelism (int, optional): Number of worker threads converting pages. Defaults to 4.
+        return_format (str, optional): 'dict' for a list of dictionaries, or 'json' for the same list
+                                       serialized to a JSON string. Defaults to 'dict'.
 
     Returns:
         list: A list of dictionaries, each containing basic info about a cluster,
-              or an empty list if none are found or an error occurs.
+              or an empty list if none are found or an error occurs. With
+              return_format='json' the list is returned as a JSON string.
     """
     cluster_client, _ = initialize_clients(region)
     if not cluster_client:
         return [{"error": "Dataproc cluster client not initialized."}]
-    clusters = []
     try:
+        encode = _result_encoder(return_format)
         request = dataproc.ListClustersRequest(project_id=project_id, region=region)
-        # The list_clusters method handles pagination automatically.
-        for cluster in cluster_client.list_clusters(request=request):
-            cluster_data_dict = MessageToDict(
-                cluster._pb,
-                preserving_proto_field_name=True
-            )
-            print(cluster_data_dict)
-            # Append the created dictionary to the clusters list
-            clusters.append(cluster_data_dict)
-
-
-        return clusters
+        # Pages are chained by page tokens, so they are fetched in order; each
+        # fetched page is converted on a worker while the next one is requested.
+        with ThreadPoolExecutor(max_workers=max(1, max_parallelism)) as pool:
+            futures = [pool.submit(_clusters_to_dicts, page.clusters)
+                       for page in cluster_client.list_clusters(request=request).pages]
+            return encode([d for f in futures for d in f.result()])
     except GoogleAPICallError as e:
-        print(f"API Error listing clusters in {project_id}/{region}: {e}")
+        logger.error("API Error listing clusters in %s/%s: %s", project_id, region, e)
         return [{"error": f"API Error listing clusters: {e.message}"}]
     except Exception as e:
-        print(f"Unexpected error listing clusters in {project_id}/{region}: {e}")
-        return [{"error": f"Unexpected error listing clusters: {str(e)}"}]
\ No newline at end of file
+        logger.exception("Unexpected error listing clusters in %s/%s: %s", project_id, region, e)
+        return [{"error": f"Unexpected error listing clusters: {str(e)}"}]
+
+def describe_dataproc_operation(operation_name: str):
+    """
+    Retrieves the current state and full metadata of a Dataproc cluster operation,
+    e.g. one returned by the create, update or delete cluster tools.
+
+    Args:
+        operation_name (str): The operation name, in the form
+                              'projects/{project}/regions/{region}/operations/{operation_id}'.
+
+    Returns:
+        dict: A dictionary with the operation name, whether it is done, its metadata
+              and, under "operation_error", the status it failed with; or a
+              dictionary with an "error" message if it could not be described.
+    """
+    parts = operation_name.split("/")
+    if len(parts) != 6 or parts[0] != "projects" or parts[2] != "regions" or parts[4] != "operations":
+        return {"error": f"Invalid operation name: {operation_name}"}
+    region = parts[3]
+    cluster_client, _ = initialize_clients(region)
+    if not cluster_client:
+        return {"error": "Dataproc cluster client not initialized."}
+    try:
+        op = cluster_client.get_operation(operations_pb2.GetOperationRequest(name=operation_name))
+        result = {"operation_name": op.name, "done": op.done}
+        if op.HasField("metadata"):
+            metadata = dataproc.ClusterOperationMetadata.pb()()
+            op.metadata.Unpack(metadata)
+            result["metadata"] = MessageToDict(metadata, preserving_proto_field_name=True)
+        if op.HasField("error"):
+            # Kept apart from "error", which means describing the operation failed
+            result["operation_error"] = {"code": op.error.code, "message": op.error.message}
+        return result
+    except NotFound:
+        logger.warning("Operation %s not found.", operation_name)
+        return {"error": f"Operation not found: {operation_name}"}
+    except GoogleAPICallError as e:
+        logger.error("API Error describing operation %s: %s", operation_name, e)
+        return {"error": f"API Error describing operation: {e.message}"}
+    except Exception as e:
+        logger.exception("Unexpected error describing operation %s: %s", operation_name, e)
+        return {"error": f"Unexpected error describing operation: {e!s}"}
@@ -1,80 +1,296 @@
-import uuid
+import asyncio
+import functools
+import logging
+import operator
+import re
+import secrets
+import threading
+from datetime import datetime as _dt
+from zoneinfo import ZoneInfo
 from google.cloud import dataproc_v1 as dataproc
-from google.api_core.exceptions import NotFound, GoogleAPICallError
+from google.cloud.dataproc_v1.services.cluster_controller.transports import ClusterControllerGrpcTransport
+from google.cloud.dataproc_v1.services.job_controller.transports import JobControllerGrpcTransport
+from google.api_core.exceptions import InvalidArgument, NotFound, GoogleAPICallError
 from google.protobuf.duration_pb2 import Duration
-from typing import Optional, List, Dict
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.internal import api_implementation
+from typing import NamedTuple
+import grpc
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import LRUCache, TTLCache, cached
+from .credentials import default_credentials
+
+# Shared HTTPS session for the Lichess API so repeated lookups reuse the
+# keep-alive connection instead of paying a TCP+TLS handshake per call.
+# Only one host is ever contacted, so a single pool is enough; up to 50
+# connections are kept so concurrent lookups are not forced to reconnect.
+_LICHESS = requests.Session()
+_LICHESS.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=50))
+_LICHESS.headers["Accept-Encoding"] = "gzip"
+
+# Timezones known to get_current_time, keyed by the (lowercase) place name that
+# selects them. Adding a city only takes a new entry here.
+_TZ_NAMES = {
+    "sf": "America/Los_Angeles",
+    "san francisco": "America/Los_Angeles",
+    "nyc": "America/New_York",
+    "new york": "America/New_York",
+    "london": "Europe/London",
+}
+_QUERY_TZ = {place: ZoneInfo(name) for place, name in _TZ_NAMES.items()}
+_TZ_RE = re.compile(r"\b(" + "|".join(map(re.escape, _TZ_NAMES)) + r")\b", re.IGNORECASE)
+_now = _dt.now  # Bound once instead of resolving datetime.datetime.now per call
+
+logger = logging.getLogger(__name__)
+
+# The response parsers read proto fields directly. That is only cheap with the
+# upb backend (agent.py selects it); the pure-Python backend resolves every
+# field read through Python-level descriptors.
+if api_implementation.Type() == "python":
+    logger.warning("protobuf is using its pure-Python implementation; Dataproc "
+                   "responses will be parsed slowly. Install protobuf>=4.21 to get upb.")
+
+@functools.lru_cache(maxsize=32)
+def _dataproc_endpoint(region: str) -> dict:
+    """client_options for the regional Dataproc endpoint. Shared between callers, so read-only."""
+    return {"api_endpoint": f"{region}-dataproc.googleapis.com:443"}
+
+# Keepalive pings on active calls detect a dead connection promptly instead
+# of leaving a call hanging on a half-open socket, and gzip shrinks large
+# list/submit payloads. The message size limits repeat the generated
+# transport's defaults, which passing our own channel would otherwise drop.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.default_compression_algorithm", int(grpc.Compression.Gzip)),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+# (cluster_client, job_client) per region. A plain dict rather than lru_cache
+# so close_clients can reach the cached clients.
+_CLIENTS: dict = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def _transport(transport_cls, host: str, credentials=None):
+    """A gRPC transport for host on a channel built with _CHANNEL_OPTIONS."""
+    channel = transport_cls.create_channel(host, credentials=credentials, options=_CHANNEL_OPTIONS)
+    return transport_cls(host=host, channel=channel)
+
+def _get_clients(region: str):
+    """Builds the Dataproc clients for a region once and reuses their channels."""
+    clients = _CLIENTS.get(region)
+    if clients is None:
+        with _CLIENTS_LOCK:
+            clients = _CLIENTS.get(region)
+            if clients is None:
+                credentials, _ = default_credentials()
+                host = _dataproc_endpoint(region)["api_endpoint"]
+                cluster_client = dataproc.ClusterControllerClient(
+                    transport=_transport(ClusterControllerGrpcTransport, host, credentials))
+                job_client = dataproc.JobControllerClient(
+                    transport=_transport(JobControllerGrpcTransport, host, credentials))
+                # You could add other clients like AutoscalingPolicyServiceClient if needed
+                # policy_client = dataproc.AutoscalingPolicyServiceClient()
+                clients = _CLIENTS[region] = (cluster_client, job_client)
+    return clients
+
+def close_clients() -> None:
+    """Closes the channels of all cached Dataproc clients, e.g. at agent shutdown."""
+    while _CLIENTS:
+        _, clients = _CLIENTS.popitem()
+        for client in clients:
+            client.transport.close()
 
 def initialize_clients(region: str):
     try:
-        cluster_client = dataproc.ClusterControllerClient(
-            client_options={"api_endpoint": f"{region}-dataproc.googleapis.com:443"})
-        job_client = dataproc.JobControllerClient()
-        # You could add other clients like AutoscalingPolicyServiceClient if needed
-        # policy_client = dataproc.AutoscalingPolicyServiceClient()
+        cluster_client, job_client = _get_clients(region)
     except Exception as e:
-        print(f"Error initializing Google Cloud Dataproc clients: {e}")
+        logger.error("Error initializing Google Cloud Dataproc clients: %s", e)
         # Handle initialization failure appropriately, maybe raise or exit
+        # Failures are not cached, so the next call retries construction.
         cluster_client = None
         job_client = None
     return cluster_client, job_client
 
 
 
-def _parse_cluster_response(cluster) -> Dict:
+class ClusterSummary(NamedTuple):
+    """Key info of a Cluster. Use ._asdict() where a JSON-ready dict is needed."""
+    name: str
+    status: str
+    uuid: str
+    project_id: str
+    zone: str | None
+    image_version: str
+    master_nodes: int
+    master_machine_type: str | None
+    worker_nodes: int
+    worker_machine_type: str | None
+    creation_timestamp: str | None
+    endpoint_uri: str | None
+
+class JobSummary(NamedTuple):
+    """Key info of a Job. Use ._asdict() where a JSON-ready dict is needed."""
+    job_id: str
+    type: str | None
+    status: str
+    status_details: str
+    cluster_name: str
+    submitted_by: str
+    driver_output_uri: str
+    start_time: str | None
+    end_time: str | None
+    # Type-specific details, only set for the job types that carry them
+    main_file: str | None = None
+    main_class_or_jar: str | None = None
+    args: tuple[str, ...] | None = None
+    query_file_uri: str | None = None
+    query_list: tuple[str, ...] | None = None
+
+def _tail(uri: str) -> str | None:
+    """Returns the last path segment of a resource URI (e.g. the zone of a zone_uri)."""
+    return uri.rpartition('/')[2] if uri else None
+
+def _first_state_time(pb) -> str | None:
+    """Start time of the earliest recorded state, i.e. when the resource was created.
+
+    Neither ClusterStatus nor JobStatus has a creation/start timestamp field;
+    the oldest status_history entry (or the current status, if there is no
+    history yet) carries it. Returned as an RFC 3339 string.
+    """
+    first = pb.status_history[0] if pb.status_history else pb.status
+    return first.state_start_time.ToJsonString() if first.HasField('state_start_time') else None
+
+# Enum value -> name, so states are rendered without a proto-plus enum lookup
+_CLUSTER_STATE_NAMES = {e.value: e.name for e in dataproc.ClusterStatus.State}
+_JOB_STATE_NAMES = {e.value: e.name for e in dataproc.JobStatus.State}
+
+# The summary fields, read in one C-level call per message instead of a chain
+# of Python attribute lookups per field.
+_CLUSTER_FIELDS = operator.attrgetter(
+    'cluster_name', 'cluster_uuid', 'project_id',
+    'config.gce_cluster_config.zone_uri',
+    'config.software_config.image_version',
+    'config.master_config.num_instances', 'config.master_config.machine_type_uri',
+    'config.worker_config.num_instances', 'config.worker_config.machine_type_uri',
+    'config.endpoint_config.http_ports',
+    'status.state',
+)
+_JOB_FIELDS = operator.attrgetter(
+    'reference.job_id', 'placement.cluster_name', 'driver_output_resource_uri',
+    'status', 'done',
+)
+
+def _parse_cluster_response(cluster) -> ClusterSummary | None:
     """Helper to extract key info from a Cluster object."""
     if not cluster:
-        return {}
-    return {
-        'name': cluster.cluster_name,
-        'status': cluster.status.state.name, # Get enum name string
-        'uuid': cluster.cluster_uuid,
-        'project_id': cluster.project_id,
+        return None
+    pb = getattr(cluster, '_pb', cluster)
+    (name, uuid_, project_id, zone_uri, image_version, master_nodes, master_type,
+     worker_nodes, worker_type, http_ports, state) = _CLUSTER_FIELDS(pb)
+    return ClusterSummary(
+        name=name,
+        status=_CLUSTER_STATE_NAMES.get(state, 'UNKNOWN'),
+        uuid=uuid_,
+        project_id=project_id,
         # Region is usually inferred from the client request, not always in response
-        'zone': cluster.config.gce_cluster_config.zone_uri.split('/')[-1] if cluster.config.gce_cluster_config.zone_uri else None,
-        'image_version': cluster.config.software_config.image_version,
-        'master_nodes': cluster.config.master_config.num_instances,
-        'master_machine_type': cluster.config.master_config.machine_type_uri.split('/')[-1] if cluster.config.master_config.machine_type_uri else None,
-        'worker_nodes': cluster.config.worker_config.num_instances,
-        'worker_machine_type': cluster.config.worker_config.machine_type_uri.split('/')[-1] if cluster.config.worker_config.machine_type_uri else None,
-        'creation_timestamp': cluster.status.creation_time.rfc3339() if hasattr(cluster.status, 'creation_time') else None,
-        'endpoint_uri': cluster.config.endpoint_config.http_ports['Web UI'] if cluster.config.endpoint_config and 'Web UI' in cluster.config.endpoint_config.http_ports else None,
-    }
-
-def _parse_job_response(job) -> Dict:
+        zone=_tail(zone_uri),
+        image_version=image_version,
+        master_nodes=master_nodes,
+        master_machine_type=_tail(master_type),
+        worker_nodes=worker_nodes,
+        worker_machine_type=_tail(worker_type),
+        creation_timestamp=_first_state_time(pb),
+        endpoint_uri=http_ports.get('Web UI'),
+    )
+
+# Type-specific details. Each extractor receives the raw sub-message set in the
+# Job 'type_job' oneof and pulls out only the fields it reports. Repeated fields
+# are returned as tuples: callers only read them.
+def _extract_pyspark(t) -> dict:
+    return {'main_file': t.main_python_file_uri, 'args': tuple(t.args)}
+
+def _extract_spark(t) -> dict:
+    return {'main_class_or_jar': t.main_class or t.main_jar_file_uri, 'args': tuple(t.args)}
+
+def _extract_queries(t) -> dict:
+    """Hive, Pig and Spark SQL jobs run either a query file or an inline query list."""
+    return {'query_file_uri': t.query_file_uri, 'query_list': tuple(t.query_list.queries)}
+
+# Keyed by the 'type_job' oneof field name
+_JOB_TYPE_EXTRACTORS = {
+    'pyspark_job': _extract_pyspark,
+    'spark_job': _extract_spark,
+    'hive_job': _extract_queries,
+    'pig_job': _extract_queries,
+    'spark_sql_job': _extract_queries,
+    # Add other job types as needed (Presto, Trino, etc.)
+}
+
+def _parse_job_response(job) -> JobSummary | None:
     """Helper to extract key info from a Job object."""
     if not job:
-        return {}
-
-    job_info = {
-        'job_id': job.reference.job_id,
-        'type': job.type_case.name, # e.g., 'pyspark_job', 'hive_job'
-        'status': job.status.state.name,
-        'status_details': job.status.details,
-        'cluster_name': job.placement.cluster_name,
-        'submitted_by': job.submitted_by,
-        'driver_output_uri': job.driver_output_resource_uri,
-        'start_time': job.status.start_time.rfc3339() if hasattr(job.status, 'start_time') else None,
-        'end_time': job.status.end_time.rfc3339() if hasattr(job.status, 'end_time') else None,
-    }
-    # Add type-specific details
-    if job.type_case.name == 'pyspark_job':
-        job_info['main_file'] = job.pyspark_job.main_python_file_uri
-        job_info['args'] = list(job.pyspark_job.args)
-    elif job.type_case.name == 'spark_job':
-        job_info['main_class_or_jar'] = job.spark_job.main_class or job.spark_job.main_jar_file_uri
-        job_info['args'] = list(job.spark_job.args)
-    elif job.type_case.name == 'hive_job':
-        job_info['query_file_uri'] = job.hive_job.query_file_uri
-        job_info['query_list'] = list(job.hive_job.query_list.queries)
-    elif job.type_case.name == 'pig_job':
-        job_info['query_file_uri'] = job.pig_job.query_file_uri
-        job_info['query_list'] = list(job.pig_job.query_list.queries)
-    # Add other job types as needed (Spark SQL, Presto, etc.)
-
-    return job_info
-
+        return None
 
+    pb = getattr(job, '_pb', job)
+    job_id, cluster_name, driver_output_uri, status, done = _JOB_FIELDS(pb)
+    job_type = pb.WhichOneof('type_job') # e.g., 'pyspark_job', 'hive_job'
+    # Add type-specific details
+    extractor = _JOB_TYPE_EXTRACTORS.get(job_type)
+    type_details = extractor(getattr(pb, job_type)) if extractor else {}
+    # A finished job's current state started when the job ended
+    end_time = None
+    if done and status.HasField('state_start_time'):
+        end_time = status.state_start_time.ToJsonString()
+
+    return JobSummary(
+        job_id=job_id,
+        type=job_type,
+        status=_JOB_STATE_NAMES.get(status.state, 'STATE_UNSPECIFIED'),
+        status_details=status.details,
+        cluster_name=cluster_name,
+        submitted_by='', # Job carries no submitter field
+        driver_output_uri=driver_output_uri,
+        start_time=_first_state_time(pb),
+        end_time=end_time,
+        **type_details,
+    )
+
+
+
+# Message class for each job type field of dataproc_v1.types.Job (check API docs for the exhaustive list)
+_JOB_CTORS = {
+    "hadoop_job": dataproc.HadoopJob,
+    "spark_job": dataproc.SparkJob,
+    "pyspark_job": dataproc.PySparkJob,
+    "hive_job": dataproc.HiveJob,
+    "pig_job": dataproc.PigJob,
+    "spark_r_job": dataproc.SparkRJob,
+    "spark_sql_job": dataproc.SparkSqlJob,
+    "presto_job": dataproc.PrestoJob,
+    "trino_job": dataproc.TrinoJob,
+}
+_SUPPORTED_JOB_FIELDS = frozenset(_JOB_CTORS)
+_SUPPORTED_TYPES_STR = ", ".join(f.replace('_job', '') for f in _JOB_CTORS)
+# Field names each job message accepts, so misspelled job_details keys are
+# rejected before the submit RPC rather than by the server.
+_JOB_ALLOWED_FIELDS = {
+    name: frozenset(ctor.pb().DESCRIPTOR.fields_by_name) for name, ctor in _JOB_CTORS.items()
+}
+
+# Required job_details keys per job type field. Each inner tuple lists
+# alternatives, at least one of which must be given with a non-empty value.
+# Add more validations based on Dataproc API requirements for each job type.
+_REQUIRED_FIELDS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "pyspark_job": (("main_python_file_uri",),),
+    "spark_job": (("main_class", "main_jar_file_uri"),),
+    "hive_job": (("query_file_uri", "query_list"),),
+    "pig_job": (("query_file_uri", "query_list"),),
+    "spark_sql_job": (("query_file_uri", "query_list"),),
+}
 
 def submit_dataproc_job(
     project_id: str,
@@ -90,9 +306,8 @@ def submit_dataproc_job(
 
     Args:
         project_id (str): Google Cloud project ID.
-        region (str): Dataproc region (e.g., 'us-central1').
-                      NOTE: Ensure the job_client was initialized for this region,
-                      or re-initialize if necessary for multi-region agents.
+        region (str): Dataproc region (e.g., 'us-central1'). The job is sent to
+                      that region's Dataproc endpoint.
         cluster_name (str): Name of the cluster to run the job on.
         job_type (str): Type of job. Supported values correspond to the Job type fields
                       in the API (case-insensitive matching attempted):
@@ -112,43 +327,25 @@ def submit_dataproc_job(
         dict: A dictionary with submitted job details (ID, initial status)
               or an error dictionary if submission fails.
     """
-    # Check if client is initialized (especially important if initialization can fail)
+    # Clients are cached per region, so this only builds them on first use
+    _, job_client = initialize_clients(region)
     if not job_client:
         return {"error": "Dataproc job client not initialized."}
 
-    # Optional: Add check if job_client's region matches the requested region,
-    # or re-initialize the client for the target region if your agent needs to be multi-region.
-    # For simplicity now, we assume the client matches the requested region.
-
-    job_uuid = str(uuid.uuid4())[:8] # Short UUID for readability in ID
+    job_uuid = secrets.token_hex(4) # Short random suffix for readability in ID
     # Standardize job type string to map to API fields (snake_case)
     job_type_cleaned = job_type.lower().replace('-', '_')
     job_id = f"{job_id_prefix}-{job_type_cleaned}-{job_uuid}"
 
-    # --- Construct the core Job payload ---
-    job_payload = {
-        "placement": {"cluster_name": cluster_name},
-        "reference": {"job_id": job_id},
-    }
-    if labels:
-        job_payload["labels"] = labels
-
     # --- Map job_type to the correct field name in the Job message ---
     # Example: 'pyspark' -> 'pyspark_job', 'spark_sql' -> 'spark_sql_job'
     job_type_field = f"{job_type_cleaned}_job"
 
-    # List of valid job type fields within the dataproc_v1.types.Job message
-    supported_job_fields = [
-        "hadoop_job", "spark_job", "pyspark_job", "hive_job", "pig_job",
-        "spark_r_job", "spark_sql_job", "presto_job", "trino_job" # Check API docs for exhaustive list
-    ]
-
-    if job_type_field not in supported_job_fields:
-        supported_types_str = ", ".join([f.replace('_job', '') for f in supported_job_fields])
+    if job_type_field not in _SUPPORTED_JOB_FIELDS:
         return {
             "error": f"Unsupported job_type: '{job_type}'. " \
                      f"Cleaned type '{job_type_field}' is invalid. " \
-                     f"Supported types derive from: {supported_types_str}."
+                     f"Supported types derive from: {_SUPPORTED_TYPES_STR}."
             }
 
     # --- Add the type-specific details to the payload ---
@@ -158,24 +355,32 @@ def submit_dataproc_job(
     if not isinstance(job_details, dict):
          return {"error": f"job_details must be a dictionary, got {type(job_details)}."}
 
-    # Example validation for pyspark (add others as needed)
-    if job_type_field == "pyspark_job" and "main_python_file_uri" not in job_details:
-        return {"error": "Missing required key 'main_python_file_uri' in job_details for pyspark job."}
-    elif job_type_field == "spark_job" and not ("main_class" in job_details or "main_jar_file_uri" in job_details):
-        return {"error": "Missing required key 'main_class' or 'main_jar_file_uri' in job_details for spark job."}
-    elif job_type_field in ["hive_job", "pig_job", "spark_sql_job"] and not ("query_file_uri" in job_details or ("query_list" in job_details and job_details["query_list"])):
-         return {"error": f"Missing required key 'query_file_uri' or non-empty 'query_list' in job_details for {job_type} job."}
-    # Add more validations based on Dataproc API requirements for each job type
+    unknown = job_details.keys() - _JOB_ALLOWED_FIELDS[job_type_field]
+    if unknown:
+        return {"error": f"Unknown key(s) {sorted(unknown)} in job_details for {job_type} job. " \
+                         f"Allowed keys: {sorted(_JOB_ALLOWED_FIELDS[job_type_field])}."}
 
-    job_payload[job_type_field] = job_details
-    # print(f"Submitting job payload: {job_payload}") # Debug print
+    for keys in _REQUIRED_FIELDS.get(job_type_field, ()):
+        if not any(job_details.get(k) for k in keys):
+            missing = " or ".join(f"'{k}'" for k in keys)
+            return {"error": f"Missing required key {missing} in job_details for {job_type} job."}
 
     try:
+        # Build the Job from the generated message classes rather than a nested
+        # dict the client would have to convert field by field.
+        job = dataproc.Job(
+            placement=dataproc.JobPlacement(cluster_name=cluster_name),
+            reference=dataproc.JobReference(job_id=job_id),
+            labels=labels or None,
+            **{job_type_field: _JOB_CTORS[job_type_field](**job_details)},
+        )
+        logger.debug("Submitting job: %s", job)
+
         # Construct the request object
         request = dataproc.SubmitJobRequest(
             project_id=project_id,
             region=region,
-            job=job_payload,
+            job=job,
             # request_id=job_id # Optional: Use for idempotency if needed
         )
 
@@ -188,139 +393,69 @@ def submit_dataproc_job(
             "job_id": submitted_job.reference.job_id,
             "status": submitted_job.status.state.name, # Initial status (e.g., PENDING, QUEUED)
             "cluster_name": submitted_job.placement.cluster_name,
-            "submitted_job_type": submitted_job.type_case.name # Actual type field set in the response
+            "submitted_job_type": submitted_job._pb.WhichOneof('type_job') # Actual type field set in the response
         }
 
     except InvalidArgument as e:
-        print(f"InvalidArgument Error submitting {job_type} job '{job_id}': {e}")
+        logger.error("InvalidArgument error submitting %s job '%s': %s", job_type, job_id, e)
         # This often means the structure of job_details was incorrect for the job_type
         return {"error": f"InvalidArgument submitting job: {e.message}. Review the structure of 'job_details' for '{job_type}'."}
     except GoogleAPICallError as e:
-        print(f"API Error submitting {job_type} job '{job_id}': {e}")
+        logger.error("API error submitting %s job '%s': %s", job_type, job_id, e)
         return {"error": f"API Error submitting job: {e.message}"}
     except Exception as e:
-        print(f"Unexpected error submitting {job_type} job '{job_id}': {e}")
+        logger.error("Unexpected error submitting %s job '%s': %s", job_type, job_id, e, exc_info=True)
         return {"error": f"Unexpected error submitting job: {str(e)}"}
 
-# --- Example Usage (Add to your __main__ block for testing) ---
-if __name__ == '__main__':
-    # Replace with your actual project/region/cluster details
-    TEST_PROJECT_ID = "your-gcp-project-id"
-    TEST_REGION = "us-central1" # Make sure client is initialized for this region
-    TEST_CLUSTER_NAME = "your-test-cluster-name"
-
-    print("\n--- Testing Generic Job Submission ---")
-
-    if not job_client:
-        print("Job client not initialized. Skipping submission tests.")
-    else:
-        # --- Example 1: PySpark Job ---
-        print("\n[INFO] Testing PySpark Job Submission...")
-        pyspark_details = {
-            "main_python_file_uri": f"gs://dataproc-examples/pyspark/hello-world/hello-world.py",
-            "args": ["arg1", "value1"],
-            # Add other fields like 'python_file_uris', 'jar_file_uris', 'properties' as needed
-        }
-        pyspark_result = submit_dataproc_job(
-            project_id=TEST_PROJECT_ID,
-            region=TEST_REGION,
-            cluster_name=TEST_CLUSTER_NAME,
-            job_type="pyspark", # or "PySpark", "pySpark"
-            job_details=pyspark_details,
-            labels={"source": "agent-test"}
-        )
-        print(f"PySpark Submission Result: {pyspark_result}")
-
-        # --- Example 2: Spark Job (JAR) ---
-        print("\n[INFO] Testing Spark Job (JAR) Submission...")
-        spark_jar_details = {
-            "main_jar_file_uri": "file:///usr/lib/spark/examples/jars/spark-examples.jar",
-            "main_class": "org.apache.spark.examples.SparkPi",
-            "args": ["1000"], # Argument for SparkPi (iterations)
-            # Add 'jar_file_uris', 'properties' etc. if needed
-        }
-        spark_jar_result = submit_dataproc_job(
-            project_id=TEST_PROJECT_ID,
-            region=TEST_REGION,
-            cluster_name=TEST_CLUSTER_NAME,
-            job_type="spark",
-            job_details=spark_jar_details
-        )
-        print(f"Spark JAR Submission Result: {spark_jar_result}")
-
-        # --- Example 3: Hive Job (Query List) ---
-        print("\n[INFO] Testing Hive Job (Query List) Submission...")
-        hive_query_details = {
-            "query_list": {
-                "queries": [
-                    "SHOW DATABASES;",
-                    "CREATE TABLE IF NOT EXISTS names_agent_test (id INT, name STRING);",
-                    "SELECT * FROM names_agent_test LIMIT 10;"
-                ]
-            },
-            # Add 'script_variables', 'jar_file_uris', 'properties' if needed
-        }
-        hive_result = submit_dataproc_job(
-            project_id=TEST_PROJECT_ID,
-            region=TEST_REGION,
-            cluster_name=TEST_CLUSTER_NAME,
-            job_type="hive",
-            job_details=hive_query_details
-        )
-        print(f"Hive Query Submission Result: {hive_result}")
-
-        # --- Example 4: Invalid Job Type ---
-        print("\n[INFO] Testing Invalid Job Type...")
-        invalid_type_result = submit_dataproc_job(
-            project_id=TEST_PROJECT_ID,
-            region=TEST_REGION,
-            cluster_name=TEST_CLUSTER_NAME,
-            job_type="invalid-job-type",
-            job_details={"foo": "bar"}
-        )
-        print(f"Invalid Type Submission Result: {invalid_type_result}")
-
-        # --- Example 5: Missing Required Field ---
-        print("\n[INFO] Testing Missing Required Field (PySpark)...")
-        missing_field_details = {
-            "args": ["arg1"] # Missing main_python_file_uri
-        }
-        missing_field_result = submit_dataproc_job(
-            project_id=TEST_PROJECT_ID,
-            region=TEST_REGION,
-            cluster_name=TEST_CLUSTER_NAME,
-            job_type="pyspark",
-            job_details=missing_field_details
-        )
-        print(f"Missing Field Submission Result: {missing_field_result}")
-
-
 def get_current_time(query: str) -> str:
     """Simulates getting the current time for a city.
 
     Args:
-        city: The name of the city to get the current time for.
+        query: Free-text query naming the city to get the current time for.
 
     Returns:
         A string with the current time information.
     """
-    if "sf" in query.lower() or "san francisco" in query.lower():
-        tz_identifier = "America/Los_Angeles"
-    else:
+    m = _TZ_RE.search(query)
+    if not m:
         return f"Sorry, I don't have timezone information for query: {query}."
-
-    tz = ZoneInfo(tz_identifier)
-    now = datetime.datetime.now(tz)
-    return f"The current time for query {query} is {now.strftime('%Y-%m-%d %H:%M:%S %Z%z')}"
+    tz = _QUERY_TZ[m.group(1).lower()]
+
+    now = _now(tz)
+    return f"The current time for query {query} is {now.isoformat(timespec='seconds')}"
+
+# Last (ETag, perfs) seen per user. Entries outlive the 60 second cache below
+# so an expired lookup can be revalidated with If-None-Match; a 304 reply has
+# no body to download or parse.
+_LICHESS_ETAGS = LRUCache(maxsize=1024)
+_LICHESS_ETAGS_LOCK = threading.Lock()
+
+@cached(TTLCache(maxsize=1024, ttl=60), lock=threading.Lock())
+def _fetch_lichess_perfs(username: str) -> dict:
+    """Fetches the 'perfs' block for a Lichess user, cached for 60 seconds."""
+    with _LICHESS_ETAGS_LOCK:
+        known = _LICHESS_ETAGS.get(username)
+    headers = {"If-None-Match": known[0]} if known else None
+    r = _LICHESS.get(f"https://lichess.org/api/user/{username}", headers=headers, timeout=5)
+    if r.status_code == 304 and known:
+        return known[1]
+    r.raise_for_status()
+    # orjson parses the raw bytes directly, skipping the str decode in r.json()
+    perfs = orjson.loads(r.content)['perfs']
+    etag = r.headers.get("ETag")
+    if etag:
+        with _LICHESS_ETAGS_LOCK:
+            _LICHESS_ETAGS[username] = (etag, perfs)
+    return perfs
 
 def get_lichess_rating(username: str):
-    """Fetches and prints Lichess user ratings using the public API.
+    """Fetches Lichess user ratings using the public API.
 
     This function accepts the Lichess username as an argument,
-    constructs the Lichess API URL for that user (http://en.lichess.org/api/user/),
-    fetches the user data, parses the JSON response, and prints the ratings
-    for various game performance categories (like blitz, rapid, classical, etc.)
-    to standard output.
+    constructs the Lichess API URL for that user (https://lichess.org/api/user/),
+    fetches the user data and returns the ratings for various game performance
+    categories (like blitz, rapid, classical, etc.). Use format_ratings to
+    render them as text.
 
     
     Args:
@@ -335,16 +470,27 @@ def get_lichess_rating(username: str):
               Can raise exceptions if the API request fails or parsing errors occur.
 
     """
-    import json
-    from urllib.request import urlopen
-
-    user_json = urlopen("http://en.lichess.org/api/user/" + username).read()
-    user_perfs = json.loads(user_json)['perfs']
-
-    print(f'username: {username}')
-    for k in user_perfs:
-        rating = user_perfs[k].get('rating')
-        if rating:
-            print(f'{k}: {rating}')
-    return user_perfs
+    return _fetch_lichess_perfs(username)
+
+def format_ratings(perfs: dict) -> str:
+    """Renders a 'perfs' dict as one '<category>: <rating>' line per rated category."""
+    return "\n".join(f"{k}: {v['rating']}" for k, v in perfs.items() if v.get('rating'))
+
+async def get_lichess_ratings(usernames: list[str]) -> dict:
+    """Fetches Lichess ratings for several users concurrently.
+
+    The lookups run on worker threads over the shared session, so N users cost
+    about one round trip instead of N, and share get_lichess_rating's cache.
+
+    Args:
+        usernames (list[str]): The Lichess usernames to fetch ratings for.
+
+    Returns:
+        dict: The 'perfs' dictionary of each username, keyed by username, or
+              {'error': ...} for a user whose lookup failed.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_fetch_lichess_perfs, u) for u in usernames), return_exceptions=True)
+    return {u: {"error": str(r)} if isinstance(r, Exception) else r
+            for u, r in zip(usernames, results, strict=True)}
 
@@ -0,0 +1,14 @@
+# Application Default Credentials, resolved once per process.
+#
+# google.auth.default() reads the environment, the ADC file and possibly the
+# metadata server on every call. The agent and every client builder share the
+# result of the first lookup; the Credentials object refreshes its own token.
+import functools
+
+import google.auth
+
+
+@functools.cache
+def default_credentials():
+    """Returns the (credentials, project_id) pair from Application Default Credentials."""
+    return google.auth.default()
@@ -0,0 +1,212 @@
+# Direct proto -> dict builders for Dataproc resources.
+#
+# MessageToDict discovers fields through descriptor reflection on every call.
+# cluster_to_dict reads the fields every cluster carries (status, node groups,
+# GCE and software config) directly and produces the same output as
+# MessageToDict(msg._pb, preserving_proto_field_name=True): zero values and
+# unset sub-messages are omitted, enums become names, Timestamps/Durations
+# become their JSON strings and int64 values become strings. Converters are
+# looked up by message type (_CONVERTERS) once per field, not per element;
+# rarely set sub-messages (security, autoscaling, GKE, ...) fall back to
+# MessageToDict individually.
+from google.cloud import dataproc_v1 as dataproc
+from google.protobuf.json_format import MessageToDict
+
+
+def _enum_names(enum_cls) -> dict:
+    return {e.value: e.name for e in enum_cls}
+
+_CLUSTER_STATE = _enum_names(dataproc.ClusterStatus.State)
+_CLUSTER_SUBSTATE = _enum_names(dataproc.ClusterStatus.Substate)
+_PREEMPTIBILITY = _enum_names(dataproc.InstanceGroupConfig.Preemptibility)
+_IPV6_ACCESS = _enum_names(dataproc.GceClusterConfig.PrivateIpv6GoogleAccess)
+_COMPONENT = _enum_names(dataproc.Component)
+
+
+def _raw(msg):
+    """Accepts a proto-plus wrapper or a raw protobuf message."""
+    return getattr(msg, "_pb", msg)
+
+def _to_dict(pb) -> dict:
+    return MessageToDict(pb, preserving_proto_field_name=True)
+
+def _scalars(pb, d: dict, *names: str) -> None:
+    """Copies string/bool/int32 fields that are set to a non-zero value."""
+    for n in names:
+        v = getattr(pb, n)
+        if v:
+            d[n] = v
+
+def _lists(pb, d: dict, *names: str) -> None:
+    for n in names:
+        v = getattr(pb, n)
+        if v:
+            d[n] = list(v)
+
+def _enum(pb, d: dict, name: str, names: dict) -> None:
+    v = getattr(pb, name)
+    if v:
+        d[name] = names.get(v, v)
+
+def _times(pb, d: dict, *names: str) -> None:
+    """Copies Timestamp/Duration fields that are present as JSON strings."""
+    for n in names:
+        if pb.HasField(n):
+            d[n] = getattr(pb, n).ToJsonString()
+
+def _converter(descriptor):
+    """Returns the dict builder for a message type, MessageToDict if it has none."""
+    return _CONVERTERS.get(descriptor.full_name, _to_dict)
+
+def _messages(pb, d: dict, *names: str) -> None:
+    """Converts rarely set sub-messages with their registered converter."""
+    for n in names:
+        if pb.HasField(n):
+            value = getattr(pb, n)
+            d[n] = _converter(value.DESCRIPTOR)(value)
+
+def _repeated(pb, d: dict, name: str, convert) -> None:
+    """Converts a repeated message field, resolving the converter once for all elements."""
+    values = getattr(pb, name)
+    if values:
+        d[name] = [convert(v) for v in values]
+
+
+def _status_to_dict(pb) -> dict:
+    d = {}
+    _enum(pb, d, "state", _CLUSTER_STATE)
+    _scalars(pb, d, "detail")
+    _times(pb, d, "state_start_time")
+    _enum(pb, d, "substate", _CLUSTER_SUBSTATE)
+    return d
+
+def _gce_config_to_dict(pb) -> dict:
+    d = {}
+    _scalars(pb, d, "zone_uri", "network_uri", "subnetwork_uri")
+    if pb.HasField("internal_ip_only"):
+        d["internal_ip_only"] = pb.internal_ip_only
+    _enum(pb, d, "private_ipv6_google_access", _IPV6_ACCESS)
+    _scalars(pb, d, "service_account")
+    _lists(pb, d, "service_account_scopes", "tags")
+    if pb.metadata:
+        d["metadata"] = dict(pb.metadata)
+    _messages(pb, d, "reservation_affinity", "node_group_affinity",
+              "shielded_instance_config", "confidential_instance_config")
+    return d
+
+def _instance_reference_to_dict(pb) -> dict:
+    d = {}
+    _scalars(pb, d, "instance_name", "instance_id", "public_key", "public_ecies_key")
+    return d
+
+def _accelerator_to_dict(pb) -> dict:
+    d = {}
+    _scalars(pb, d, "accelerator_type_uri", "accelerator_count")
+    return d
+
+def _instance_group_to_dict(pb) -> dict:
+    d = {}
+    _scalars(pb, d, "num_instances")
+    _lists(pb, d, "instance_names")
+    _repeated(pb, d, "instance_references", _instance_reference_to_dict)
+    _scalars(pb, d, "image_uri", "machine_type_uri")
+    if pb.HasField("disk_config"):
+        dc = pb.disk_config
+        disk = {}
+        _scalars(dc, disk, "boot_disk_type", "boot_disk_size_gb", "num_local_ssds", "local_ssd_interface")
+        # optional int64 fields are rendered as strings, as MessageToDict does
+        for n in ("boot_disk_provisioned_iops", "boot_disk_provisioned_throughput"):
+            if dc.HasField(n):
+                disk[n] = str(getattr(dc, n))
+        d["disk_config"] = disk
+    _scalars(pb, d, "is_preemptible")
+    _enum(pb, d, "preemptibility", _PREEMPTIBILITY)
+    if pb.HasField("managed_group_config"):
+        managed = {}
+        _scalars(pb.managed_group_config, managed, "instance_template_name",
+                 "instance_group_manager_name", "instance_group_manager_uri")
+        d["managed_group_config"] = managed
+    _repeated(pb, d, "accelerators", _accelerator_to_dict)
+    _scalars(pb, d, "min_cpu_platform", "min_num_instances")
+    _messages(pb, d, "instance_flexibility_policy", "startup_config")
+    return d
+
+def _software_config_to_dict(pb) -> dict:
+    d = {}
+    _scalars(pb, d, "image_version")
+    if pb.properties:
+        d["properties"] = dict(pb.properties)
+    if pb.optional_components:
+        d["optional_components"] = [_COMPONENT.get(c, c) for c in pb.optional_components]
+    return d
+
+def _endpoint_config_to_dict(pb) -> dict:
+    d = {}
+    if pb.http_ports:
+        d["http_ports"] = dict(pb.http_ports)
+    _scalars(pb, d, "enable_http_port_access")
+    return d
+
+def _lifecycle_config_to_dict(pb) -> dict:
+    d = {}
+    _times(pb, d, "idle_delete_ttl", "auto_delete_time", "auto_delete_ttl", "idle_start_time")
+    return d
+
+def _init_action_to_dict(pb) -> dict:
+    d = {}
+    _scalars(pb, d, "executable_file")
+    _times(pb, d, "execution_timeout")
+    return d
+
+def _cluster_config_to_dict(pb) -> dict:
+    d = {}
+    # ListFields returns only the set fields, in field-number order.
+    # config_bucket/temp_bucket are its only non-message fields.
+    for field, value in pb.ListFields():
+        if field.message_type is None:
+            d[field.name] = value
+            continue
+        convert = _converter(field.message_type)
+        d[field.name] = [convert(v) for v in value] if field.is_repeated else convert(value)
+    return d
+
+# Direct builders by message full name; types not listed go through MessageToDict.
+_CONVERTERS = {
+    cls.pb().DESCRIPTOR.full_name: convert for cls, convert in (
+        (dataproc.GceClusterConfig, _gce_config_to_dict),
+        (dataproc.InstanceGroupConfig, _instance_group_to_dict),
+        (dataproc.InstanceReference, _instance_reference_to_dict),
+        (dataproc.AcceleratorConfig, _accelerator_to_dict),
+        (dataproc.SoftwareConfig, _software_config_to_dict),
+        (dataproc.NodeInitializationAction, _init_action_to_dict),
+        (dataproc.LifecycleConfig, _lifecycle_config_to_dict),
+        (dataproc.EndpointConfig, _endpoint_config_to_dict),
+        (dataproc.ClusterStatus, _status_to_dict),
+    )
+}
+
+
+def cluster_to_dict(cluster) -> dict:
+    """Converts a Cluster message to a plain dict."""
+    pb = _raw(cluster)
+    d = {}
+    _scalars(pb, d, "project_id", "cluster_name")
+    if pb.HasField("config"):
+        d["config"] = _cluster_config_to_dict(pb.config)
+    _messages(pb, d, "virtual_cluster_config")
+    if pb.labels:
+        d["labels"] = dict(pb.labels)
+    if pb.HasField("status"):
+        d["status"] = _status_to_dict(pb.status)
+    _repeated(pb, d, "status_history", _status_to_dict)
+    _scalars(pb, d, "cluster_uuid")
+    if pb.HasField("metrics"):
+        m = pb.metrics
+        metrics = {}
+        # map<string, int64>: values are rendered as strings
+        if m.hdfs_metrics:
+            metrics["hdfs_metrics"] = {k: str(v) for k, v in m.hdfs_metrics.items()}
+        if m.yarn_metrics:
+            metrics["yarn_metrics"] = {k: str(v) for k, v in m.yarn_metrics.items()}
+        d["metrics"] = metrics
+    return d
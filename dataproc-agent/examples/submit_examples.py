@@ -0,0 +1,114 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Example submit_dataproc_job calls against a live cluster.
+
+These submit real jobs, so fill in the project/region/cluster below and run
+from the project root with `uv run python examples/submit_examples.py`.
+"""
+
+from app.utils.common_tools import submit_dataproc_job
+
+# Replace with your actual project/region/cluster details
+TEST_PROJECT_ID = "your-gcp-project-id"
+TEST_REGION = "us-central1"
+TEST_CLUSTER_NAME = "your-test-cluster-name"
+
+
+def main() -> None:
+    print("\n--- Testing Generic Job Submission ---")
+
+    # --- Example 1: PySpark Job ---
+    print("\n[INFO] Testing PySpark Job Submission...")
+    pyspark_details = {
+        "main_python_file_uri": "gs://dataproc-examples/pyspark/hello-world/hello-world.py",
+        "args": ["arg1", "value1"],
+        # Add other fields like 'python_file_uris', 'jar_file_uris', 'properties' as needed
+    }
+    pyspark_result = submit_dataproc_job(
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        cluster_name=TEST_CLUSTER_NAME,
+        job_type="pyspark", # or "PySpark", "pySpark"
+        job_details=pyspark_details,
+        labels={"source": "agent-test"}
+    )
+    print(f"PySpark Submission Result: {pyspark_result}")
+
+    # --- Example 2: Spark Job (JAR) ---
+    print("\n[INFO] Testing Spark Job (JAR) Submission...")
+    spark_jar_details = {
+        "main_jar_file_uri": "file:///usr/lib/spark/examples/jars/spark-examples.jar",
+        "main_class": "org.apache.spark.examples.SparkPi",
+        "args": ["1000"], # Argument for SparkPi (iterations)
+        # Add 'jar_file_uris', 'properties' etc. if needed
+    }
+    spark_jar_result = submit_dataproc_job(
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        cluster_name=TEST_CLUSTER_NAME,
+        job_type="spark",
+        job_details=spark_jar_details
+    )
+    print(f"Spark JAR Submission Result: {spark_jar_result}")
+
+    # --- Example 3: Hive Job (Query List) ---
+    print("\n[INFO] Testing Hive Job (Query List) Submission...")
+    hive_query_details = {
+        "query_list": {
+            "queries": [
+                "SHOW DATABASES;",
+                "CREATE TABLE IF NOT EXISTS names_agent_test (id INT, name STRING);",
+                "SELECT * FROM names_agent_test LIMIT 10;"
+            ]
+        },
+        # Add 'script_variables', 'jar_file_uris', 'properties' if needed
+    }
+    hive_result = submit_dataproc_job(
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        cluster_name=TEST_CLUSTER_NAME,
+        job_type="hive",
+        job_details=hive_query_details
+    )
+    print(f"Hive Query Submission Result: {hive_result}")
+
+    # --- Example 4: Invalid Job Type ---
+    print("\n[INFO] Testing Invalid Job Type...")
+    invalid_type_result = submit_dataproc_job(
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        cluster_name=TEST_CLUSTER_NAME,
+        job_type="invalid-job-type",
+        job_details={"foo": "bar"}
+    )
+    print(f"Invalid Type Submission Result: {invalid_type_result}")
+
+    # --- Example 5: Missing Required Field ---
+    print("\n[INFO] Testing Missing Required Field (PySpark)...")
+    missing_field_details = {
+        "args": ["arg1"] # Missing main_python_file_uri
+    }
+    missing_field_result = submit_dataproc_job(
+        project_id=TEST_PROJECT_ID,
+        region=TEST_REGION,
+        cluster_name=TEST_CLUSTER_NAME,
+        job_type="pyspark",
+        job_details=missing_field_details
+    )
+    print(f"Missing Field Submission Result: {missing_field_result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Makes the agent's utils modules importable as `agent_utils.<module>`.
+
+The agent package directory is not a valid identifier, and the utils modules
+use relative imports, so they are registered under a synthetic package.
+"""
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+_UTILS = Path(__file__).resolve().parents[2] / "dataproc-agent" / "utils"
+
+if "agent_utils" not in sys.modules:
+    _spec = importlib.machinery.ModuleSpec("agent_utils", None, is_package=True)
+    _spec.submodule_search_locations = [str(_UTILS)]
+    sys.modules["agent_utils"] = importlib.util.module_from_spec(_spec)
@@ -0,0 +1,58 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks how describe_dataproc_operation reports operations and its own failures.
+"""
+
+from unittest import mock
+
+import pytest
+from agent_utils import cluster_controller_tools as tools
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+
+_OP = "projects/p/regions/us-central1/operations/op"
+
+
+@pytest.fixture
+def cluster_client(monkeypatch):
+    client = mock.Mock()
+    monkeypatch.setattr(tools, "initialize_clients", lambda region: (client, None))
+    return client
+
+
+def test_failed_operation_is_reported_as_operation_error(cluster_client) -> None:
+    cluster_client.get_operation.return_value = operations_pb2.Operation(
+        name=_OP, done=True, error=status_pb2.Status(code=9, message="cluster busy"))
+
+    result = tools.describe_dataproc_operation(_OP)
+
+    assert result == {
+        "operation_name": _OP,
+        "done": True,
+        "operation_error": {"code": 9, "message": "cluster busy"},
+    }
+
+
+def test_describe_failure_is_reported_as_error(cluster_client) -> None:
+    cluster_client.get_operation.side_effect = RuntimeError("boom")
+
+    result = tools.describe_dataproc_operation(_OP)
+
+    assert result == {"error": "Unexpected error describing operation: boom"}
+
+
+def test_invalid_name_is_rejected(cluster_client) -> None:
+    assert "error" in tools.describe_dataproc_operation("operations/op")
+    cluster_client.get_operation.assert_not_called()
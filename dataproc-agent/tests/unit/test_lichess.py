@@ -0,0 +1,98 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks the Lichess lookup's caching and ETag revalidation.
+"""
+
+from unittest import mock
+
+import pytest
+from agent_utils import common_tools as tools
+from cachetools import LRUCache
+
+_BODY = b'{"perfs": {"blitz": {"rating": 1500}, "puzzle": {"games": 0}}}'
+
+
+class _FakeSession:
+    """Serves one user document with an ETag, answering 304 when it matches."""
+
+    def __init__(self, etag: str | None = '"v1"') -> None:
+        self.etag = etag
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        response = mock.Mock()
+        if self.etag and headers and headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            return response
+        response.status_code = 200
+        response.content = _BODY
+        response.headers = {"ETag": self.etag} if self.etag else {}
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.setattr(tools, "_LICHESS", fake)
+    monkeypatch.setattr(tools, "_LICHESS_ETAGS", LRUCache(maxsize=16))
+    tools._fetch_lichess_perfs.cache_clear()
+    yield fake
+    tools._fetch_lichess_perfs.cache_clear()
+
+
+def test_repeat_lookups_within_the_ttl_are_served_from_cache(session) -> None:
+    first = tools.get_lichess_rating("bob")
+    second = tools.get_lichess_rating("bob")
+
+    assert first == second == {"blitz": {"rating": 1500}, "puzzle": {"games": 0}}
+    assert session.requests == [None]
+
+
+def test_expired_lookup_revalidates_with_if_none_match(session) -> None:
+    first = tools.get_lichess_rating("bob")
+    tools._fetch_lichess_perfs.cache_clear()  # As if the 60 second TTL had passed
+
+    again = tools.get_lichess_rating("bob")
+
+    assert again == first
+    assert session.requests == [None, {"If-None-Match": '"v1"'}]
+
+
+def test_changed_etag_refetches_the_body(session) -> None:
+    tools.get_lichess_rating("bob")
+    tools._fetch_lichess_perfs.cache_clear()
+    session.etag = '"v2"'
+
+    tools.get_lichess_rating("bob")
+
+    assert session.requests == [None, {"If-None-Match": '"v1"'}]
+    assert tools._LICHESS_ETAGS["bob"][0] == '"v2"'
+
+
+def test_responses_without_etag_are_not_revalidated(session) -> None:
+    session.etag = None
+    tools.get_lichess_rating("bob")
+    tools._fetch_lichess_perfs.cache_clear()
+
+    tools.get_lichess_rating("bob")
+
+    assert session.requests == [None, None]
+
+
+def test_format_ratings_lists_rated_categories() -> None:
+    perfs = {"blitz": {"rating": 1500}, "puzzle": {"games": 0}, "rapid": {"rating": 1600}}
+
+    assert tools.format_ratings(perfs) == "blitz: 1500\nrapid: 1600"
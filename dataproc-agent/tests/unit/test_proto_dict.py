@@ -0,0 +1,80 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks that the hand-written Dataproc dict builders match MessageToDict.
+"""
+
+import importlib.util
+from pathlib import Path
+
+from google.cloud import dataproc_v1 as dataproc
+from google.protobuf.json_format import MessageToDict
+
+# The agent package directory is not a valid identifier, so load the module by path.
+_PATH = Path(__file__).resolve().parents[2] / "dataproc-agent" / "utils" / "proto_dict.py"
+_spec = importlib.util.spec_from_file_location("proto_dict", _PATH)
+proto_dict = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(proto_dict)
+
+_TS = {"seconds": 1700000000, "nanos": 5000}
+
+
+def _expected(msg: object) -> dict:
+    return MessageToDict(msg._pb, preserving_proto_field_name=True)
+
+
+def test_cluster_to_dict_matches_message_to_dict() -> None:
+    cluster = dataproc.Cluster(
+        project_id="p",
+        cluster_name="c",
+        cluster_uuid="u",
+        labels={"env": "dev"},
+        config={
+            "config_bucket": "b",
+            "gce_cluster_config": {
+                "zone_uri": "us-central1-a",
+                "internal_ip_only": False,
+                "service_account_scopes": ["s"],
+                "metadata": {"k": "v"},
+                "shielded_instance_config": {"enable_secure_boot": True},
+            },
+            "master_config": {
+                "num_instances": 1,
+                "instance_names": ["c-m"],
+                "instance_references": [{"instance_name": "c-m", "instance_id": "1"}],
+                "machine_type_uri": "n1-standard-4",
+                "disk_config": {"boot_disk_size_gb": 500, "boot_disk_provisioned_iops": 3000},
+                "preemptibility": "NON_PREEMPTIBLE",
+                "accelerators": [{"accelerator_type_uri": "t4", "accelerator_count": 1}],
+            },
+            "worker_config": {"num_instances": 2, "managed_group_config": {"instance_template_name": "t"}},
+            "software_config": {
+                "image_version": "2.2",
+                "properties": {"spark:spark.executor.cores": "4"},
+                "optional_components": ["JUPYTER"],
+            },
+            "initialization_actions": [{"executable_file": "gs://b/init.sh", "execution_timeout": {"seconds": 600}}],
+            "lifecycle_config": {"idle_delete_ttl": {"seconds": 1800}, "idle_start_time": _TS},
+            "endpoint_config": {"http_ports": {"Web UI": "https://x"}, "enable_http_port_access": True},
+            "autoscaling_config": {"policy_uri": "projects/p/regions/r/autoscalingPolicies/a"},
+        },
+        status={"state": "RUNNING", "state_start_time": _TS, "substate": "STALE_STATUS"},
+        status_history=[{"state": "CREATING", "state_start_time": _TS}],
+        metrics={"hdfs_metrics": {"dfs-capacity": 10}, "yarn_metrics": {"apps": 2}},
+    )
+    assert proto_dict.cluster_to_dict(cluster) == _expected(cluster)
+
+
+def test_empty_cluster_converts_to_empty_dict() -> None:
+    assert proto_dict.cluster_to_dict(dataproc.Cluster()) == {}
@@ -0,0 +1,77 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Checks submit_dataproc_job's client-side validation and the Job it sends.
+"""
+
+from unittest import mock
+
+import pytest
+from agent_utils import common_tools as tools
+
+
+@pytest.fixture
+def job_client(monkeypatch):
+    """A job client that echoes the submitted Job back as the response."""
+    client = mock.Mock()
+    client.submit_job.side_effect = lambda request: request.job
+    monkeypatch.setattr(tools, "initialize_clients", lambda region: (None, client))
+    return client
+
+
+def _submit(job_type: str, job_details: dict, **kwargs) -> dict:
+    return tools.submit_dataproc_job("p", "us-central1", "c", job_type, job_details, **kwargs)
+
+
+def test_unsupported_job_type_is_rejected(job_client) -> None:
+    result = _submit("flink", {})
+
+    assert "Unsupported job_type: 'flink'" in result["error"]
+    assert "pyspark, hive" in result["error"]
+    job_client.submit_job.assert_not_called()
+
+
+@pytest.mark.parametrize("job_type, job_details, missing", [
+    ("pyspark", {"args": ["1"]}, "'main_python_file_uri'"),
+    ("spark", {"args": ["1"]}, "'main_class' or 'main_jar_file_uri'"),
+    ("hive", {"query_list": {}}, "'query_file_uri' or 'query_list'"),
+    ("spark-sql", {"query_file_uri": ""}, "'query_file_uri' or 'query_list'"),
+])
+def test_missing_required_keys_are_rejected(job_client, job_type, job_details, missing) -> None:
+    result = _submit(job_type, job_details)
+
+    assert result["error"].startswith(f"Missing required key {missing} in job_details")
+    job_client.submit_job.assert_not_called()
+
+
+def test_unknown_keys_are_rejected_before_the_rpc(job_client) -> None:
+    result = _submit("pyspark", {"main_pythonn_file_uri": "gs://b/main.py"})
+
+    assert "Unknown key(s) ['main_pythonn_file_uri']" in result["error"]
+    assert "'main_python_file_uri'" in result["error"]
+    job_client.submit_job.assert_not_called()
+
+
+def test_valid_job_is_submitted_as_messages(job_client) -> None:
+    result = _submit("PySpark", {"main_python_file_uri": "gs://b/main.py", "args": ["1"]},
+                     labels={"source": "test"})
+
+    job = job_client.submit_job.call_args.kwargs["request"].job
+    assert job.pyspark_job.main_python_file_uri == "gs://b/main.py"
+    assert list(job.pyspark_job.args) == ["1"]
+    assert job.placement.cluster_name == "c"
+    assert dict(job.labels) == {"source": "test"}
+    assert job.reference.job_id.startswith("agent-job-pyspark-")
+    assert result["submitted_job_type"] == "pyspark_job"
+    assert result["job_id"] == job.reference.job_id